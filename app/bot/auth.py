@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import sqlite3
+import time
 from dataclasses import dataclass
 
 from app.models.volunteer import get_volunteer_by_phone
 
+# Seconds a phone -> context lookup stays cached. Mutations that change who
+# is approved call invalidate_volunteer_cache(), so the TTL only bounds
+# staleness from writes made outside the app.
+CONTEXT_CACHE_TTL = 30.0
+# Upper bound on cached phones, so misses for unknown numbers can't grow the
+# cache without limit.
+CONTEXT_CACHE_MAX = 4096
+
 
 @dataclass
 class VolunteerContext:
@@ -13,18 +22,78 @@ class VolunteerContext:
     is_coordinator: bool
 
 
+_context_cache: dict[str, tuple[float, VolunteerContext | None]] = {}
+# (expires_at, coordinator id or None); shares the context cache's TTL.
+_coordinator_cache: tuple[float, int | None] | None = None
+
+
 def get_volunteer_context(
     db: sqlite3.Connection, phone: str
 ) -> VolunteerContext | None:
     """Look up a volunteer by phone and return their context.
 
     Returns None if the phone number is not registered or not approved.
+    Results (including misses) are cached for CONTEXT_CACHE_TTL seconds.
     """
+    now = time.monotonic()
+    cached = _context_cache.get(phone)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     volunteer = get_volunteer_by_phone(db, phone)
     if volunteer is None or volunteer.status != "approved":
-        return None
-    return VolunteerContext(
-        volunteer_id=volunteer.id,
-        phone=volunteer.phone,
-        is_coordinator=volunteer.is_coordinator,
-    )
+        context = None
+    else:
+        context = VolunteerContext(
+            volunteer_id=volunteer.id,
+            phone=volunteer.phone,
+            is_coordinator=volunteer.is_coordinator,
+        )
+    if len(_context_cache) >= CONTEXT_CACHE_MAX:
+        _prune_context_cache(now)
+    _context_cache[phone] = (now + CONTEXT_CACHE_TTL, context)
+    return context
+
+
+def _prune_context_cache(now: float) -> None:
+    """Drop expired entries, or everything if the cache is still full.
+
+    Worker threads insert and invalidate concurrently, so this iterates a
+    snapshot and tolerates keys that are already gone.
+    """
+    for key, (expires_at, _) in list(_context_cache.items()):
+        if expires_at <= now:
+            _context_cache.pop(key, None)
+    if len(_context_cache) >= CONTEXT_CACHE_MAX:
+        _context_cache.clear()
+
+
+def get_coordinator_id(db: sqlite3.Connection) -> int | None:
+    """Return the id of an active coordinator, or None if there is none.
+
+    Cached for CONTEXT_CACHE_TTL seconds, like volunteer contexts.
+    """
+    global _coordinator_cache
+    now = time.monotonic()
+    cached = _coordinator_cache
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    row = db.execute(
+        "SELECT id FROM volunteers WHERE is_coordinator = 1 AND removed_at IS NULL LIMIT 1"
+    ).fetchone()
+    coordinator_id = None if row is None else row["id"]
+    _coordinator_cache = (now + CONTEXT_CACHE_TTL, coordinator_id)
+    return coordinator_id
+
+
+def invalidate_volunteer_cache() -> None:
+    """Drop all cached contexts and the cached coordinator id.
+
+    Called after registering, approving, rejecting or removing a volunteer.
+    The whole cache is cleared because the same volunteer can be cached
+    under several phone spellings.
+    """
+    global _coordinator_cache
+    _context_cache.clear()
+    _coordinator_cache = None
@@ -0,0 +1,13 @@
+"""Helpers shared by the bot command handlers."""
+
+from __future__ import annotations
+
+from app.models.shift import month_bounds
+
+
+def month_range(month: str) -> tuple[str, str]:
+    """Return ``(first_day, first_day_of_next_month)`` for a "YYYY-MM" month.
+
+    Thin string wrapper over ``month_bounds`` for handler args.
+    """
+    return month_bounds(int(month[:4]), int(month[5:7]))
@@ -5,11 +5,53 @@ All handlers assume context.is_coordinator == True (caller checks this).
 
 from __future__ import annotations
 
+import io
 import sqlite3
 from datetime import date
 
 from app.bot.auth import VolunteerContext
-from app.rules.queries import get_total_count
+from app.bot.handlers.common import month_range
+
+
+_SQL_STATUS_FOR_DATE = """
+    SELECT sh.id, sh.shift_type, sh.capacity,
+           (SELECT COUNT(*) FROM signups s
+            WHERE s.shift_id = sh.id AND s.dropped_at IS NULL) AS signup_count
+    FROM shifts sh
+    WHERE sh.date = ?
+    ORDER BY sh.shift_type
+"""
+
+_SQL_GAPS_FOR_MONTH = """
+    SELECT * FROM (
+        SELECT sh.id, sh.date, sh.shift_type, sh.capacity,
+               (SELECT COUNT(*) FROM signups s
+                WHERE s.shift_id = sh.id AND s.dropped_at IS NULL) AS signup_count
+        FROM shifts sh
+        WHERE sh.date >= ? AND sh.date < ?
+    )
+    WHERE signup_count < capacity
+    ORDER BY date, shift_type
+"""
+
+_SQL_FIND_SHIFT = "SELECT id FROM shifts WHERE date = ? AND shift_type = ?"
+
+_SQL_AVAILABLE_SUBS = """
+    SELECT v.id, v.name, v.phone, COALESCE(c.cnt, 0) AS total
+    FROM volunteers v
+    LEFT JOIN signups sx
+        ON sx.volunteer_id = v.id AND sx.shift_id = ? AND sx.dropped_at IS NULL
+    LEFT JOIN (
+        SELECT s.volunteer_id, COUNT(*) AS cnt
+        FROM signups s
+        JOIN shifts sh ON s.shift_id = sh.id
+        WHERE s.dropped_at IS NULL AND sh.date >= ? AND sh.date < ?
+        GROUP BY s.volunteer_id
+    ) c ON c.volunteer_id = v.id
+    WHERE sx.id IS NULL
+      AND COALESCE(c.cnt, 0) < 8
+    ORDER BY v.name
+"""
 
 
 def handle_status(db: sqlite3.Connection, context: VolunteerContext, args: dict) -> str:
@@ -20,18 +62,7 @@ def handle_status(db: sqlite3.Connection, context: VolunteerContext, args: dict)
     target_date: date = args["date"]
     date_str = target_date.isoformat()
 
-    rows = db.execute(
-        """
-        SELECT sh.id, sh.shift_type, sh.capacity,
-               COUNT(s.id) AS signup_count
-        FROM shifts sh
-        LEFT JOIN signups s ON s.shift_id = sh.id AND s.dropped_at IS NULL
-        WHERE sh.date = ?
-        GROUP BY sh.id
-        ORDER BY sh.shift_type
-        """,
-        (date_str,),
-    ).fetchall()
+    rows = db.execute(_SQL_STATUS_FOR_DATE, (date_str,)).fetchall()
 
     if not rows:
         return f"No shifts found for {date_str}"
@@ -53,31 +84,23 @@ def handle_gaps(db: sqlite3.Connection, context: VolunteerContext, args: dict) -
     args: {"month": str}  # "YYYY-MM"
     """
     month: str = args["month"]
-    prefix = f"{month}-%"
-
-    rows = db.execute(
-        """
-        SELECT sh.id, sh.date, sh.shift_type, sh.capacity,
-               COUNT(s.id) AS signup_count
-        FROM shifts sh
-        LEFT JOIN signups s ON s.shift_id = sh.id AND s.dropped_at IS NULL
-        WHERE sh.date LIKE ?
-        GROUP BY sh.id
-        HAVING COUNT(s.id) < sh.capacity
-        ORDER BY sh.date, sh.shift_type
-        """,
-        (prefix,),
-    ).fetchall()
+    rows = db.execute(_SQL_GAPS_FOR_MONTH, month_range(month)).fetchall()
 
     if not rows:
         return f"All shifts filled for {month}!"
 
-    lines = [f"*Gaps for {month}*"]
+    buf = io.StringIO()
+    buf.write(f"*Gaps for {month}*")
     for row in rows:
-        gap_size = row["capacity"] - row["signup_count"]
-        lines.append(f"- {row['date']} {row['shift_type']}: {gap_size} needed")
+        buf.write("\n- ")
+        buf.write(row["date"])
+        buf.write(" ")
+        buf.write(row["shift_type"])
+        buf.write(": ")
+        buf.write(str(row["capacity"] - row["signup_count"]))
+        buf.write(" needed")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def handle_find_sub(db: sqlite3.Connection, context: VolunteerContext, args: dict) -> str:
@@ -90,44 +113,30 @@ def handle_find_sub(db: sqlite3.Connection, context: VolunteerContext, args: dic
     date_str = target_date.isoformat()
 
     # Find the shift
-    shift_row = db.execute(
-        "SELECT id FROM shifts WHERE date = ? AND shift_type = ?",
-        (date_str, shift_type),
-    ).fetchone()
+    shift_row = db.execute(_SQL_FIND_SHIFT, (date_str, shift_type)).fetchone()
 
     if shift_row is None:
         return f"No {shift_type} shift found for {date_str}"
 
     shift_id = shift_row["id"]
 
-    # Get all volunteers not already signed up for this shift
-    volunteers = db.execute(
-        """
-        SELECT v.id, v.name, v.phone
-        FROM volunteers v
-        WHERE v.id NOT IN (
-            SELECT s.volunteer_id FROM signups s
-            WHERE s.shift_id = ? AND s.dropped_at IS NULL
-        )
-        ORDER BY v.name
-        """,
-        (shift_id,),
-    ).fetchall()
-
-    year = target_date.year
-    month = target_date.month
-
-    available = []
-    for vol in volunteers:
-        total = get_total_count(db, vol["id"], year, month)
-        if total < 8:
-            available.append((vol["name"], vol["phone"]))
+    # Volunteers not already on this shift, with their monthly totals, in
+    # a single round-trip (one aggregate instead of a COUNT per volunteer).
+    start, end = month_range(date_str)
+    available = db.execute(_SQL_AVAILABLE_SUBS, (shift_id, start, end)).fetchall()
 
     if not available:
         return "No available volunteers found"
 
-    lines = [f"*Available subs for {date_str} {shift_type}*"]
-    for name, phone in available:
-        lines.append(f"- {name} ({phone})")
-
-    return "\n".join(lines)
+    # The list can run to every volunteer, so write into one buffer rather
+    # than formatting a temporary string per row.
+    buf = io.StringIO()
+    buf.write(f"*Available subs for {date_str} {shift_type}*")
+    for vol in available:
+        buf.write("\n- ")
+        buf.write(vol["name"])
+        buf.write(" (")
+        buf.write(vol["phone"])
+        buf.write(")")
+
+    return buf.getvalue()
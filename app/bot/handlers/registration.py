@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import io
 import sqlite3
 
-from app.bot.auth import VolunteerContext
+from app.bot.auth import VolunteerContext, invalidate_volunteer_cache
 from app.models.volunteer import (
     VolunteerCreate,
     create_volunteer,
@@ -13,7 +14,8 @@ from app.models.volunteer import (
     approve_volunteer,
     reject_volunteer,
 )
-from app.notifications.sender import send_message
+from app.db import database_path, immediate_transaction
+from app.notifications.sender import send_message, send_message_in_background
 
 
 def handle_register(
@@ -54,15 +56,17 @@ def handle_register(
 
     # Create new pending volunteer
     try:
-        vol = create_volunteer(
-            db,
-            VolunteerCreate(
-                phone=phone,
-                name=name,
-                is_coordinator=False,
-                status="pending",
-            ),
-        )
+        with immediate_transaction(db):
+            vol = create_volunteer(
+                db,
+                VolunteerCreate(
+                    phone=phone,
+                    name=name,
+                    is_coordinator=False,
+                    status="pending",
+                ),
+            )
+        invalidate_volunteer_cache()
         return f"Thank you {name}! Your registration is pending approval. You'll be notified when approved."
     except Exception as e:
         return f"Registration failed. Please try again later. Error: {str(e)}"
@@ -94,11 +98,16 @@ def handle_pending(
     if not pending:
         return "No pending registrations."
 
-    lines = ["*Pending Registrations*"]
+    buf = io.StringIO()
+    buf.write("*Pending Registrations*")
     for vol in pending:
-        lines.append(f"- {vol.name} ({vol.phone})")
+        buf.write("\n- ")
+        buf.write(vol.name)
+        buf.write(" (")
+        buf.write(vol.phone)
+        buf.write(")")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def handle_approve(
@@ -127,29 +136,37 @@ def handle_approve(
     if not phone:
         return "Please provide the phone number. Send: approve <phone>"
 
-    # Check if volunteer exists
-    vol = get_volunteer_by_phone(db, phone)
-    if vol is None:
-        return f"No volunteer found with phone {phone}"
-
-    # Check if already approved
-    if vol.status == "approved":
-        return f"{vol.name} is already approved."
-
-    # Check if rejected
-    if vol.status == "rejected":
-        return f"{vol.name} has been rejected and cannot be approved."
-
-    # Approve the volunteer
+    # Approve in a single UPDATE ... RETURNING; only a miss needs a lookup
+    # to explain why.
     try:
-        approved = approve_volunteer(db, phone, context.volunteer_id)
-        if approved is None:
-            return f"Could not approve {phone}. Please try again."
+        with immediate_transaction(db):
+            approved = approve_volunteer(
+                db, phone, context.volunteer_id, only_status="pending"
+            )
+            if approved is None:
+                vol = get_volunteer_by_phone(db, phone)
+                if vol is None:
+                    return f"No volunteer found with phone {phone}"
+                if vol.status == "approved":
+                    return f"{vol.name} is already approved."
+                if vol.status == "rejected":
+                    return f"{vol.name} has been rejected and cannot be approved."
+                return f"Could not approve {phone}. Please try again."
+        invalidate_volunteer_cache()
 
         welcome_text = (
             f"Welcome {approved.name}! You're approved to volunteer. "
             "Reply 'help' to see available commands."
         )
+        # Don't make the coordinator wait on the WA bridge. In-memory
+        # databases can't be opened from another thread, so send inline there.
+        db_path = database_path(db)
+        if db_path is not None:
+            send_message_in_background(
+                db_path, approved.id, welcome_text, notification_type="welcome"
+            )
+            return f"Approved {approved.name} ({phone}). Welcome message queued."
+
         result = send_message(
             db,
             approved.id,
@@ -192,24 +209,21 @@ def handle_reject(
     if not phone:
         return "Please provide the phone number. Send: reject <phone>"
 
-    # Check if volunteer exists
-    vol = get_volunteer_by_phone(db, phone)
-    if vol is None:
-        return f"No volunteer found with phone {phone}"
-
-    # Check if already rejected
-    if vol.status == "rejected":
-        return f"{vol.name} is already rejected."
-
-    # Check if already approved
-    if vol.status == "approved":
-        return f"{vol.name} is already approved and cannot be rejected."
-
-    # Reject the volunteer
+    # Reject in a single UPDATE ... RETURNING; only a miss needs a lookup
+    # to explain why.
     try:
-        rejected = reject_volunteer(db, phone)
-        if rejected is None:
-            return f"Could not reject {phone}. Please try again."
+        with immediate_transaction(db):
+            rejected = reject_volunteer(db, phone, only_status="pending")
+            if rejected is None:
+                vol = get_volunteer_by_phone(db, phone)
+                if vol is None:
+                    return f"No volunteer found with phone {phone}"
+                if vol.status == "rejected":
+                    return f"{vol.name} is already rejected."
+                if vol.status == "approved":
+                    return f"{vol.name} is already approved and cannot be rejected."
+                return f"Could not reject {phone}. Please try again."
+        invalidate_volunteer_cache()
 
         return f"Rejected {rejected.name} ({phone})."
     except Exception as e:
@@ -6,9 +6,19 @@ import sqlite3
 from datetime import date
 
 from app.bot.auth import VolunteerContext
+from app.db import immediate_transaction
 from app.models.signup import drop_signup
 
 
+_SQL_SHIFT_WITH_ACTIVE_SIGNUP = """
+    SELECT sh.id AS shift_id, s.id AS signup_id
+    FROM shifts sh
+    LEFT JOIN signups s
+        ON s.shift_id = sh.id AND s.volunteer_id = ? AND s.dropped_at IS NULL
+    WHERE sh.date = ? AND sh.shift_type = ?
+"""
+
+
 def handle_drop(
     db: sqlite3.Connection, context: VolunteerContext, args: dict
 ) -> str:
@@ -25,24 +35,17 @@ def handle_drop(
     shift_date: date = args["date"]
     shift_type: str = args["type"]
 
-    # 1. Find the shift
-    row = db.execute(
-        "SELECT id FROM shifts WHERE date = ? AND shift_type = ?",
-        (shift_date.isoformat(), shift_type),
-    ).fetchone()
-    if row is None:
-        return f"No {shift_type} shift found on {shift_date}"
-
-    shift_id = row["id"]
-
-    # 2. Find active signup
-    signup_row = db.execute(
-        "SELECT id FROM signups WHERE volunteer_id = ? AND shift_id = ? AND dropped_at IS NULL",
-        (context.volunteer_id, shift_id),
-    ).fetchone()
-    if signup_row is None:
-        return f"You don't have an active signup for {shift_type} on {shift_date}"
-
-    # 3. Drop the signup
-    drop_signup(db, signup_row["id"])
+    with immediate_transaction(db):
+        # 1. Find the shift and the volunteer's active signup in one query
+        row = db.execute(
+            _SQL_SHIFT_WITH_ACTIVE_SIGNUP,
+            (context.volunteer_id, shift_date.isoformat(), shift_type),
+        ).fetchone()
+        if row is None:
+            return f"No {shift_type} shift found on {shift_date}"
+        if row["signup_id"] is None:
+            return f"You don't have an active signup for {shift_type} on {shift_date}"
+
+        # 2. Drop the signup
+        drop_signup(db, row["signup_id"])
     return f"Dropped {shift_type} shift on {shift_date}"
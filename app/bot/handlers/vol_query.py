@@ -2,10 +2,41 @@
 
 from __future__ import annotations
 
+import io
 import sqlite3
 from datetime import date
 
 from app.bot.auth import VolunteerContext
+from app.bot.handlers.common import month_range
+
+
+_SQL_MY_SHIFTS_FOR_MONTH = """
+    SELECT s.date, s.shift_type
+    FROM signups su
+    JOIN shifts s ON su.shift_id = s.id
+    WHERE su.volunteer_id = ?
+      AND su.dropped_at IS NULL
+      AND s.date >= ? AND s.date < ?
+    ORDER BY s.date, s.shift_type
+"""
+
+_SQL_MY_SHIFTS_ALL = """
+    SELECT s.date, s.shift_type
+    FROM signups su
+    JOIN shifts s ON su.shift_id = s.id
+    WHERE su.volunteer_id = ?
+      AND su.dropped_at IS NULL
+    ORDER BY s.date, s.shift_type
+"""
+
+_SQL_SHIFTS_FOR_DATE = """
+    SELECT s.id, s.shift_type, s.capacity,
+           (SELECT COUNT(*) FROM signups su
+            WHERE su.shift_id = s.id AND su.dropped_at IS NULL) AS signup_count
+    FROM shifts s
+    WHERE s.date = ?
+    ORDER BY s.shift_type
+"""
 
 
 def handle_my_shifts(
@@ -23,38 +54,24 @@ def handle_my_shifts(
 
     if month:
         rows = db.execute(
-            """
-            SELECT s.date, s.shift_type
-            FROM signups su
-            JOIN shifts s ON su.shift_id = s.id
-            WHERE su.volunteer_id = ?
-              AND su.dropped_at IS NULL
-              AND s.date LIKE ?
-            ORDER BY s.date, s.shift_type
-            """,
-            (context.volunteer_id, f"{month}%"),
+            _SQL_MY_SHIFTS_FOR_MONTH,
+            (context.volunteer_id, *month_range(month)),
         ).fetchall()
     else:
-        rows = db.execute(
-            """
-            SELECT s.date, s.shift_type
-            FROM signups su
-            JOIN shifts s ON su.shift_id = s.id
-            WHERE su.volunteer_id = ?
-              AND su.dropped_at IS NULL
-            ORDER BY s.date, s.shift_type
-            """,
-            (context.volunteer_id,),
-        ).fetchall()
+        rows = db.execute(_SQL_MY_SHIFTS_ALL, (context.volunteer_id,)).fetchall()
 
     label = month or "all months"
     if not rows:
         return f"You have no shifts for {label}"
 
-    lines = [f"Your shifts for {label}:"]
+    buf = io.StringIO()
+    buf.write(f"Your shifts for {label}:")
     for row in rows:
-        lines.append(f"- {row['date']} {row['shift_type']}")
-    return "\n".join(lines)
+        buf.write("\n- ")
+        buf.write(row["date"])
+        buf.write(" ")
+        buf.write(row["shift_type"])
+    return buf.getvalue()
 
 
 def handle_shifts(
@@ -70,19 +87,7 @@ def handle_shifts(
     target_date: date = args["date"]
     date_str = target_date.isoformat()
 
-    rows = db.execute(
-        """
-        SELECT s.id, s.shift_type, s.capacity,
-               COUNT(su.id) AS signup_count
-        FROM shifts s
-        LEFT JOIN signups su
-            ON su.shift_id = s.id AND su.dropped_at IS NULL
-        WHERE s.date = ?
-        GROUP BY s.id
-        ORDER BY s.shift_type
-        """,
-        (date_str,),
-    ).fetchall()
+    rows = db.execute(_SQL_SHIFTS_FOR_DATE, (date_str,)).fetchall()
 
     if not rows:
         return f"No shifts found for {date_str}"
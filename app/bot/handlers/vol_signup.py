@@ -6,10 +6,20 @@ import sqlite3
 from datetime import date
 
 from app.bot.auth import VolunteerContext
+from app.db import immediate_transaction
 from app.models.signup import SignupCreate, create_signup
 from app.rules.validator import validate_signup
 
 
+_SQL_SHIFT_WITH_ACTIVE_SIGNUP = """
+    SELECT sh.id AS shift_id, s.id AS signup_id
+    FROM shifts sh
+    LEFT JOIN signups s
+        ON s.shift_id = sh.id AND s.volunteer_id = ? AND s.dropped_at IS NULL
+    WHERE sh.date = ? AND sh.shift_type = ?
+"""
+
+
 def handle_signup(
     db: sqlite3.Connection,
     context: VolunteerContext,
@@ -34,27 +44,29 @@ def handle_signup(
     shift_date: date = args["date"]
     shift_type: str = args["type"]
 
-    # 1. Look up the shift
-    row = db.execute(
-        "SELECT id FROM shifts WHERE date = ? AND shift_type = ?",
-        (shift_date.isoformat(), shift_type),
-    ).fetchone()
+    # Lookup, rule checks and insert run under one write lock so a
+    # concurrent signup can't slip past the capacity check.
+    with immediate_transaction(db):
+        # 1. Look up the shift and any active signup for it in one query
+        row = db.execute(
+            _SQL_SHIFT_WITH_ACTIVE_SIGNUP,
+            (context.volunteer_id, shift_date.isoformat(), shift_type),
+        ).fetchone()
 
-    if row is None:
-        return f"No {shift_type} shift found on {shift_date}"
+        if row is None:
+            return f"No {shift_type} shift found on {shift_date}"
+        if row["signup_id"] is not None:
+            return f"Already signed up for {shift_type} on {shift_date}"
 
-    shift_id: int = row["id"]
+        shift_id: int = row["shift_id"]
 
-    # 2. Validate against rules
-    violations = validate_signup(db, context.volunteer_id, shift_id)
-    if violations:
-        reasons = "\n".join(f"- {v.reason}" for v in violations)
-        return f"Cannot sign up:\n{reasons}"
+        # 2. Validate against rules
+        violations = validate_signup(db, context.volunteer_id, shift_id)
+        if violations:
+            reasons = "\n".join(f"- {v.reason}" for v in violations)
+            return f"Cannot sign up:\n{reasons}"
 
-    # 3. Create the signup
-    try:
+        # 3. Create the signup
         create_signup(db, SignupCreate(volunteer_id=context.volunteer_id, shift_id=shift_id))
-    except sqlite3.IntegrityError:
-        return f"Already signed up for {shift_type} on {shift_date}"
 
     return f"Signed up for {shift_type} on {shift_date}"
@@ -26,7 +26,28 @@ class ParseError:
 COMMANDS = ["signup", "drop", "my shifts", "shifts", "status", "gaps", "find sub", "help", "register", "approve", "reject", "pending"]
 
 # Valid shift types
-SHIFT_TYPES = {"kakad", "robe"}
+SHIFT_TYPES = frozenset(("kakad", "robe"))
+
+
+_ISO_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_DM_RE = re.compile(r"^(\d{1,2})\s+([a-z]+)$")
+_MD_RE = re.compile(r"^([a-z]+)\s+(\d{1,2})$")
+_SLASH_RE = re.compile(r"^(\d{1,2})/(\d{1,2})$")
+
+_MONTH_NAMES = {
+    "january": 1, "jan": 1,
+    "february": 2, "feb": 2,
+    "march": 3, "mar": 3,
+    "april": 4, "apr": 4,
+    "may": 5,
+    "june": 6, "jun": 6,
+    "july": 7, "jul": 7,
+    "august": 8, "aug": 8,
+    "september": 9, "sep": 9, "sept": 9,
+    "october": 10, "oct": 10,
+    "november": 11, "nov": 11,
+    "december": 12, "dec": 12,
+}
 
 
 def parse_date(text: str) -> Optional[date]:
@@ -40,14 +61,15 @@ def parse_date(text: str) -> Optional[date]:
     - "15/3" or "3/15" -> try both formats (day/month first, then month/day)
     """
     text = text.strip().lower()
+    today = date.today()
 
     if text == "today":
-        return date.today()
+        return today
     if text == "tomorrow":
-        return date.today() + timedelta(days=1)
+        return today + timedelta(days=1)
 
     # ISO format: 2026-03-15
-    iso_match = re.match(r"^(\d{4})-(\d{1,2})-(\d{1,2})$", text)
+    iso_match = _ISO_RE.match(text)
     if iso_match:
         try:
             return date(int(iso_match.group(1)), int(iso_match.group(2)), int(iso_match.group(3)))
@@ -55,48 +77,34 @@ def parse_date(text: str) -> Optional[date]:
             return None
 
     # Named month formats: "15 March", "March 15", "15 Mar", "Mar 15"
-    month_names = {
-        "january": 1, "jan": 1,
-        "february": 2, "feb": 2,
-        "march": 3, "mar": 3,
-        "april": 4, "apr": 4,
-        "may": 5,
-        "june": 6, "jun": 6,
-        "july": 7, "jul": 7,
-        "august": 8, "aug": 8,
-        "september": 9, "sep": 9, "sept": 9,
-        "october": 10, "oct": 10,
-        "november": 11, "nov": 11,
-        "december": 12, "dec": 12,
-    }
 
     # "15 March" or "15 Mar"
-    dm_match = re.match(r"^(\d{1,2})\s+([a-z]+)$", text)
+    dm_match = _DM_RE.match(text)
     if dm_match:
         day = int(dm_match.group(1))
         month_str = dm_match.group(2)
-        if month_str in month_names:
+        if month_str in _MONTH_NAMES:
             try:
-                return date(date.today().year, month_names[month_str], day)
+                return date(today.year, _MONTH_NAMES[month_str], day)
             except ValueError:
                 return None
 
     # "March 15" or "Mar 15"
-    md_match = re.match(r"^([a-z]+)\s+(\d{1,2})$", text)
+    md_match = _MD_RE.match(text)
     if md_match:
         month_str = md_match.group(1)
         day = int(md_match.group(2))
-        if month_str in month_names:
+        if month_str in _MONTH_NAMES:
             try:
-                return date(date.today().year, month_names[month_str], day)
+                return date(today.year, _MONTH_NAMES[month_str], day)
             except ValueError:
                 return None
 
     # Slash formats: "15/3" or "3/15"
-    slash_match = re.match(r"^(\d{1,2})/(\d{1,2})$", text)
+    slash_match = _SLASH_RE.match(text)
     if slash_match:
         a, b = int(slash_match.group(1)), int(slash_match.group(2))
-        year = date.today().year
+        year = today.year
         # Try day/month first
         try:
             return date(year, b, a)
@@ -111,11 +119,215 @@ def parse_date(text: str) -> Optional[date]:
     return None
 
 
+_SINGLE_WORD_COMMANDS = ["signup", "drop", "shifts", "status", "gaps", "help", "register", "approve", "reject", "pending"]
+_TWO_WORD_COMMANDS = ["my shifts", "find sub"]
+
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _edits1(word: str) -> set[str]:
+    """Return every string one deletion, transposition, substitution or insertion away."""
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    deletes = {a + b[1:] for a, b in splits if b}
+    transposes = {a + b[1] + b[0] + b[2:] for a, b in splits if len(b) > 1}
+    replaces = {a + c + b[1:] for a, b in splits if b for c in _ALPHABET}
+    inserts = {a + c + b for a, b in splits for c in _ALPHABET}
+    return deletes | transposes | replaces | inserts
+
+
+def _build_typo_index(commands: list[str]) -> dict[str, list[str]]:
+    """Map each edit-distance-1 typo to the commands it could have meant."""
+    index: dict[str, list[str]] = {}
+    for command in commands:
+        for typo in _edits1(command):
+            if typo != command:
+                index.setdefault(typo, []).append(command)
+    return index
+
+
+# Built once at import so a mistyped command costs a single dict lookup.
+_TYPO_INDEX = _build_typo_index(_SINGLE_WORD_COMMANDS)
+_TWO_WORD_TYPO_INDEX = _build_typo_index(_TWO_WORD_COMMANDS)
+
+
 def _fuzzy_command(word: str) -> list[str]:
     """Return fuzzy matches for a single command word."""
-    single_word_commands = ["signup", "drop", "shifts", "status", "gaps", "help", "register", "approve", "reject", "pending"]
-    matches = get_close_matches(word, single_word_commands, n=3, cutoff=0.6)
-    return matches
+    matches = _TYPO_INDEX.get(word)
+    if matches is not None:
+        return matches[:3]
+    if len(word) >= 4:
+        return get_close_matches(word, _SINGLE_WORD_COMMANDS, n=3, cutoff=0.6)
+    return []
+
+
+def _fuzzy_two_word_command(phrase: str) -> list[str]:
+    """Return fuzzy matches for a two-word command phrase."""
+    matches = _TWO_WORD_TYPO_INDEX.get(phrase)
+    if matches is not None:
+        return matches[:2]
+    return get_close_matches(phrase, _TWO_WORD_COMMANDS, n=2, cutoff=0.6)
+
+
+# ---------------------------------------------------------------------------
+# Per-command parsers
+#
+# Each takes the lowercased tokens, the same tokens in their original case
+# (for free-text args like names) and the original text. Returning None
+# means "not this command" and lets parse_message fall through to fuzzy
+# suggestions (e.g. "signup" with no date).
+# ---------------------------------------------------------------------------
+
+_CommandResult = Optional[Union[ParsedCommand, ParseError]]
+
+
+def _parse_date_and_type(
+    tokens: list[str], idx: int, with_type: bool = True
+) -> tuple[Optional[date], Optional[str]]:
+    """Parse "<date> [<type>]" starting at tokens[idx].
+
+    A two-word date ("15 march") is tried before a single-word one.
+    Returns (None, None) when no date parses.
+    """
+    extra = 1 if with_type else 0
+    if len(tokens) >= idx + 2 + extra:
+        parsed = parse_date(f"{tokens[idx]} {tokens[idx + 1]}")
+        if parsed:
+            return parsed, tokens[idx + 2] if with_type else None
+    if len(tokens) >= idx + 1 + extra:
+        parsed = parse_date(tokens[idx])
+        if parsed:
+            return parsed, tokens[idx + 1] if with_type else None
+    return None, None
+
+
+def _parse_type(token: Optional[str]) -> Optional[str]:
+    """Return ``token`` if it names a shift type, else None."""
+    return token if token in SHIFT_TYPES else None
+
+
+def _parse_help(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    return ParsedCommand(command_type="help", args={})
+
+
+def _parse_register(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    if len(tokens) < 2:
+        return ParseError(original=original, suggestions=["register <your name>"])
+    return ParsedCommand(command_type="register", args={"name": " ".join(raw_tokens[1:])})
+
+
+def _parse_approve(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    if len(tokens) < 2:
+        return ParseError(original=original, suggestions=["approve <phone>"])
+    return ParsedCommand(command_type="approve", args={"phone": tokens[1]})
+
+
+def _parse_reject(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    if len(tokens) < 2:
+        return ParseError(original=original, suggestions=["reject <phone>"])
+    return ParsedCommand(command_type="reject", args={"phone": tokens[1]})
+
+
+def _parse_pending(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    return ParsedCommand(command_type="pending", args={})
+
+
+def _parse_gaps(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    return ParsedCommand(command_type="gaps", args={})
+
+
+def _parse_my_shifts(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    return ParsedCommand(command_type="my_shifts", args={})
+
+
+def _parse_find_sub(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    if len(tokens) < 4:
+        return None
+    parsed, shift_type = _parse_date_and_type(tokens, 2)
+    shift_type = _parse_type(shift_type)
+    if parsed and shift_type:
+        return ParsedCommand(command_type="find_sub", args={"date": parsed, "type": shift_type})
+    return ParseError(original=original, suggestions=["find sub <date> kakad|robe"])
+
+
+def _parse_signup(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    if len(tokens) < 3:
+        return None
+    parsed, shift_type = _parse_date_and_type(tokens, 1)
+    shift_type = _parse_type(shift_type)
+    if parsed and shift_type:
+        return ParsedCommand(command_type="signup", args={"date": parsed, "type": shift_type})
+    return ParseError(original=original, suggestions=["signup <date> kakad|robe"])
+
+
+def _parse_drop(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    if len(tokens) < 3:
+        return None
+    parsed, shift_type = _parse_date_and_type(tokens, 1)
+    shift_type = _parse_type(shift_type)
+    if parsed and shift_type:
+        return ParsedCommand(command_type="drop", args={"date": parsed, "type": shift_type})
+    return ParseError(original=original, suggestions=["drop <date> kakad|robe"])
+
+
+def _parse_shifts(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    if len(tokens) < 2:
+        return None
+    parsed, _ = _parse_date_and_type(tokens, 1, with_type=False)
+    if parsed:
+        return ParsedCommand(command_type="shifts", args={"date": parsed})
+    return ParseError(original=original, suggestions=["shifts <date>"])
+
+
+def _parse_status(
+    tokens: list[str], raw_tokens: list[str], original: str
+) -> _CommandResult:
+    if len(tokens) < 2:
+        return None
+    parsed, _ = _parse_date_and_type(tokens, 1, with_type=False)
+    if parsed:
+        return ParsedCommand(command_type="status", args={"date": parsed})
+    return ParseError(original=original, suggestions=["status <date>"])
+
+
+_DISPATCH = {
+    "help": _parse_help,
+    "register": _parse_register,
+    "approve": _parse_approve,
+    "reject": _parse_reject,
+    "pending": _parse_pending,
+    "gaps": _parse_gaps,
+    "signup": _parse_signup,
+    "drop": _parse_drop,
+    "shifts": _parse_shifts,
+    "status": _parse_status,
+}
+
+_TWO_WORD_DISPATCH = {
+    ("my", "shifts"): _parse_my_shifts,
+    ("find", "sub"): _parse_find_sub,
+}
 
 
 def parse_message(text: str) -> Union[ParsedCommand, ParseError]:
@@ -125,140 +337,23 @@ def parse_message(text: str) -> Union[ParsedCommand, ParseError]:
     if not text:
         return ParseError(original=original, suggestions=["help"])
 
-    lower = text.lower()
-    tokens = lower.split()
+    # Split once and lowercase per token; the common all-lowercase message
+    # skips the copy entirely. raw_tokens keeps the case of free-text args.
+    raw_tokens = text.split()
+    tokens = raw_tokens if text.islower() else [t.lower() for t in raw_tokens]
 
     if not tokens:
         return ParseError(original=original, suggestions=["help"])
 
-    # --- "help" ---
-    if tokens[0] == "help":
-        return ParsedCommand(command_type="help", args={})
-
-    # --- "register <name>" ---
-    if tokens[0] == "register":
-        if len(tokens) < 2:
-            return ParseError(original=original, suggestions=["register <your name>"])
-        name = " ".join(tokens[1:])
-        return ParsedCommand(command_type="register", args={"name": name})
-
-    # --- "approve <phone>" ---
-    if tokens[0] == "approve":
-        if len(tokens) < 2:
-            return ParseError(original=original, suggestions=["approve <phone>"])
-        phone = tokens[1]
-        return ParsedCommand(command_type="approve", args={"phone": phone})
-
-    # --- "reject <phone>" ---
-    if tokens[0] == "reject":
-        if len(tokens) < 2:
-            return ParseError(original=original, suggestions=["reject <phone>"])
-        phone = tokens[1]
-        return ParsedCommand(command_type="reject", args={"phone": phone})
-
-    # --- "pending" ---
-    if tokens[0] == "pending":
-        return ParsedCommand(command_type="pending", args={})
-
-    # --- "gaps" ---
-    if tokens[0] == "gaps":
-        return ParsedCommand(command_type="gaps", args={})
-
-    # --- "my shifts" ---
-    if len(tokens) >= 2 and tokens[0] == "my" and tokens[1] == "shifts":
-        return ParsedCommand(command_type="my_shifts", args={})
-
-    # --- "find sub <date> <type>" ---
-    if len(tokens) >= 4 and tokens[0] == "find" and tokens[1] == "sub":
-        date_text = tokens[2]
-        # Handle multi-word dates like "15 March"
-        if len(tokens) >= 5:
-            potential_date = f"{tokens[2]} {tokens[3]}"
-            parsed = parse_date(potential_date)
-            if parsed:
-                shift_type = tokens[4].lower()
-                return ParsedCommand(
-                    command_type="find_sub",
-                    args={"date": parsed, "type": shift_type},
-                )
-        parsed = parse_date(date_text)
-        if parsed:
-            shift_type = tokens[3].lower()
-            return ParsedCommand(
-                command_type="find_sub",
-                args={"date": parsed, "type": shift_type},
-            )
-        return ParseError(original=original, suggestions=["find sub <date> <type>"])
-
-    # --- "signup <date> <type>" ---
-    if tokens[0] == "signup" and len(tokens) >= 3:
-        # Try multi-word date: "signup 15 March kakad"
-        if len(tokens) >= 4:
-            potential_date = f"{tokens[1]} {tokens[2]}"
-            parsed = parse_date(potential_date)
-            if parsed:
-                shift_type = tokens[3].lower()
-                if shift_type in SHIFT_TYPES:
-                    return ParsedCommand(
-                        command_type="signup",
-                        args={"date": parsed, "type": shift_type},
-                    )
-        parsed = parse_date(tokens[1])
-        if parsed:
-            shift_type = tokens[2].lower()
-            if shift_type in SHIFT_TYPES:
-                return ParsedCommand(
-                    command_type="signup",
-                    args={"date": parsed, "type": shift_type},
-                )
-        return ParseError(original=original, suggestions=["signup <date> kakad|robe"])
-
-    # --- "drop <date> <type>" ---
-    if tokens[0] == "drop" and len(tokens) >= 3:
-        if len(tokens) >= 4:
-            potential_date = f"{tokens[1]} {tokens[2]}"
-            parsed = parse_date(potential_date)
-            if parsed:
-                shift_type = tokens[3].lower()
-                if shift_type in SHIFT_TYPES:
-                    return ParsedCommand(
-                        command_type="drop",
-                        args={"date": parsed, "type": shift_type},
-                    )
-        parsed = parse_date(tokens[1])
-        if parsed:
-            shift_type = tokens[2].lower()
-            if shift_type in SHIFT_TYPES:
-                return ParsedCommand(
-                    command_type="drop",
-                    args={"date": parsed, "type": shift_type},
-                )
-        return ParseError(original=original, suggestions=["drop <date> kakad|robe"])
-
-    # --- "shifts <date>" ---
-    if tokens[0] == "shifts" and len(tokens) >= 2:
-        # Try multi-word date
-        if len(tokens) >= 3:
-            potential_date = f"{tokens[1]} {tokens[2]}"
-            parsed = parse_date(potential_date)
-            if parsed:
-                return ParsedCommand(command_type="shifts", args={"date": parsed})
-        parsed = parse_date(tokens[1])
-        if parsed:
-            return ParsedCommand(command_type="shifts", args={"date": parsed})
-        return ParseError(original=original, suggestions=["shifts <date>"])
-
-    # --- "status <date>" ---
-    if tokens[0] == "status" and len(tokens) >= 2:
-        if len(tokens) >= 3:
-            potential_date = f"{tokens[1]} {tokens[2]}"
-            parsed = parse_date(potential_date)
-            if parsed:
-                return ParsedCommand(command_type="status", args={"date": parsed})
-        parsed = parse_date(tokens[1])
-        if parsed:
-            return ParsedCommand(command_type="status", args={"date": parsed})
-        return ParseError(original=original, suggestions=["status <date>"])
+    parser = None
+    if len(tokens) >= 2:
+        parser = _TWO_WORD_DISPATCH.get((tokens[0], tokens[1]))
+    if parser is None:
+        parser = _DISPATCH.get(tokens[0])
+    if parser is not None:
+        result = parser(tokens, raw_tokens, original)
+        if result is not None:
+            return result
 
     # --- Fuzzy matching for unknown commands ---
     suggestions = _fuzzy_command(tokens[0])
@@ -266,8 +361,6 @@ def parse_message(text: str) -> Union[ParsedCommand, ParseError]:
     # Also check two-word commands
     if len(tokens) >= 2:
         two_word = f"{tokens[0]} {tokens[1]}"
-        two_word_commands = ["my shifts", "find sub"]
-        two_matches = get_close_matches(two_word, two_word_commands, n=2, cutoff=0.6)
-        suggestions.extend(two_matches)
+        suggestions.extend(_fuzzy_two_word_command(two_word))
 
     return ParseError(original=original, suggestions=suggestions)
@@ -1,20 +1,205 @@
+from __future__ import annotations
+
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
 
 
 def get_db_connection(db_path: str = ":memory:") -> sqlite3.Connection:
-    """Return a sqlite3 connection with Row factory for dict-like access."""
-    conn = sqlite3.connect(db_path, check_same_thread=False)
+    """Return a sqlite3 connection with Row factory for dict-like access.
+
+    File-backed databases are switched to WAL so readers don't block the
+    writer, with ``synchronous=NORMAL`` (safe under WAL) to avoid an fsync
+    on every commit.
+
+    The connection is in autocommit mode (``isolation_level=None``): single
+    statements commit on their own, and multi-statement writes group
+    themselves with ``immediate_transaction``.
+    """
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MB
+    if db_path != ":memory:":
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA mmap_size = 268435456")
     return conn
 
 
+def _open_reader(db_path: str) -> sqlite3.Connection:
+    """Open a read-only connection to an existing database file."""
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro",
+        uri=True,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    return conn
+
+
+class ConnectionPool:
+    """One read-write connection plus up to ``readers`` read-only ones.
+
+    Under WAL, readers work from their own snapshot and never wait on the
+    writer, so read-only commands can run in parallel on separate
+    connections. Reader connections are opened lazily and reused. An
+    in-memory database can't be shared between connections, so there
+    ``reader()`` hands out the writer. ``readers`` defaults to twice the
+    CPU count, capped at 8.
+
+    The writer is shared by every request thread. Writes on it go through
+    ``immediate_transaction``, which holds its ``writer_lock`` so only one
+    thread at a time has a transaction open.
+    """
+
+    def __init__(self, db_path: str, readers: int | None = None) -> None:
+        if readers is None:
+            readers = min(8, (os.cpu_count() or 1) * 2)
+        self.db_path = db_path
+        self.writer = get_db_connection(db_path)
+        self._max_readers = 0 if db_path == ":memory:" else readers
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(self._max_readers, 1))
+        self._opened = 0
+        self._opened_lock = threading.Lock()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read-only connection, blocking if all are in use."""
+        if self._max_readers == 0:
+            yield self.writer
+            return
+
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = _open_reader(self.db_path)
+                with self._opened_lock:
+                    self._opened += 1
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def stats(self) -> dict:
+        """Return reader counts for diagnostics."""
+        idle = self._idle.qsize()
+        return {
+            "max_readers": self._max_readers,
+            "open_readers": self._opened,
+            "idle_readers": idle,
+            "busy_readers": self._opened - idle,
+        }
+
+    def close(self) -> None:
+        """Close the writer and every idle reader."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        self.writer.close()
+
+
+# One lock per connection object, keyed by id(); sqlite3.Connection doesn't
+# support weak references or extra attributes.
+_writer_locks: dict[int, threading.RLock] = {}
+_writer_locks_guard = threading.Lock()
+
+
+def writer_lock(conn: sqlite3.Connection) -> threading.RLock:
+    """Return the lock that serializes writes on ``conn`` across threads.
+
+    A connection has a single transaction, so threads sharing one (like the
+    app's writer) must hold this for as long as their transaction is open,
+    or one thread's statements land in another's transaction.
+    """
+    with _writer_locks_guard:
+        lock = _writer_locks.get(id(conn))
+        if lock is None:
+            lock = _writer_locks[id(conn)] = threading.RLock()
+        return lock
+
+
+@contextmanager
+def immediate_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the block inside ``BEGIN IMMEDIATE`` ... ``COMMIT``.
+
+    Taking the write lock up front means a read-then-write sequence can't
+    lose a race to another writer halfway through and fail with
+    SQLITE_BUSY. The connection's ``writer_lock`` is held throughout, so
+    other threads wait rather than joining this transaction; a nested call
+    from the same thread joins the open transaction.
+    """
+    with writer_lock(conn):
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        if conn.in_transaction:
+            conn.commit()
+
+
+def database_path(conn: sqlite3.Connection) -> str | None:
+    """Return the file backing ``conn``, or None for an in-memory database."""
+    row = conn.execute("PRAGMA database_list").fetchone()
+    return row[2] or None
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    """Parse a TIMESTAMP column value (``YYYY-MM-DD[ HH:MM:SS]``) or pass None."""
+    return None if value is None else datetime.fromisoformat(value)
+
+
+# Stored in PRAGMA user_version once create_tables has run. Bump it whenever
+# the DDL below changes so existing databases pick up the change.
+SCHEMA_VERSION = 5
+
+# Databases created before this version get their stored phones normalized
+# once (see normalize_stored_phones) as part of the upgrade.
+_PHONES_NORMALIZED_VERSION = 5
+
+
 def create_tables(conn: sqlite3.Connection) -> None:
     """Create all tables (volunteers, shifts, signups).
 
     This is called by the shared test fixture so every model's tests
-    start with a fully-initialised schema.
+    start with a fully-initialised schema. A database already at
+    SCHEMA_VERSION is left alone.
     """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version == SCHEMA_VERSION:
+        return
+
     conn.executescript(
         """
         CREATE TABLE IF NOT EXISTS volunteers (
@@ -61,5 +246,34 @@ def create_tables(conn: sqlite3.Connection) -> None:
             error TEXT,
             FOREIGN KEY (volunteer_id) REFERENCES volunteers(id)
         );
+
+        -- Nearly every signup query filters on dropped_at IS NULL, so
+        -- partial indexes only hold active rows. The volunteer-side index
+        -- also carries shift_id for the per-volunteer joins to shifts.
+        CREATE INDEX IF NOT EXISTS idx_signups_shift_active
+            ON signups(shift_id) WHERE dropped_at IS NULL;
+        DROP INDEX IF EXISTS idx_signups_vol_active;
+        CREATE INDEX IF NOT EXISTS idx_signups_volunteer_shift_active
+            ON signups(volunteer_id, shift_id) WHERE dropped_at IS NULL;
+
+        -- Month range scans read id, date, type and capacity straight from
+        -- the index. It also makes a plain index on date redundant.
+        DROP INDEX IF EXISTS idx_shifts_date;
+        CREATE INDEX IF NOT EXISTS idx_shifts_date_type
+            ON shifts(date, shift_type, capacity);
+
+        CREATE INDEX IF NOT EXISTS idx_notifications_volunteer
+            ON notifications(volunteer_id, id DESC);
+        -- Drop-alert dedupe: a range scan over one coordinator's recent alerts.
+        CREATE INDEX IF NOT EXISTS idx_notifications_alert_sent
+            ON notifications(volunteer_id, sent_at) WHERE type = 'alert';
         """
     )
+    if version < _PHONES_NORMALIZED_VERSION:
+        # Imported here because the volunteer model imports this module.
+        from app.models.volunteer import normalize_stored_phones
+
+        normalize_stored_phones(conn)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    # Refresh planner statistics for any index that was just built.
+    conn.execute("PRAGMA optimize")
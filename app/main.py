@@ -1,12 +1,15 @@
+import hashlib
 import os
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi import FastAPI, Request
+import anyio
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
-from app.db import get_db_connection, create_tables
+from app.db import ConnectionPool, create_tables, get_db_connection
+from app.notifications.sender import close_http_client
 from app.routes.coordinator import router as coordinator_router
 from app.routes.shifts import router as shifts_router
 from app.routes.signups import router as signups_router
@@ -23,27 +26,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(coordinator_router)
-app.include_router(shifts_router)
-app.include_router(signups_router)
-app.include_router(volunteers_router)
-app.include_router(wa_incoming_router)
+ROUTERS = (
+    coordinator_router,
+    shifts_router,
+    signups_router,
+    volunteers_router,
+    wa_incoming_router,
+)
+for router in ROUTERS:
+    app.include_router(router)
 
 @app.on_event("startup")
 def startup():
     db_path = os.getenv("DB_PATH", "cc-vol.db")
     db_dir = Path(db_path).parent
     db_dir.mkdir(parents=True, exist_ok=True)
-    conn = get_db_connection(db_path)
-    create_tables(conn)
-    app.state.db = conn
-    app.state.scheduler = start_scheduler()
+    pool = ConnectionPool(db_path)
+    create_tables(pool.writer)
+    app.state.pool = pool
+    app.state.db = pool.writer
+    # Read-only commands each hold a pooled reader; write commands share the
+    # one writer, whose lock lets only one of them write at a time. So one
+    # message per reader plus one writer is all that can make progress.
+    app.state.bot_limiter = anyio.CapacityLimiter(pool.stats()["max_readers"] + 1)
+    # Jobs get their own long-lived connection rather than sharing the
+    # request writer, whose transactions they could otherwise join.
+    app.state.scheduler_db = get_db_connection(db_path)
+    app.state.scheduler = start_scheduler(app.state.scheduler_db)
 
 
 @app.on_event("shutdown")
 def shutdown():
-    app.state.db.close()
+    app.state.pool.close()
     shutdown_scheduler(app.state.scheduler)
+    app.state.scheduler_db.close()
+    close_http_client()
 
 
 def get_db(request: Request):
@@ -55,21 +72,45 @@ STATIC_DIR = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 
+@lru_cache(maxsize=None)
+def _load_page(name: str) -> tuple[bytes, str]:
+    """Read an HTML page once per process and return (body, ETag)."""
+    body = (STATIC_DIR / name).read_bytes()
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _page_response(request: Request, name: str) -> Response:
+    """Serve a cached page, answering a matching If-None-Match with 304."""
+    body, etag = _load_page(name)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
 @app.get("/")
-def index():
-    return FileResponse(STATIC_DIR / "chat.html")
+def index(request: Request):
+    return _page_response(request, "chat.html")
 
 
 @app.get("/dashboard")
-def dashboard():
-    return FileResponse(STATIC_DIR / "dashboard.html")
+def dashboard(request: Request):
+    return _page_response(request, "dashboard.html")
 
 
 @app.get("/volunteer")
-def volunteer():
-    return FileResponse(STATIC_DIR / "volunteer.html")
+def volunteer(request: Request):
+    return _page_response(request, "volunteer.html")
 
 
 @app.get("/healthz")
 def healthz():
     return {"status": "ok"}
+
+
+@app.get("/api/debug/pool-health")
+def pool_health(request: Request):
+    pool = getattr(request.app.state, "pool", None)
+    if pool is None:
+        return {"status": "no pool"}
+    return {"status": "ok", **pool.stats()}
@@ -6,6 +6,8 @@ from typing import Optional, Literal
 
 from pydantic import BaseModel
 
+from app.db import immediate_transaction, parse_timestamp
+
 
 # ---------------------------------------------------------------------------
 # Pydantic models
@@ -27,41 +29,102 @@ class Notification(BaseModel):
     error: Optional[str]
 
 
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+_SQL_INSERT_NOTIFICATION = """
+    INSERT INTO notifications (volunteer_id, type, message)
+    VALUES (?, ?, ?)
+    RETURNING *
+"""
+_SQL_INSERT_DELIVERED_NOTIFICATION = """
+    INSERT INTO notifications (volunteer_id, type, message, sent_at, error)
+    VALUES (?, ?, ?, CASE WHEN ? IS NULL THEN CURRENT_TIMESTAMP END, ?)
+    RETURNING *
+"""
+_SQL_INSERT_NOTIFICATION_BULK = (
+    "INSERT INTO notifications (volunteer_id, type, message) VALUES (?, ?, ?)"
+)
+_SQL_SELECT_NOTIFICATION_BY_ID = "SELECT * FROM notifications WHERE id = ?"
+_SQL_LIST_NOTIFICATIONS_BY_VOLUNTEER = (
+    "SELECT * FROM notifications WHERE volunteer_id = ? ORDER BY id DESC"
+)
+_RETURNING = " RETURNING *"
+_SQL_MARK_SENT = "UPDATE notifications SET sent_at = CURRENT_TIMESTAMP WHERE id = ?"
+_SQL_MARK_ACKNOWLEDGED = (
+    "UPDATE notifications SET ack_at = CURRENT_TIMESTAMP WHERE id = ?"
+)
+_SQL_MARK_ERROR = "UPDATE notifications SET error = ? WHERE id = ?"
+
+
 # ---------------------------------------------------------------------------
 # CRUD helpers
 # ---------------------------------------------------------------------------
 
 def _row_to_notification(row: sqlite3.Row) -> Notification:
-    return Notification(
-        id=row["id"],
-        volunteer_id=row["volunteer_id"],
-        type=row["type"],
-        message=row["message"],
-        sent_at=row["sent_at"],
-        ack_at=row["ack_at"],
-        error=row["error"],
+    # Positional unpack in CREATE TABLE order (every query here is SELECT * /
+    # RETURNING *); it's cheaper than name lookups on sqlite3.Row. Values
+    # come from a CHECK-constrained schema, so skip Pydantic validation and
+    # only parse the timestamps ourselves.
+    id_, volunteer_id, type_, message, sent_at, ack_at, error = row
+    return Notification.model_construct(
+        id=id_,
+        volunteer_id=volunteer_id,
+        type=type_,
+        message=message,
+        sent_at=parse_timestamp(sent_at),
+        ack_at=parse_timestamp(ack_at),
+        error=error,
     )
 
 
 def create_notification(db: sqlite3.Connection, data: NotificationCreate) -> Notification:
     """Insert a new notification and return the created record."""
-    cursor = db.execute(
-        """INSERT INTO notifications (volunteer_id, type, message)
-           VALUES (?, ?, ?)""",
+    row = db.execute(
+        _SQL_INSERT_NOTIFICATION,
         (data.volunteer_id, data.type, data.message),
-    )
-    db.commit()
+    ).fetchone()
+    return _row_to_notification(row)
+
+
+def create_delivered_notification(
+    db: sqlite3.Connection, data: NotificationCreate, error: Optional[str]
+) -> Notification:
+    """Insert a notification whose send was already attempted.
+
+    With ``error`` None the row is stored as sent; otherwise the error is
+    recorded and sent_at stays NULL. One statement, so one commit.
+    """
     row = db.execute(
-        "SELECT * FROM notifications WHERE id = ?", (cursor.lastrowid,)
+        _SQL_INSERT_DELIVERED_NOTIFICATION,
+        (data.volunteer_id, data.type, data.message, error, error),
     ).fetchone()
     return _row_to_notification(row)
 
 
+def create_notifications_bulk(
+    db: sqlite3.Connection, items: list[NotificationCreate]
+) -> list[int]:
+    """Insert many notifications in one transaction and return their IDs.
+
+    The write lock is held for the whole batch, so AUTOINCREMENT hands out
+    a contiguous block ending at last_insert_rowid().
+    """
+    if not items:
+        return []
+    with immediate_transaction(db):
+        db.executemany(
+            _SQL_INSERT_NOTIFICATION_BULK,
+            [(i.volunteer_id, i.type, i.message) for i in items],
+        )
+        last_id = db.execute("SELECT last_insert_rowid()").fetchone()[0]
+    return list(range(last_id - len(items) + 1, last_id + 1))
+
+
 def get_notification(db: sqlite3.Connection, notification_id: int) -> Optional[Notification]:
     """Look up a notification by ID. Returns None if not found."""
-    row = db.execute(
-        "SELECT * FROM notifications WHERE id = ?", (notification_id,)
-    ).fetchone()
+    row = db.execute(_SQL_SELECT_NOTIFICATION_BY_ID, (notification_id,)).fetchone()
     if row is None:
         return None
     return _row_to_notification(row)
@@ -71,44 +134,60 @@ def list_notifications_by_volunteer(
     db: sqlite3.Connection, volunteer_id: int
 ) -> list[Notification]:
     """Return all notifications for a specific volunteer."""
-    rows = db.execute(
-        "SELECT * FROM notifications WHERE volunteer_id = ? ORDER BY id DESC",
-        (volunteer_id,),
-    ).fetchall()
-    return [_row_to_notification(r) for r in rows]
+    cursor = db.execute(_SQL_LIST_NOTIFICATIONS_BY_VOLUNTEER, (volunteer_id,))
+    return [_row_to_notification(r) for r in cursor]
+
+
+# Each mark_* helper comes in two flavours: the plain one only reports
+# whether the row existed, and the *_returning one also hands back the
+# updated notification for callers that need it.
+
+def mark_sent(db: sqlite3.Connection, notification_id: int) -> bool:
+    """Set sent_at to the current timestamp. Returns False if not found."""
+    return db.execute(_SQL_MARK_SENT, (notification_id,)).rowcount > 0
 
 
-def mark_sent(
+def mark_sent_returning(
     db: sqlite3.Connection, notification_id: int
 ) -> Optional[Notification]:
     """Mark a notification as sent by setting sent_at to current timestamp."""
-    db.execute(
-        "UPDATE notifications SET sent_at = CURRENT_TIMESTAMP WHERE id = ?",
-        (notification_id,),
-    )
-    db.commit()
-    return get_notification(db, notification_id)
+    row = db.execute(_SQL_MARK_SENT + _RETURNING, (notification_id,)).fetchone()
+    if row is None:
+        return None
+    return _row_to_notification(row)
+
+
+def mark_acknowledged(db: sqlite3.Connection, notification_id: int) -> bool:
+    """Set ack_at to the current timestamp. Returns False if not found."""
+    return db.execute(_SQL_MARK_ACKNOWLEDGED, (notification_id,)).rowcount > 0
 
 
-def mark_acknowledged(
+def mark_acknowledged_returning(
     db: sqlite3.Connection, notification_id: int
 ) -> Optional[Notification]:
     """Mark a notification as acknowledged by setting ack_at to current timestamp."""
-    db.execute(
-        "UPDATE notifications SET ack_at = CURRENT_TIMESTAMP WHERE id = ?",
-        (notification_id,),
-    )
-    db.commit()
-    return get_notification(db, notification_id)
+    row = db.execute(
+        _SQL_MARK_ACKNOWLEDGED + _RETURNING, (notification_id,)
+    ).fetchone()
+    if row is None:
+        return None
+    return _row_to_notification(row)
 
 
 def mark_error(
     db: sqlite3.Connection, notification_id: int, error_msg: str
+) -> bool:
+    """Record an error message. Returns False if not found."""
+    return db.execute(_SQL_MARK_ERROR, (error_msg, notification_id)).rowcount > 0
+
+
+def mark_error_returning(
+    db: sqlite3.Connection, notification_id: int, error_msg: str
 ) -> Optional[Notification]:
     """Mark a notification with an error message."""
-    db.execute(
-        "UPDATE notifications SET error = ? WHERE id = ?",
-        (error_msg, notification_id),
-    )
-    db.commit()
-    return get_notification(db, notification_id)
+    row = db.execute(
+        _SQL_MARK_ERROR + _RETURNING, (error_msg, notification_id)
+    ).fetchone()
+    if row is None:
+        return None
+    return _row_to_notification(row)
@@ -8,6 +8,8 @@ from typing import Literal
 
 from pydantic import BaseModel
 
+from app.db import parse_timestamp
+
 
 # ---------------------------------------------------------------------------
 # Pydantic models
@@ -31,15 +33,33 @@ class Shift(BaseModel):
 # Helper
 # ---------------------------------------------------------------------------
 
+# Display names used in volunteer-facing messages.
+SHIFT_LABELS = {"kakad": "Kakad", "robe": "Robe"}
+
+# Robe capacity indexed by date.weekday(): Mon, Tue, Wed, Thu, Fri, Sat, Sun.
+_ROBE_CAPACITY = (3, 4, 3, 4, 3, 4, 3)
+
+
 def get_robe_capacity(weekday: int) -> int:
     """Return robe-shift capacity for a given weekday.
 
     weekday uses Python's date.weekday() convention: 0=Mon ... 6=Sun.
     Returns 3 for Sun(6)/Mon(0)/Wed(2)/Fri(4), 4 for Tue(1)/Thu(3)/Sat(5).
     """
-    if weekday in (0, 2, 4, 6):  # Mon, Wed, Fri, Sun
-        return 3
-    return 4  # Tue, Thu, Sat
+    return _ROBE_CAPACITY[weekday]
+
+
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+_SQL_INSERT_SHIFT = (
+    "INSERT INTO shifts (date, shift_type, capacity) VALUES (?, ?, ?) RETURNING *"
+)
+_SQL_SHIFTS_BY_DATE = "SELECT * FROM shifts WHERE date = ? ORDER BY shift_type"
+_SQL_SHIFTS_BY_MONTH = (
+    "SELECT * FROM shifts WHERE date >= ? AND date < ? ORDER BY date, shift_type"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -47,42 +67,48 @@ def get_robe_capacity(weekday: int) -> int:
 # ---------------------------------------------------------------------------
 
 def _row_to_shift(row: sqlite3.Row) -> Shift:
-    """Convert a sqlite3.Row into a Shift model."""
-    return Shift(
-        id=row["id"],
-        date=date.fromisoformat(row["date"]),
-        type=row["shift_type"],
-        capacity=row["capacity"],
-        created_at=row["created_at"],
+    """Convert a sqlite3.Row (columns in CREATE TABLE order) into a Shift.
+
+    Built with model_construct: DB values need no validation beyond
+    parsing the dates.
+    """
+    id_, shift_date, shift_type, capacity, created_at = row
+    return Shift.model_construct(
+        id=id_,
+        date=date.fromisoformat(shift_date),
+        type=shift_type,
+        capacity=capacity,
+        created_at=parse_timestamp(created_at),
     )
 
 
 def create_shift(db: sqlite3.Connection, data: ShiftCreate) -> Shift:
     """Insert a new shift and return it."""
-    cursor = db.execute(
-        "INSERT INTO shifts (date, shift_type, capacity) VALUES (?, ?, ?)",
-        (data.date.isoformat(), data.type, data.capacity),
-    )
-    db.commit()
-    row = db.execute("SELECT * FROM shifts WHERE id = ?", (cursor.lastrowid,)).fetchone()
+    row = db.execute(
+        _SQL_INSERT_SHIFT, (data.date.isoformat(), data.type, data.capacity)
+    ).fetchone()
     return _row_to_shift(row)
 
 
 def get_shifts_by_date(db: sqlite3.Connection, target_date: date) -> list[Shift]:
     """Return all shifts for a given date."""
-    rows = db.execute(
-        "SELECT * FROM shifts WHERE date = ? ORDER BY shift_type",
-        (target_date.isoformat(),),
-    ).fetchall()
-    return [_row_to_shift(r) for r in rows]
+    cursor = db.execute(_SQL_SHIFTS_BY_DATE, (target_date.isoformat(),))
+    return [_row_to_shift(r) for r in cursor]
+
+
+def month_bounds(year: int, month: int) -> tuple[str, str]:
+    """Return ISO dates for the first day of the month and of the next one.
+
+    ``date >= start AND date < end`` is an index range scan on
+    ``idx_shifts_date_type``; ``LIKE 'YYYY-MM-%'`` only uses it when
+    SQLite's LIKE optimisation applies.
+    """
+    start = date(year, month, 1)
+    end = date(year + (month == 12), month % 12 + 1, 1)
+    return start.isoformat(), end.isoformat()
 
 
 def get_shifts_by_month(db: sqlite3.Connection, year: int, month: int) -> list[Shift]:
     """Return all shifts within the given year/month."""
-    # Build the YYYY-MM prefix for a LIKE query
-    prefix = f"{year:04d}-{month:02d}-%"
-    rows = db.execute(
-        "SELECT * FROM shifts WHERE date LIKE ? ORDER BY date, shift_type",
-        (prefix,),
-    ).fetchall()
-    return [_row_to_shift(r) for r in rows]
+    cursor = db.execute(_SQL_SHIFTS_BY_MONTH, month_bounds(year, month))
+    return [_row_to_shift(r) for r in cursor]
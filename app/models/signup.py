@@ -8,6 +8,9 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from app.db import parse_timestamp
+from app.models.shift import month_bounds
+
 
 # ---------------------------------------------------------------------------
 # Pydantic models
@@ -26,95 +29,135 @@ class Signup(BaseModel):
     dropped_at: Optional[datetime]
 
 
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+_SQL_UPSERT_SIGNUP = """
+    INSERT INTO signups (volunteer_id, shift_id) VALUES (?, ?)
+    ON CONFLICT (volunteer_id, shift_id) DO UPDATE SET
+        dropped_at = NULL,
+        signed_up_at = CASE WHEN signups.dropped_at IS NULL
+                            THEN signups.signed_up_at
+                            ELSE CURRENT_TIMESTAMP END
+    RETURNING *
+"""
+_SQL_DROP_SIGNUP = (
+    "UPDATE signups SET dropped_at = CURRENT_TIMESTAMP WHERE id = ? RETURNING *"
+)
+_SQL_SIGNUPS_BY_VOLUNTEER_MONTH = """
+    SELECT s.* FROM signups s
+    JOIN shifts sh ON s.shift_id = sh.id
+    WHERE s.volunteer_id = ? AND sh.date >= ? AND sh.date < ?
+    ORDER BY sh.date
+"""
+_SQL_ACTIVE_SIGNUPS_BY_VOLUNTEER_MONTH = """
+    SELECT s.* FROM signups s
+    JOIN shifts sh ON s.shift_id = sh.id
+    WHERE s.volunteer_id = ? AND s.dropped_at IS NULL
+      AND sh.date >= ? AND sh.date < ?
+    ORDER BY sh.date
+"""
+_SQL_ACTIVE_SIGNUPS_WITH_SHIFTS = """
+    SELECT
+        s.id AS signup_id,
+        s.signed_up_at,
+        sh.id AS shift_id,
+        sh.date,
+        sh.shift_type,
+        sh.capacity
+    FROM signups s
+    JOIN shifts sh ON s.shift_id = sh.id
+    WHERE s.volunteer_id = ? AND s.dropped_at IS NULL
+      AND sh.date >= ? AND sh.date < ?
+    ORDER BY sh.date
+"""
+_SQL_SIGNUPS_BY_SHIFT = "SELECT * FROM signups WHERE shift_id = ? ORDER BY signed_up_at"
+_SQL_ACTIVE_SIGNUPS_BY_SHIFT = (
+    "SELECT * FROM signups WHERE shift_id = ? AND dropped_at IS NULL ORDER BY signed_up_at"
+)
+
+
 # ---------------------------------------------------------------------------
 # CRUD
 # ---------------------------------------------------------------------------
 
 def _row_to_signup(row: sqlite3.Row) -> Signup:
-    """Convert a sqlite3.Row into a Signup model."""
-    return Signup(
-        id=row["id"],
-        volunteer_id=row["volunteer_id"],
-        shift_id=row["shift_id"],
-        signed_up_at=row["signed_up_at"],
-        dropped_at=row["dropped_at"],
+    """Convert a sqlite3.Row (columns in CREATE TABLE order) into a Signup.
+
+    Built with model_construct: DB values need no validation beyond
+    parsing the timestamps.
+    """
+    id_, volunteer_id, shift_id, signed_up_at, dropped_at = row
+    return Signup.model_construct(
+        id=id_,
+        volunteer_id=volunteer_id,
+        shift_id=shift_id,
+        signed_up_at=parse_timestamp(signed_up_at),
+        dropped_at=parse_timestamp(dropped_at),
     )
 
 
 def create_signup(db: sqlite3.Connection, data: SignupCreate) -> Signup:
-    """Insert a new signup and return it."""
-    existing = db.execute(
-        "SELECT * FROM signups WHERE volunteer_id = ? AND shift_id = ?",
-        (data.volunteer_id, data.shift_id),
-    ).fetchone()
-    if existing is not None:
-        if existing["dropped_at"] is not None:
-            db.execute(
-                "UPDATE signups SET dropped_at = NULL, signed_up_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (existing["id"],),
-            )
-            db.commit()
-            row = db.execute(
-                "SELECT * FROM signups WHERE id = ?", (existing["id"],)
-            ).fetchone()
-            return _row_to_signup(row)
-        return _row_to_signup(existing)
+    """Insert a new signup and return it.
 
-    cursor = db.execute(
-        "INSERT INTO signups (volunteer_id, shift_id) VALUES (?, ?)",
-        (data.volunteer_id, data.shift_id),
-    )
-    db.commit()
-    row = db.execute("SELECT * FROM signups WHERE id = ?", (cursor.lastrowid,)).fetchone()
+    A previously dropped signup for the same shift is reactivated; an active
+    one is returned unchanged. Both cases are a single UPSERT on the
+    ``UNIQUE(volunteer_id, shift_id)`` constraint.
+    """
+    row = db.execute(_SQL_UPSERT_SIGNUP, (data.volunteer_id, data.shift_id)).fetchone()
     return _row_to_signup(row)
 
 
 def drop_signup(db: sqlite3.Connection, signup_id: int) -> Optional[Signup]:
     """Set dropped_at on a signup. Returns updated signup or None if not found."""
-    db.execute(
-        "UPDATE signups SET dropped_at = CURRENT_TIMESTAMP WHERE id = ?",
-        (signup_id,),
-    )
-    db.commit()
-    row = db.execute("SELECT * FROM signups WHERE id = ?", (signup_id,)).fetchone()
+    row = db.execute(_SQL_DROP_SIGNUP, (signup_id,)).fetchone()
     if row is None:
         return None
     return _row_to_signup(row)
 
 
 def get_signups_by_volunteer(
-    db: sqlite3.Connection, volunteer_id: int, month: str
+    db: sqlite3.Connection, volunteer_id: int, month: str, active_only: bool = False
 ) -> list[Signup]:
     """Return all signups for a volunteer in a given month.
 
     month should be in 'YYYY-MM' format. Joins with shifts to filter by
-    shift date.
+    shift date. With ``active_only``, dropped signups are filtered out in
+    SQL.
     """
-    rows = db.execute(
-        """
-        SELECT s.* FROM signups s
-        JOIN shifts sh ON s.shift_id = sh.id
-        WHERE s.volunteer_id = ? AND sh.date LIKE ?
-        ORDER BY sh.date
-        """,
-        (volunteer_id, f"{month}-%"),
+    sql = (
+        _SQL_ACTIVE_SIGNUPS_BY_VOLUNTEER_MONTH
+        if active_only
+        else _SQL_SIGNUPS_BY_VOLUNTEER_MONTH
+    )
+    cursor = db.execute(
+        sql, (volunteer_id, *month_bounds(int(month[:4]), int(month[5:7])))
+    )
+    return [_row_to_signup(r) for r in cursor]
+
+
+def get_active_signups_with_shifts(
+    db: sqlite3.Connection, volunteer_id: int, month: str
+) -> list[sqlite3.Row]:
+    """Return a volunteer's active signups in a month joined to their shifts.
+
+    Each row has signup_id, signed_up_at, shift_id, date, shift_type and
+    capacity, ordered by shift date.
+    """
+    return db.execute(
+        _SQL_ACTIVE_SIGNUPS_WITH_SHIFTS,
+        (volunteer_id, *month_bounds(int(month[:4]), int(month[5:7]))),
     ).fetchall()
-    return [_row_to_signup(r) for r in rows]
 
 
 def get_signups_by_shift(db: sqlite3.Connection, shift_id: int) -> list[Signup]:
     """Return all signups for a given shift (including dropped)."""
-    rows = db.execute(
-        "SELECT * FROM signups WHERE shift_id = ? ORDER BY signed_up_at",
-        (shift_id,),
-    ).fetchall()
-    return [_row_to_signup(r) for r in rows]
+    cursor = db.execute(_SQL_SIGNUPS_BY_SHIFT, (shift_id,))
+    return [_row_to_signup(r) for r in cursor]
 
 
 def get_active_signups_by_shift(db: sqlite3.Connection, shift_id: int) -> list[Signup]:
     """Return only active (non-dropped) signups for a given shift."""
-    rows = db.execute(
-        "SELECT * FROM signups WHERE shift_id = ? AND dropped_at IS NULL ORDER BY signed_up_at",
-        (shift_id,),
-    ).fetchall()
-    return [_row_to_signup(r) for r in rows]
+    cursor = db.execute(_SQL_ACTIVE_SIGNUPS_BY_SHIFT, (shift_id,))
+    return [_row_to_signup(r) for r in cursor]
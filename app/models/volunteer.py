@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import os
+import re
 import sqlite3
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import BaseModel
 
+from app.db import parse_timestamp
+
 
 # ---------------------------------------------------------------------------
 # Pydantic models
@@ -32,27 +36,98 @@ class Volunteer(BaseModel):
     removed_at: Optional[datetime]
 
 
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+_SQL_INSERT_VOLUNTEER = """
+    INSERT INTO volunteers (phone, name, is_coordinator, status)
+    VALUES (?, ?, ?, ?)
+    RETURNING *
+"""
+# _lookup_candidates yields at most six distinct spellings. Lookups always
+# bind exactly this many, padding with NULL (which never equals a phone), so
+# each query below has one fixed SQL text and its prepared statement is reused.
+_PHONE_SLOTS = 6
+_PHONE_IN = "phone IN (" + ", ".join("?" * _PHONE_SLOTS) + ")"
+_PHONE_RANK = (
+    "CASE phone "
+    + " ".join(f"WHEN ? THEN {i}" for i in range(_PHONE_SLOTS))
+    + " END"
+)
+
+# Earlier candidates are preferred spellings, so the lowest rank wins.
+_SQL_BEST_MATCH = f"""
+    SELECT * FROM volunteers
+    WHERE removed_at IS NULL AND {_PHONE_IN}
+    ORDER BY {_PHONE_RANK}
+    LIMIT 1
+"""
+_SQL_BEST_MATCH_ID = f"""(SELECT id FROM volunteers
+              WHERE removed_at IS NULL AND {_PHONE_IN}
+              ORDER BY {_PHONE_RANK}
+              LIMIT 1)"""
+_SQL_LIST_ACTIVE_VOLUNTEERS = "SELECT * FROM volunteers WHERE removed_at IS NULL"
+_SQL_LIST_ACTIVE_VOLUNTEERS_BY_STATUS = (
+    "SELECT * FROM volunteers WHERE status = ? AND removed_at IS NULL"
+)
+# OR IGNORE leaves a legacy row alone if its normalized phone already
+# belongs to another volunteer.
+_SQL_NORMALIZE_STORED_PHONES = """
+    UPDATE OR IGNORE volunteers SET phone = normalize_phone(phone)
+    WHERE phone != normalize_phone(phone)
+"""
+_SQL_VOLUNTEER_SUMMARIES_BY_STATUS = """
+    SELECT id, phone, name, is_coordinator, status FROM volunteers
+    WHERE status = ? AND removed_at IS NULL
+"""
+
+
 # ---------------------------------------------------------------------------
 # CRUD helpers
 # ---------------------------------------------------------------------------
 
 def _row_to_volunteer(row: sqlite3.Row) -> Volunteer:
-    return Volunteer(
-        id=row["id"],
-        phone=row["phone"],
-        name=row["name"],
-        is_coordinator=bool(row["is_coordinator"]),
-        created_at=row["created_at"],
-        status=row["status"],
-        requested_at=row["requested_at"],
-        approved_at=row["approved_at"],
-        approved_by=row["approved_by"],
-        removed_at=row["removed_at"],
+    # Positional unpack in CREATE TABLE order (callers SELECT * / RETURNING *);
+    # it's cheaper than name lookups on sqlite3.Row. model_construct skips
+    # validation of values the schema already constrains.
+    (
+        id_, phone, name, is_coordinator, created_at, status,
+        requested_at, approved_at, approved_by, removed_at,
+    ) = row
+    return Volunteer.model_construct(
+        id=id_,
+        phone=phone,
+        name=name,
+        is_coordinator=bool(is_coordinator),
+        created_at=parse_timestamp(created_at),
+        status=status,
+        requested_at=parse_timestamp(requested_at),
+        approved_at=parse_timestamp(approved_at),
+        approved_by=approved_by,
+        removed_at=parse_timestamp(removed_at),
     )
 
 
+# Both strip non-digits in C: a translate table for the usual ASCII input,
+# and a regex for anything else (e.g. full-width digits pasted from a phone).
+_DROP_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+
 def _digits_only(phone: str) -> str:
-    return "".join(ch for ch in phone if ch.isdigit())
+    if phone.isascii():
+        return phone.translate(_DROP_NON_DIGITS)
+    return _NON_DIGITS_RE.sub("", phone)
+
+
+def _phone_defaults() -> tuple[str, str]:
+    """Return the (country, area) code defaults from the environment."""
+    default_country = _digits_only(os.getenv("DEFAULT_COUNTRY_CODE", "1")) or "1"
+    default_area = _digits_only(os.getenv("DEFAULT_AREA_CODE", ""))
+    return default_country, default_area
 
 
 def normalize_phone(phone: str) -> str:
@@ -63,7 +138,13 @@ def normalize_phone(phone: str) -> str:
     - 10-digit local numbers get default country code (defaults to +1).
     - 7-digit local numbers can be expanded when DEFAULT_AREA_CODE is set.
     """
-    raw = (phone or "").strip()
+    return _normalize_phone((phone or "").strip(), *_phone_defaults())
+
+
+# Both phone helpers are cached on the raw input plus the env defaults, so
+# changing DEFAULT_COUNTRY_CODE / DEFAULT_AREA_CODE never serves stale results.
+@lru_cache(maxsize=4096)
+def _normalize_phone(raw: str, default_country: str, default_area: str) -> str:
     if not raw:
         return raw
 
@@ -74,9 +155,6 @@ def normalize_phone(phone: str) -> str:
     if raw.startswith("+"):
         return f"+{digits}"
 
-    default_country = _digits_only(os.getenv("DEFAULT_COUNTRY_CODE", "1")) or "1"
-    default_area = _digits_only(os.getenv("DEFAULT_AREA_CODE", ""))
-
     if len(digits) == 7 and default_area:
         digits = f"{default_area}{digits}"
 
@@ -92,15 +170,19 @@ def normalize_phone(phone: str) -> str:
     return digits
 
 
-def _phone_lookup_candidates(phone: str) -> list[str]:
-    raw = (phone or "").strip()
+def _phone_lookup_candidates(phone: str) -> tuple[str, ...]:
+    return _lookup_candidates((phone or "").strip(), *_phone_defaults())
+
+
+@lru_cache(maxsize=4096)
+def _lookup_candidates(
+    raw: str, default_country: str, default_area: str
+) -> tuple[str, ...]:
     if not raw:
-        return []
+        return ()
 
     digits = _digits_only(raw)
-    normalized = normalize_phone(raw)
-    default_country = _digits_only(os.getenv("DEFAULT_COUNTRY_CODE", "1")) or "1"
-    default_area = _digits_only(os.getenv("DEFAULT_AREA_CODE", ""))
+    normalized = _normalize_phone(raw, default_country, default_area)
 
     candidates: list[str] = []
 
@@ -127,51 +209,75 @@ def _phone_lookup_candidates(phone: str) -> list[str]:
         add(local_ten)
         add(f"+{default_country}{local_ten}")
 
-    return candidates
+    return tuple(candidates)
+
+
+def _phone_params(candidates: tuple[str, ...]) -> tuple[Optional[str], ...]:
+    """Pad ``candidates`` with NULLs to fill every ``_PHONE_IN`` slot."""
+    return candidates + (None,) * (_PHONE_SLOTS - len(candidates))
 
 
 def create_volunteer(db: sqlite3.Connection, data: VolunteerCreate) -> Volunteer:
     """Insert a new volunteer and return the created record."""
     normalized_phone = normalize_phone(data.phone)
-    cursor = db.execute(
-        "INSERT INTO volunteers (phone, name, is_coordinator, status) VALUES (?, ?, ?, ?)",
-        (normalized_phone, data.name, data.is_coordinator, data.status),
-    )
-    db.commit()
     row = db.execute(
-        "SELECT * FROM volunteers WHERE id = ?", (cursor.lastrowid,)
+        _SQL_INSERT_VOLUNTEER,
+        (normalized_phone, data.name, data.is_coordinator, data.status),
     ).fetchone()
     return _row_to_volunteer(row)
 
 
+def normalize_stored_phones(db: sqlite3.Connection) -> int:
+    """Rewrite stored phones in normalized form. Returns the number changed.
+
+    create_volunteer already normalizes, so this only touches rows written
+    before it did. create_tables runs it once, when upgrading a database
+    from before schema version 5.
+    """
+    db.create_function("normalize_phone", 1, normalize_phone, deterministic=True)
+    return db.execute(_SQL_NORMALIZE_STORED_PHONES).rowcount
+
+
 def get_volunteer_by_phone(db: sqlite3.Connection, phone: str) -> Optional[Volunteer]:
     """Look up an active (non-removed) volunteer by phone number. Returns None if not found or removed."""
     candidates = _phone_lookup_candidates(phone)
     if not candidates:
         return None
 
-    placeholders = ", ".join("?" for _ in candidates)
-    rows = db.execute(
-        f"SELECT * FROM volunteers WHERE removed_at IS NULL AND phone IN ({placeholders})",
-        tuple(candidates),
-    ).fetchall()
-    if not rows:
+    params = _phone_params(candidates)
+    row = db.execute(_SQL_BEST_MATCH, params + params).fetchone()
+    if row is None:
         return None
-
-    score = {value: idx for idx, value in enumerate(candidates)}
-    best_row = min(rows, key=lambda row: score.get(row["phone"], len(candidates)))
-    return _row_to_volunteer(best_row)
+    return _row_to_volunteer(row)
 
 
 def list_volunteers(db: sqlite3.Connection, status: Optional[str] = None) -> list[Volunteer]:
     """Return all active (non-removed) volunteers, optionally filtered by status."""
     if status is None:
-        rows = db.execute("SELECT * FROM volunteers WHERE removed_at IS NULL").fetchall()
+        cursor = db.execute(_SQL_LIST_ACTIVE_VOLUNTEERS)
     else:
-        rows = db.execute(
-            "SELECT * FROM volunteers WHERE status = ? AND removed_at IS NULL", (status,)
-        ).fetchall()
-    return [_row_to_volunteer(r) for r in rows]
+        cursor = db.execute(_SQL_LIST_ACTIVE_VOLUNTEERS_BY_STATUS, (status,))
+    return [_row_to_volunteer(r) for r in cursor]
+
+
+def list_volunteer_summaries(db: sqlite3.Connection, status: str) -> list[dict]:
+    """Return id/phone/name/is_coordinator/status dicts for active volunteers.
+
+    For JSON list endpoints: skips building full Volunteer models and
+    parsing timestamps the response never includes.
+    """
+    return [
+        {
+            "id": id_,
+            "phone": phone,
+            "name": name,
+            "is_coordinator": bool(is_coordinator),
+            "status": status_,
+        }
+        for id_, phone, name, is_coordinator, status_ in db.execute(
+            _SQL_VOLUNTEER_SUMMARIES_BY_STATUS, (status,)
+        )
+    ]
 
 
 def get_pending_volunteers(db: sqlite3.Connection) -> list[Volunteer]:
@@ -179,50 +285,67 @@ def get_pending_volunteers(db: sqlite3.Connection) -> list[Volunteer]:
     return list_volunteers(db, status="pending")
 
 
-def approve_volunteer(
-    db: sqlite3.Connection, phone: str, approver_id: int
+def _best_match_id_sql(candidates: tuple[str, ...]) -> tuple[str, tuple]:
+    """Return a subquery selecting the id of the best active phone match.
+
+    Mirrors get_volunteer_by_phone: earlier candidates win ties, so UPDATEs
+    keyed on this subquery touch the same row a lookup would return.
+    """
+    params = _phone_params(candidates)
+    return _SQL_BEST_MATCH_ID, params + params
+
+
+def _set_status(
+    db: sqlite3.Connection,
+    phone: str,
+    assignments: str,
+    params: tuple,
+    only_status: Optional[str],
 ) -> Optional[Volunteer]:
-    """Approve a volunteer by phone. Returns the updated volunteer or None if not found."""
-    # Check if volunteer exists
-    vol = get_volunteer_by_phone(db, phone)
-    if vol is None:
+    """Apply ``assignments`` to the volunteer matching ``phone`` in one statement."""
+    candidates = _phone_lookup_candidates(phone)
+    if not candidates:
         return None
 
-    # Update the volunteer
-    db.execute(
-        """UPDATE volunteers
-           SET status = ?, approved_at = CURRENT_TIMESTAMP, approved_by = ?
-           WHERE phone = ?""",
-        ("approved", approver_id, vol.phone),
-    )
-    db.commit()
-
-    # Fetch and return updated volunteer
-    row = db.execute(
-        "SELECT * FROM volunteers WHERE phone = ?", (vol.phone,)
-    ).fetchone()
+    match_sql, match_params = _best_match_id_sql(candidates)
+    sql = f"UPDATE volunteers SET {assignments} WHERE id = {match_sql}"
+    if only_status is not None:
+        sql += " AND status = ?"
+        match_params += (only_status,)
+    row = db.execute(sql + " RETURNING *", params + match_params).fetchone()
+    if row is None:
+        return None
     return _row_to_volunteer(row)
 
 
-def reject_volunteer(db: sqlite3.Connection, phone: str) -> Optional[Volunteer]:
-    """Reject a volunteer by phone. Returns the updated volunteer or None if not found."""
-    # Check if volunteer exists
-    vol = get_volunteer_by_phone(db, phone)
-    if vol is None:
-        return None
+def approve_volunteer(
+    db: sqlite3.Connection,
+    phone: str,
+    approver_id: int,
+    only_status: Optional[str] = None,
+) -> Optional[Volunteer]:
+    """Approve a volunteer by phone. Returns the updated volunteer or None if not found.
 
-    # Update the volunteer
-    db.execute(
-        """UPDATE volunteers SET status = ? WHERE phone = ?""",
-        ("rejected", vol.phone),
+    When ``only_status`` is given, the volunteer is only approved if their
+    current status matches it (e.g. "pending"); otherwise None is returned.
+    """
+    return _set_status(
+        db,
+        phone,
+        "status = 'approved', approved_at = CURRENT_TIMESTAMP, approved_by = ?",
+        (approver_id,),
+        only_status,
     )
-    db.commit()
 
-    # Fetch and return updated volunteer
-    row = db.execute(
-        "SELECT * FROM volunteers WHERE phone = ?", (vol.phone,)
-    ).fetchone()
-    return _row_to_volunteer(row)
+
+def reject_volunteer(
+    db: sqlite3.Connection, phone: str, only_status: Optional[str] = None
+) -> Optional[Volunteer]:
+    """Reject a volunteer by phone. Returns the updated volunteer or None if not found.
+
+    ``only_status`` restricts the update the same way as in approve_volunteer.
+    """
+    return _set_status(db, phone, "status = 'rejected'", (), only_status)
 
 
 def remove_volunteer(db: sqlite3.Connection, phone: str) -> Optional[Volunteer]:
@@ -230,17 +353,4 @@ def remove_volunteer(db: sqlite3.Connection, phone: str) -> Optional[Volunteer]:
 
     Returns the updated volunteer, or None if not found or already removed.
     """
-    vol = get_volunteer_by_phone(db, phone)
-    if vol is None:
-        return None
-
-    db.execute(
-        "UPDATE volunteers SET removed_at = CURRENT_TIMESTAMP WHERE phone = ?",
-        (vol.phone,),
-    )
-    db.commit()
-
-    row = db.execute(
-        "SELECT * FROM volunteers WHERE phone = ?", (vol.phone,)
-    ).fetchone()
-    return _row_to_volunteer(row)
+    return _set_status(db, phone, "removed_at = CURRENT_TIMESTAMP", (), None)
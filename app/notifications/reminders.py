@@ -1,23 +1,29 @@
 from __future__ import annotations
 
-import os
-from datetime import date, timedelta
 import sqlite3
+import threading
+from datetime import date, timedelta
 from typing import Iterable
 
 from apscheduler.schedulers.base import BaseScheduler
 
-from app.db import get_db_connection
-from app.notifications.sender import send_message
+from app.models.notification import NotificationCreate, create_notifications_bulk
+from app.models.shift import SHIFT_LABELS
+from app.notifications.sender import deliver_notifications
+
+
+# Both jobs fire at 09:00 on the scheduler's shared connection; running them
+# one at a time keeps their transactions from interleaving.
+_run_lock = threading.Lock()
 
 
-def schedule_shift_reminders(scheduler: BaseScheduler) -> None:
+def schedule_shift_reminders(scheduler: BaseScheduler, db: sqlite3.Connection) -> None:
     scheduler.add_job(
         run_shift_reminders,
         "cron",
         hour=9,
         minute=0,
-        args=[7],
+        args=[7, db],
         id="shift-reminder-7d",
         replace_existing=True,
     )
@@ -26,43 +32,67 @@ def schedule_shift_reminders(scheduler: BaseScheduler) -> None:
         "cron",
         hour=9,
         minute=0,
-        args=[1],
+        args=[1, db],
         id="shift-reminder-1d",
         replace_existing=True,
     )
 
 
-def run_shift_reminders(days_ahead: int) -> None:
-    db_path = os.getenv("DB_PATH", "cc-vol.db")
-    db = get_db_connection(db_path)
-    try:
+def run_shift_reminders(days_ahead: int, db: sqlite3.Connection) -> None:
+    with _run_lock:
         _send_reminders_for_date(db, date.today() + timedelta(days=days_ahead), days_ahead)
-    finally:
-        db.close()
+
+
+def _reminder_message(shift_type: str, shift_date: date, days_ahead: int) -> str:
+    shift_label = SHIFT_LABELS.get(shift_type, "Robe")
+    if days_ahead == 1:
+        return f"Reminder: You are scheduled for {shift_label} shift tomorrow ({shift_date})."
+    return (
+        f"Reminder: You are scheduled for {shift_label} shift on {shift_date} "
+        f"({days_ahead} days from now)."
+    )
 
 
 def _send_reminders_for_date(db: sqlite3.Connection, shift_date: date, days_ahead: int) -> None:
     rows = _get_signups_for_date(db, shift_date.isoformat())
-    for row in rows:
-        shift_label = "Kakad" if row["shift_type"] == "kakad" else "Robe"
-        if days_ahead == 1:
-            message = f"Reminder: You are scheduled for {shift_label} shift tomorrow ({shift_date})."
-        else:
-            message = (
-                f"Reminder: You are scheduled for {shift_label} shift on {shift_date} "
-                f"({days_ahead} days from now)."
-            )
+    # Only two messages are possible for a date, so one query finds every
+    # reminder already sent for it.
+    messages = {
+        shift_type: _reminder_message(shift_type, shift_date, days_ahead)
+        for shift_type in ("kakad", "robe")
+    }
+    already_sent = _sent_reminders(db, messages.values())
 
-        if _notification_exists(db, row["volunteer_id"], message):
+    pending: list[tuple[str, NotificationCreate]] = []
+    for row in rows:
+        message = messages[row["shift_type"]]
+        if (row["volunteer_id"], message) in already_sent:
             continue
 
-        send_message(db, row["volunteer_id"], message, notification_type="reminder")
+        pending.append(
+            (
+                row["phone"],
+                NotificationCreate(
+                    volunteer_id=row["volunteer_id"], type="reminder", message=message
+                ),
+            )
+        )
+
+    # Record every reminder in one transaction, then send them concurrently.
+    ids = create_notifications_bulk(db, [item for _, item in pending])
+    deliver_notifications(
+        db,
+        [
+            (notification_id, phone, item.message)
+            for (phone, item), notification_id in zip(pending, ids)
+        ],
+    )
 
 
 def _get_signups_for_date(db: sqlite3.Connection, shift_date: str) -> Iterable[sqlite3.Row]:
     return db.execute(
         """
-        SELECT v.id AS volunteer_id, s.shift_type
+        SELECT v.id AS volunteer_id, v.phone, s.shift_type
         FROM signups su
         JOIN shifts s ON s.id = su.shift_id
         JOIN volunteers v ON v.id = su.volunteer_id
@@ -72,13 +102,17 @@ def _get_signups_for_date(db: sqlite3.Connection, shift_date: str) -> Iterable[s
     ).fetchall()
 
 
-def _notification_exists(db: sqlite3.Connection, volunteer_id: int, message: str) -> bool:
-    row = db.execute(
-        """
-        SELECT 1 FROM notifications
-        WHERE volunteer_id = ? AND type = 'reminder' AND message = ?
-        LIMIT 1
+def _sent_reminders(
+    db: sqlite3.Connection, messages: Iterable[str]
+) -> set[tuple[int, str]]:
+    """Return the (volunteer_id, message) pairs already sent as reminders."""
+    messages = tuple(messages)
+    placeholders = ", ".join("?" for _ in messages)
+    cursor = db.execute(
+        f"""
+        SELECT volunteer_id, message FROM notifications
+        WHERE type = 'reminder' AND message IN ({placeholders})
         """,
-        (volunteer_id, message),
-    ).fetchone()
-    return row is not None
+        messages,
+    )
+    return {(r["volunteer_id"], r["message"]) for r in cursor}
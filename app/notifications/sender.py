@@ -1,14 +1,27 @@
 import os
 import sqlite3
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse, urlunparse
 import httpx
 
-from app.models.notification import NotificationCreate, create_notification, mark_sent, mark_error
-from app.models.volunteer import get_volunteer_by_phone, Volunteer, normalize_phone
+from app.db import get_db_connection, immediate_transaction
+from app.models.notification import (
+    NotificationCreate,
+    create_delivered_notification,
+    mark_error,
+    mark_sent,
+)
+from app.models.volunteer import get_volunteer_by_phone, normalize_phone
 
 
+_LINE_SUFFIX_RE = re.compile(r"\s*\(line\s*\d+\)\s*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4)
 def _normalized_service_url(raw: Optional[str], default_url: str, default_internal_port: int) -> str:
     """Normalize env-provided service URL values into a valid base URL.
 
@@ -21,7 +34,7 @@ def _normalized_service_url(raw: Optional[str], default_url: str, default_intern
     if not value:
         return default_url
 
-    value = re.sub(r"\s*\(line\s*\d+\)\s*$", "", value, flags=re.IGNORECASE)
+    value = _LINE_SUFFIX_RE.sub("", value)
 
     if "://" not in value:
         value = f"http://{value}"
@@ -47,6 +60,36 @@ def _normalized_service_url(raw: Optional[str], default_url: str, default_intern
     return urlunparse((scheme, netloc, path, "", "", ""))
 
 
+# Upper bound on simultaneous WA Bridge requests from deliver_notifications.
+BRIDGE_CONCURRENCY = 10
+
+# One keep-alive client for every WA Bridge call, so repeated sends reuse
+# the same TCP connection. Created on first use; closed on app shutdown.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _http_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=30,
+                    limits=httpx.Limits(max_keepalive_connections=BRIDGE_CONCURRENCY),
+                )
+    return _client
+
+
+def close_http_client() -> None:
+    """Close the shared WA Bridge client, if one was opened."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
 def send_message(
     db: sqlite3.Connection,
     volunteer_id: int,
@@ -57,68 +100,156 @@ def send_message(
     Send a message to a volunteer via WA Bridge.
 
     Steps:
-    1. Look up volunteer by ID to get phone
-    2. Create notification record in DB
-    3. Call WA_BRIDGE_URL POST /send with phone and message
-    4. Mark notification as sent or error
+    1. Look up the volunteer's phone by ID
+    2. Call WA_BRIDGE_URL POST /send with phone and message
+    3. Record the notification, already marked sent or errored, in one INSERT
 
     Returns:
         dict with keys: success (bool), notification_id (int), error (str or None)
     """
     # Step 1: Look up volunteer by ID
-    volunteer = _get_volunteer_by_id(db, volunteer_id)
-    if volunteer is None:
+    phone = _get_volunteer_phone(db, volunteer_id)
+    if phone is None:
         return {"success": False, "notification_id": None, "error": f"Volunteer {volunteer_id} not found"}
 
-    # Step 2: Create notification record
+    # Step 2: Call WA Bridge
+    error = _post_to_bridge(phone, message)
+
+    # Step 3: Record the notification with its outcome
     notif_data = NotificationCreate(
         volunteer_id=volunteer_id,
         type=notification_type,
         message=message,
     )
-    notification = create_notification(db, notif_data)
+    # The connection may be the shared writer; take its lock for the insert.
+    with immediate_transaction(db):
+        notification = create_delivered_notification(db, notif_data, error)
+    return {
+        "success": error is None,
+        "notification_id": notification.id,
+        "error": error,
+    }
 
-    # Step 3: Call WA Bridge
-    wa_bridge_url = _normalized_service_url(
-        os.getenv("WA_BRIDGE_URL"),
+
+@lru_cache(maxsize=4)
+def _send_endpoint(wa_bridge_url: Optional[str]) -> str:
+    """Return the WA Bridge /send URL for a raw WA_BRIDGE_URL value."""
+    base = _normalized_service_url(
+        wa_bridge_url,
         default_url="http://localhost:3000",
         default_internal_port=8080,
     )
-    endpoint = f"{wa_bridge_url}/send"
+    return f"{base}/send"
+
 
+def _post_to_bridge(phone: str, message: str) -> Optional[str]:
+    """POST one message to the WA Bridge. Returns the error text, or None."""
+    endpoint = _send_endpoint(os.getenv("WA_BRIDGE_URL"))
     payload = {
-        "phone": normalize_phone(volunteer.phone),
+        "phone": normalize_phone(phone),
         "message": message,
     }
 
     try:
-        response = httpx.post(endpoint, json=payload, timeout=30)
+        response = _http_client().post(endpoint, json=payload)
         response.raise_for_status()
-
-        # Step 4a: Mark as sent
-        mark_sent(db, notification.id)
-        return {
-            "success": True,
-            "notification_id": notification.id,
-            "error": None,
-        }
     except (httpx.RequestError, httpx.HTTPStatusError) as e:
-        error_msg = str(e)
-        mark_error(db, notification.id, error_msg)
-        return {
-            "success": False,
-            "notification_id": notification.id,
-            "error": error_msg,
-        }
+        return str(e)
+    return None
+
+
+def _record_delivery(
+    db: sqlite3.Connection, notification_id: int, error: Optional[str]
+) -> dict:
+    if error is None:
+        mark_sent(db, notification_id)
+    else:
+        mark_error(db, notification_id, error)
+    return {
+        "success": error is None,
+        "notification_id": notification_id,
+        "error": error,
+    }
+
+
+def deliver_notification(
+    db: sqlite3.Connection,
+    notification_id: int,
+    phone: str,
+    message: str,
+) -> dict:
+    """POST an already-recorded notification to the WA Bridge.
+
+    Marks the notification as sent or errored and returns the same dict
+    shape as send_message.
+    """
+    return _record_delivery(db, notification_id, _post_to_bridge(phone, message))
+
+
+def deliver_notifications(
+    db: sqlite3.Connection, deliveries: list[tuple[int, str, str]]
+) -> list[dict]:
+    """Deliver many ``(notification_id, phone, message)`` at once.
+
+    Up to BRIDGE_CONCURRENCY requests are in flight on worker threads; the
+    connection is only used from the calling thread, which records every
+    outcome in one transaction afterwards. Returns one send_message-style
+    dict per delivery, in order.
+    """
+    if not deliveries:
+        return []
+    workers = min(BRIDGE_CONCURRENCY, len(deliveries))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wa-send") as pool:
+        errors = list(pool.map(lambda d: _post_to_bridge(d[1], d[2]), deliveries))
+    with immediate_transaction(db):
+        return [
+            _record_delivery(db, notification_id, error)
+            for (notification_id, _, _), error in zip(deliveries, errors)
+        ]
+
+
+# Outbound sends that shouldn't hold up a reply (e.g. welcome messages).
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wa-send")
+
+
+def _send_with_own_connection(
+    db_path: str,
+    volunteer_id: int,
+    message: str,
+    notification_type: str,
+) -> dict:
+    db = get_db_connection(db_path)
+    try:
+        result = send_message(db, volunteer_id, message, notification_type=notification_type)
+    except Exception as exc:
+        result = {"success": False, "notification_id": None, "error": str(exc)}
+    finally:
+        db.close()
+    if not result["success"]:
+        print(f"Background {notification_type} to volunteer {volunteer_id} failed: {result['error']}")
+    return result
+
+
+def send_message_in_background(
+    db_path: str,
+    volunteer_id: int,
+    message: str,
+    notification_type: str = "alert",
+) -> Future:
+    """Queue send_message on a worker thread and return immediately.
 
+    sqlite3 connections shouldn't be shared across threads, so the worker
+    opens its own connection to ``db_path``. Failures are printed rather
+    than raised; the notification row records the error either way.
+    """
+    return _EXECUTOR.submit(
+        _send_with_own_connection, db_path, volunteer_id, message, notification_type
+    )
 
-def _get_volunteer_by_id(db: sqlite3.Connection, volunteer_id: int) -> Optional[Volunteer]:
-    """Helper to get a volunteer by ID (not by phone)."""
+
+def _get_volunteer_phone(db: sqlite3.Connection, volunteer_id: int) -> Optional[str]:
+    """Helper to get a volunteer's phone by ID (not by phone)."""
     row = db.execute(
-        "SELECT * FROM volunteers WHERE id = ?", (volunteer_id,)
+        "SELECT phone FROM volunteers WHERE id = ?", (volunteer_id,)
     ).fetchone()
-    if row is None:
-        return None
-
-    from app.models.volunteer import _row_to_volunteer
-    return _row_to_volunteer(row)
+    return None if row is None else row["phone"]
@@ -6,12 +6,11 @@ import sqlite3
 from datetime import date
 from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from app.models.shift import get_shifts_by_date
-from app.models.signup import get_active_signups_by_shift
-from app.rules.queries import get_total_count
+from app.models.shift import month_bounds
+from app.routes.deps import get_reader_db, get_tx
 from app.seed import seed_month
 
 router = APIRouter(prefix="/api/coordinator", tags=["coordinator"])
@@ -19,10 +18,6 @@ router = APIRouter(prefix="/api/coordinator", tags=["coordinator"])
 RUNNING_MAX = 8
 
 
-def _get_db(request: Request) -> sqlite3.Connection:
-    return request.app.state.db
-
-
 # ---------------------------------------------------------------------------
 # GET /status
 # ---------------------------------------------------------------------------
@@ -38,8 +33,8 @@ class ShiftStatus(BaseModel):
 
 @router.get("/status", response_model=list[ShiftStatus])
 def coordinator_status(
-    request: Request,
     date: Optional[str] = Query(default=None, description="Date in YYYY-MM-DD format"),
+    db: sqlite3.Connection = Depends(get_reader_db),
 ):
     """Return shifts for a date with fill status."""
     if date is None:
@@ -54,25 +49,35 @@ def coordinator_status(
                 content={"detail": f"Invalid date format: {date}. Expected YYYY-MM-DD."},
             )
 
-    db = request.app.state.db
-    shifts = get_shifts_by_date(db, target_date)
-
-    result = []
-    for shift in shifts:
-        active_signups = get_active_signups_by_shift(db, shift.id)
-        signup_count = len(active_signups)
-        result.append(
-            ShiftStatus(
-                id=shift.id,
-                date=shift.date,
-                type=shift.type,
-                capacity=shift.capacity,
-                signup_count=signup_count,
-                status="filled" if signup_count >= shift.capacity else "open",
-            )
-        )
+    rows = db.execute(
+        """
+        SELECT
+            sh.id,
+            sh.date,
+            sh.shift_type AS type,
+            sh.capacity,
+            COUNT(s.id) AS signup_count
+        FROM shifts sh
+        LEFT JOIN signups s
+            ON s.shift_id = sh.id AND s.dropped_at IS NULL
+        WHERE sh.date = ?
+        GROUP BY sh.id
+        ORDER BY sh.shift_type
+        """,
+        (target_date.isoformat(),),
+    )
 
-    return result
+    return [
+        ShiftStatus(
+            id=row["id"],
+            date=row["date"],
+            type=row["type"],
+            capacity=row["capacity"],
+            signup_count=row["signup_count"],
+            status="filled" if row["signup_count"] >= row["capacity"] else "open",
+        )
+        for row in rows
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -91,9 +96,13 @@ class ShiftGap(BaseModel):
 @router.get("/gaps", response_model=list[ShiftGap])
 def get_gaps(
     month: str = Query(..., pattern=r"^\d{4}-\d{2}$"),
-    db: sqlite3.Connection = Depends(_get_db),
+    db: sqlite3.Connection = Depends(get_reader_db),
 ) -> list[ShiftGap]:
     """Return shifts where signup_count < capacity (unfilled shifts)."""
+    mo = int(month[5:7])
+    if mo < 1 or mo > 12:
+        raise HTTPException(status_code=400, detail="month must be 01-12")
+
     rows = db.execute(
         """
         SELECT
@@ -105,13 +114,13 @@ def get_gaps(
         FROM shifts sh
         LEFT JOIN signups s
             ON s.shift_id = sh.id AND s.dropped_at IS NULL
-        WHERE sh.date LIKE ?
+        WHERE sh.date >= ? AND sh.date < ?
         GROUP BY sh.id
         HAVING signup_count < sh.capacity
         ORDER BY sh.date, sh.shift_type
         """,
-        (f"{month}-%",),
-    ).fetchall()
+        month_bounds(int(month[:4]), mo),
+    )
 
     return [
         ShiftGap(
@@ -140,8 +149,8 @@ class AvailableVolunteer(BaseModel):
 
 @router.get("/volunteers/available", response_model=list[AvailableVolunteer])
 def get_available_volunteers(
-    request: Request,
     date_param: str = Query(..., alias="date"),
+    db: sqlite3.Connection = Depends(get_reader_db),
 ):
     """Return volunteers who could still sign up for the given month.
 
@@ -153,32 +162,37 @@ def get_available_volunteers(
     except (ValueError, TypeError):
         raise HTTPException(status_code=422, detail="Invalid date format. Use YYYY-MM-DD.")
 
-    db: sqlite3.Connection = request.app.state.db
-    year = target_date.year
-    month = target_date.month
-
-    rows = db.execute("SELECT id, name, phone FROM volunteers").fetchall()
-
-    available: list[AvailableVolunteer] = []
-    for row in rows:
-        total = get_total_count(db, row["id"], year, month)
-        if total < RUNNING_MAX:
-            available.append(
-                AvailableVolunteer(
-                    id=row["id"],
-                    name=row["name"],
-                    phone=row["phone"],
-                    total_signups=total,
-                    remaining_slots=RUNNING_MAX - total,
-                )
-            )
+    # Signups are joined to shifts only within the month, so COUNT(sh.id)
+    # ignores signups for other months.
+    rows = db.execute(
+        """
+        SELECT v.id, v.name, v.phone, COUNT(sh.id) AS total
+        FROM volunteers v
+        LEFT JOIN signups s
+            ON s.volunteer_id = v.id AND s.dropped_at IS NULL
+        LEFT JOIN shifts sh
+            ON sh.id = s.shift_id AND sh.date >= ? AND sh.date < ?
+        GROUP BY v.id
+        HAVING total < ?
+        ORDER BY v.id
+        """,
+        (*month_bounds(target_date.year, target_date.month), RUNNING_MAX),
+    )
 
-    return available
+    return [
+        AvailableVolunteer(
+            id=row["id"],
+            name=row["name"],
+            phone=row["phone"],
+            total_signups=row["total"],
+            remaining_slots=RUNNING_MAX - row["total"],
+        )
+        for row in rows
+    ]
 
 
 @router.post("/seed/{year}/{month}")
-def seed_month_shifts(year: int, month: int, request: Request):
+def seed_month_shifts(year: int, month: int, db: sqlite3.Connection = Depends(get_tx)):
     """Seed shifts for a given month. Idempotent."""
-    db = request.app.state.db
     created = seed_month(db, year, month)
     return {"created": created, "month": f"{year:04d}-{month:02d}"}
@@ -0,0 +1,43 @@
+"""Shared FastAPI dependencies for the route modules."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator
+
+from fastapi import Request
+
+from app.db import immediate_transaction
+
+
+@contextmanager
+def reader_connection(request: Request) -> Iterator[sqlite3.Connection]:
+    """Check out a read-only connection from the app's pool.
+
+    Falls back to ``app.state.db`` when there is no pool or it has been
+    swapped for another connection (as the tests do).
+    """
+    state = request.app.state
+    pool = getattr(state, "pool", None)
+    if pool is None or pool.writer is not state.db:
+        yield state.db
+        return
+    with pool.reader() as conn:
+        yield conn
+
+
+def get_reader_db(request: Request) -> Iterator[sqlite3.Connection]:
+    """Yield a pooled read-only connection for endpoints that never write."""
+    with reader_connection(request) as conn:
+        yield conn
+
+
+def get_tx(request: Request) -> Iterator[sqlite3.Connection]:
+    """Yield the app connection inside one request-wide transaction.
+
+    Everything the endpoint writes commits together when it returns, or is
+    rolled back if it raises (including HTTPException).
+    """
+    with immediate_transaction(request.app.state.db) as conn:
+        yield conn
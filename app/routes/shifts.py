@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import re
+import sqlite3
 from datetime import date
+from itertools import groupby
+from operator import itemgetter
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from app.models.shift import get_shifts_by_date, get_shifts_by_month
-from app.models.signup import get_active_signups_by_shift
+from app.models.shift import month_bounds
+from app.routes.deps import get_reader_db
 
 
 router = APIRouter(prefix="/api/shifts", tags=["shifts"])
@@ -18,6 +20,8 @@ router = APIRouter(prefix="/api/shifts", tags=["shifts"])
 # ---------------------------------------------------------------------------
 # Response schemas
 # ---------------------------------------------------------------------------
+# Endpoints return plain dicts; FastAPI validates and serializes them
+# against these models in one pydantic-core pass.
 
 class VolunteerBrief(BaseModel):
     id: int
@@ -25,6 +29,14 @@ class VolunteerBrief(BaseModel):
     phone: str
 
 
+class ShiftSummary(BaseModel):
+    id: int
+    date: str
+    type: str
+    capacity: int
+    signup_count: int
+
+
 class ShiftDetail(BaseModel):
     id: int
     date: date
@@ -34,78 +46,100 @@ class ShiftDetail(BaseModel):
 
 
 # ---------------------------------------------------------------------------
-# Dependency
+# Endpoints
 # ---------------------------------------------------------------------------
+# The queries below read through plain tuple cursors (row_factory=None) and
+# index columns by position, skipping a sqlite3.Row per result row.
 
-def _get_db(request: Request):
-    return request.app.state.db
+_SUMMARY_FIELDS = ("id", "date", "type", "capacity", "signup_count")
 
 
-# ---------------------------------------------------------------------------
-# Endpoints
-# ---------------------------------------------------------------------------
+def _tuple_cursor(db: sqlite3.Connection) -> sqlite3.Cursor:
+    cur = db.cursor()
+    cur.row_factory = None
+    return cur
 
-@router.get("", response_model=None)
-def list_shifts(request: Request, month: str = Query(..., description="YYYY-MM")):
-    """Return shifts for a given month with signup counts."""
-    if not re.match(r"^\d{4}-\d{2}$", month):
-        raise HTTPException(status_code=400, detail="month must be YYYY-MM format")
 
-    year_str, month_str = month.split("-")
-    year = int(year_str)
-    mo = int(month_str)
+def _parse_month(month: str) -> tuple[int, int]:
+    """Split a "YYYY-MM" string into (year, month), raising 400 if malformed."""
+    digits = month[:4] + month[5:]
+    if len(month) != 7 or month[4] != "-" or not (digits.isascii() and digits.isdigit()):
+        raise HTTPException(status_code=400, detail="month must be YYYY-MM format")
 
+    mo = int(month[5:])
     if mo < 1 or mo > 12:
         raise HTTPException(status_code=400, detail="month must be 01-12")
+    return int(month[:4]), mo
 
-    db = request.app.state.db
-    shifts = get_shifts_by_month(db, year, mo)
-
-    results = []
-    for s in shifts:
-        row = db.execute(
-            "SELECT COUNT(*) as cnt FROM signups WHERE shift_id = ? AND dropped_at IS NULL",
-            (s.id,),
-        ).fetchone()
-        signup_count = row["cnt"] if row else 0
-
-        results.append(
-            {
-                "id": s.id,
-                "date": s.date.isoformat(),
-                "type": s.type,
-                "capacity": s.capacity,
-                "signup_count": signup_count,
-            }
-        )
 
-    return results
+@router.get("", response_model=list[ShiftSummary])
+def list_shifts(
+    month: str = Query(..., description="YYYY-MM"),
+    db: sqlite3.Connection = Depends(get_reader_db),
+):
+    """Return shifts for a given month with signup counts."""
+    year, mo = _parse_month(month)
+
+    rows = _tuple_cursor(db).execute(
+        """
+        SELECT
+            sh.id,
+            sh.date,
+            sh.shift_type AS type,
+            sh.capacity,
+            COUNT(s.id) AS signup_count
+        FROM shifts sh
+        LEFT JOIN signups s
+            ON s.shift_id = sh.id AND s.dropped_at IS NULL
+        WHERE sh.date >= ? AND sh.date < ?
+        GROUP BY sh.date, sh.shift_type
+        ORDER BY sh.date, sh.shift_type
+        """,
+        month_bounds(year, mo),
+    )
+
+    return [dict(zip(_SUMMARY_FIELDS, row)) for row in rows]
 
 
 @router.get("/{date}", response_model=list[ShiftDetail])
-def get_day_detail(date: date, db=Depends(_get_db)):
+def get_day_detail(date: date, db: sqlite3.Connection = Depends(get_reader_db)):
     """Return all shifts for a given date with signed-up volunteers."""
-    shifts = get_shifts_by_date(db, date)
+    rows = _tuple_cursor(db).execute(
+        """
+        SELECT
+            sh.id,
+            sh.date,
+            sh.shift_type AS type,
+            sh.capacity,
+            v.id AS volunteer_id,
+            v.name,
+            v.phone
+        FROM shifts sh
+        LEFT JOIN signups s
+            ON s.shift_id = sh.id AND s.dropped_at IS NULL
+        LEFT JOIN volunteers v
+            ON v.id = s.volunteer_id
+        WHERE sh.date = ?
+        ORDER BY sh.shift_type, s.signed_up_at
+        """,
+        (date.isoformat(),),
+    )
+
     result = []
-    for shift in shifts:
-        active = get_active_signups_by_shift(db, shift.id)
-        volunteers = []
-        for signup in active:
-            row = db.execute(
-                "SELECT id, name, phone FROM volunteers WHERE id = ?",
-                (signup.volunteer_id,),
-            ).fetchone()
-            if row:
-                volunteers.append(
-                    VolunteerBrief(id=row["id"], name=row["name"], phone=row["phone"])
-                )
+    for (shift_id, shift_date, shift_type, capacity), group in groupby(
+        rows, key=itemgetter(0, 1, 2, 3)
+    ):
         result.append(
-            ShiftDetail(
-                id=shift.id,
-                date=shift.date,
-                type=shift.type,
-                capacity=shift.capacity,
-                volunteers=volunteers,
-            )
+            {
+                "id": shift_id,
+                "date": shift_date,
+                "type": shift_type,
+                "capacity": capacity,
+                "volunteers": [
+                    {"id": r[4], "name": r[5], "phone": r[6]}
+                    for r in group
+                    if r[4] is not None
+                ],
+            }
         )
     return result
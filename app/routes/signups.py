@@ -6,19 +6,22 @@ import sqlite3
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
-from pydantic import BaseModel
-
-from app.models.signup import SignupCreate, create_signup, drop_signup
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel, Field
+
+from app.bot.auth import get_coordinator_id
+from app.db import immediate_transaction
+from app.models.notification import NotificationCreate, create_notifications_bulk
+from app.models.shift import SHIFT_LABELS
+from app.models.signup import SignupCreate, create_signup
 from app.models.volunteer import get_volunteer_by_phone
 from app.rules.validator import validate_signup
-from app.notifications.sender import send_message
+from app.notifications.sender import deliver_notifications, send_message
 
 router = APIRouter(prefix="/api/signups", tags=["signups"])
 
-
-def _get_db(request: Request) -> sqlite3.Connection:
-    return request.app.state.db
+# These endpoints all use the app's single writer connection, so they read
+# it straight off app.state instead of going through a Depends() callable.
 
 
 class SignupRequest(BaseModel):
@@ -26,6 +29,20 @@ class SignupRequest(BaseModel):
     shift_id: int
 
 
+def _parse_ymd(value: str) -> date:
+    """Parse a strict ``YYYY-MM-DD`` string, raising ValueError otherwise.
+
+    Cheaper than ``date.fromisoformat``, which also probes the other ISO
+    8601 forms it accepts.
+    """
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(f"Invalid date: {value!r}")
+    y, m, d = value[:4], value[5:7], value[8:]
+    if not (y.isdigit() and m.isdigit() and d.isdigit()):
+        raise ValueError(f"Invalid date: {value!r}")
+    return date(int(y), int(m), int(d))
+
+
 def _recent_drop_alert_exists(db: sqlite3.Connection, coordinator_id: int, message: str) -> bool:
     row = db.execute(
         """
@@ -43,105 +60,228 @@ def _recent_drop_alert_exists(db: sqlite3.Connection, coordinator_id: int, messa
     return row is not None
 
 
+def _drop_alert_message(
+    volunteer_name: str, volunteer_phone: str, shift_date: str, shift_type: str
+) -> str:
+    shift_label = SHIFT_LABELS.get(shift_type, "Robe")
+    return f"{volunteer_name} ({volunteer_phone}) dropped {shift_label} shift on {shift_date}"
+
+
+def _within_alert_window(shift_date: str, today: date) -> bool:
+    """Only drops of shifts at most 7 days out alert the coordinator."""
+    return _parse_ymd(shift_date).toordinal() - today.toordinal() <= 7
+
+
+def _queue_drop_alerts(
+    db: sqlite3.Connection, drops: list, today: date | None = None
+) -> list[tuple[int, str, str]]:
+    """Insert the coordinator's alerts for ``drops`` and return the deliveries.
+
+    ``drops`` are rows or dicts with volunteer_name, volunteer_phone,
+    shift_date and shift_type. Drops more than 7 days out, a missing
+    coordinator, and alerts already sent in the last two minutes produce no
+    alert. Returns ``(notification_id, phone, message)`` tuples for
+    deliver_notifications. Called inside the drop's transaction, so the
+    drop and its alerts commit together.
+    """
+    today = today or date.today()
+    messages = [
+        _drop_alert_message(
+            d["volunteer_name"], d["volunteer_phone"], d["shift_date"], d["shift_type"]
+        )
+        for d in drops
+        if _within_alert_window(d["shift_date"], today)
+    ]
+    if not messages:
+        return []
+
+    coordinator_id = get_coordinator_id(db)
+    if coordinator_id is None:
+        return []
+    messages = [
+        m for m in dict.fromkeys(messages)
+        if not _recent_drop_alert_exists(db, coordinator_id, m)
+    ]
+    if not messages:
+        return []
+
+    phone = db.execute(
+        "SELECT phone FROM volunteers WHERE id = ?", (coordinator_id,)
+    ).fetchone()["phone"]
+    ids = create_notifications_bulk(
+        db,
+        [NotificationCreate(volunteer_id=coordinator_id, type="alert", message=m) for m in messages],
+    )
+    return [(notification_id, phone, m) for notification_id, m in zip(ids, messages)]
+
+
 def _notify_coordinator_drop(
     db: sqlite3.Connection,
     volunteer_name: str,
     volunteer_phone: str,
     shift_date: str,
     shift_type: str,
+    today: date | None = None,
 ) -> dict:
-    """Notify coordinator for drops within 7 days. Never raises on "no-op" cases."""
-    shift_day = date.fromisoformat(shift_date)
-    if (shift_day - date.today()).days > 7:
-        return {"success": False, "message": "Drop is more than 7 days away; no notification sent."}
+    """Notify coordinator for drops within 7 days. Never raises on "no-op" cases.
 
-    coordinator_row = db.execute(
-        "SELECT id FROM volunteers WHERE is_coordinator = 1 AND removed_at IS NULL LIMIT 1"
-    ).fetchone()
-    if coordinator_row is None:
+    Applies the same rules as _queue_drop_alerts, checking the first two up
+    front only to say why nothing was sent.
+    """
+    today = today or date.today()
+    if not _within_alert_window(shift_date, today):
+        return {"success": False, "message": "Drop is more than 7 days away; no notification sent."}
+    if get_coordinator_id(db) is None:
         return {"success": False, "message": "No coordinator found"}
 
-    coordinator_id = coordinator_row["id"]
-    shift_label = "Kakad" if shift_type == "kakad" else "Robe"
-    message = f"{volunteer_name} ({volunteer_phone}) dropped {shift_label} shift on {shift_date}"
-
-    if _recent_drop_alert_exists(db, coordinator_id, message):
+    drop = {
+        "volunteer_name": volunteer_name,
+        "volunteer_phone": volunteer_phone,
+        "shift_date": shift_date,
+        "shift_type": shift_type,
+    }
+    with immediate_transaction(db):
+        deliveries = _queue_drop_alerts(db, [drop], today)
+    if not deliveries:
         return {"success": True, "message": "Drop alert already sent recently"}
-
-    return send_message(db, coordinator_id, message, notification_type="alert")
+    return deliver_notifications(db, deliveries)[0]
 
 
 @router.post("", status_code=201)
-def post_signup(body: SignupRequest, db: sqlite3.Connection = Depends(_get_db)):
+def post_signup(body: SignupRequest, request: Request):
+    db = request.app.state.db
     # Look up volunteer by phone
     volunteer = get_volunteer_by_phone(db, body.volunteer_phone)
     if volunteer is None:
         raise HTTPException(status_code=404, detail="Volunteer not found")
 
-    # Look up shift by id
-    row = db.execute(
-        "SELECT id, shift_type, date FROM shifts WHERE id = ?", (body.shift_id,)
-    ).fetchone()
-    if row is None:
-        raise HTTPException(status_code=404, detail="Shift not found")
-
-    # Check for duplicate signup
-    existing = db.execute(
-        "SELECT id FROM signups WHERE volunteer_id = ? AND shift_id = ? AND dropped_at IS NULL",
-        (volunteer.id, body.shift_id),
-    ).fetchone()
-    if existing is not None:
-        raise HTTPException(status_code=409, detail="Duplicate signup")
-
-    # Validate rules
-    violations = validate_signup(db, volunteer.id, body.shift_id)
-    if violations:
-        raise HTTPException(
-            status_code=422,
-            detail=[{"reason": v.reason} for v in violations],
+    # Shift lookup, duplicate check, rule validation and insert run in one
+    # transaction that holds the writer's lock, so a concurrent request
+    # waits and then sees this one's insert; the confirmation is sent after
+    # the lock is released.
+    with immediate_transaction(db):
+        # Look up the shift and any active signup for it in one query
+        row = db.execute(
+            """
+            SELECT sh.shift_type, sh.date, su.id AS active_signup_id
+            FROM shifts sh
+            LEFT JOIN signups su
+                ON su.shift_id = sh.id AND su.volunteer_id = ? AND su.dropped_at IS NULL
+            WHERE sh.id = ?
+            """,
+            (volunteer.id, body.shift_id),
+        ).fetchone()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Shift not found")
+        if row["active_signup_id"] is not None:
+            raise HTTPException(status_code=409, detail="Duplicate signup")
+
+        # Validate rules
+        violations = validate_signup(db, volunteer.id, body.shift_id)
+        if violations:
+            raise HTTPException(
+                status_code=422,
+                detail=[{"reason": v.reason} for v in violations],
+            )
+
+        # Create signup
+        signup = create_signup(
+            db, SignupCreate(volunteer_id=volunteer.id, shift_id=body.shift_id)
         )
 
-    # Create signup
-    signup = create_signup(db, SignupCreate(volunteer_id=volunteer.id, shift_id=body.shift_id))
-
-    shift_label = "Kakad" if row["shift_type"] == "kakad" else "Robe"
+    shift_label = SHIFT_LABELS.get(row["shift_type"], "Robe")
     message = f"Signup confirmed: {shift_label} shift on {row['date']}."
     send_message(db, volunteer.id, message, notification_type="alert")
 
     return signup.model_dump()
 
 
+# Context for the coordinator's drop alert, returned by the drop UPDATEs.
+_DROP_RETURNING = """
+    RETURNING
+        id AS signup_id,
+        (SELECT date FROM shifts WHERE id = signups.shift_id) AS shift_date,
+        (SELECT shift_type FROM shifts WHERE id = signups.shift_id) AS shift_type,
+        (SELECT name FROM volunteers WHERE id = signups.volunteer_id) AS volunteer_name,
+        (SELECT phone FROM volunteers WHERE id = signups.volunteer_id) AS volunteer_phone
+"""
+
+
+def _drop_signups(
+    db: sqlite3.Connection, signup_ids: list[int]
+) -> tuple[list[int], list[tuple[int, str, str]]]:
+    """Drop the given active signups and queue their coordinator alerts.
+
+    The UPDATE ... RETURNING and the alert inserts share one transaction.
+    A failure while queueing alerts is rolled back to a savepoint and
+    printed, so it never blocks the drop. Returns the dropped ids and the
+    deliveries to send once the transaction has committed.
+    """
+    placeholders = ",".join("?" * len(signup_ids))
+    with immediate_transaction(db):
+        rows = db.execute(
+            "UPDATE signups SET dropped_at = CURRENT_TIMESTAMP "
+            f"WHERE id IN ({placeholders}) AND dropped_at IS NULL" + _DROP_RETURNING,
+            signup_ids,
+        ).fetchall()
+        db.execute("SAVEPOINT drop_alerts")
+        try:
+            deliveries = _queue_drop_alerts(db, rows)
+        except Exception as exc:
+            db.execute("ROLLBACK TO drop_alerts")
+            print(f"Drop notification failed for signups {signup_ids}: {exc}")
+            deliveries = []
+        db.execute("RELEASE drop_alerts")
+    return [row["signup_id"] for row in rows], deliveries
+
+
+def _deliver_drop_alerts(db: sqlite3.Connection, deliveries: list[tuple[int, str, str]]) -> None:
+    try:
+        deliver_notifications(db, deliveries)
+    except Exception as exc:
+        # Notification failure should not block dropping the shift.
+        print(f"Drop notification delivery failed: {exc}")
+
+
 @router.delete("/{signup_id}", status_code=204)
-def delete_signup(signup_id: int, db: sqlite3.Connection = Depends(_get_db)):
+def delete_signup(signup_id: int, request: Request):
     """Drop a signup (soft-delete by setting dropped_at)."""
-    row = db.execute(
-        """
-        SELECT su.id, su.dropped_at, sh.date AS shift_date, sh.shift_type, v.name AS volunteer_name, v.phone AS volunteer_phone
-        FROM signups su
-        JOIN shifts sh ON sh.id = su.shift_id
-        JOIN volunteers v ON v.id = su.volunteer_id
-        WHERE su.id = ? AND su.dropped_at IS NULL
-        """,
-        (signup_id,),
-    ).fetchone()
-    if row is None:
+    db = request.app.state.db
+    # No dropped id means the signup doesn't exist or was already dropped.
+    dropped, deliveries = _drop_signups(db, [signup_id])
+    if not dropped:
         raise HTTPException(status_code=404, detail="Signup not found")
 
-    drop_signup(db, signup_id)
-    try:
-        _notify_coordinator_drop(
-            db,
-            volunteer_name=row["volunteer_name"],
-            volunteer_phone=row["volunteer_phone"],
-            shift_date=row["shift_date"],
-            shift_type=row["shift_type"],
-        )
-    except Exception as exc:
-        # Notification failure should not block dropping the shift.
-        print(f"Drop notification failed for signup {signup_id}: {exc}")
+    _deliver_drop_alerts(db, deliveries)
     return Response(status_code=204)
 
 
+# Most signups one batch drop may name; keeps the IN list well under
+# SQLite's bound-parameter limit.
+BATCH_DROP_MAX = 500
+
+
+class BatchDropRequest(BaseModel):
+    signup_ids: list[int] = Field(max_length=BATCH_DROP_MAX)
+
+
+@router.post("/batch-drop", status_code=200)
+def batch_drop_signups(body: BatchDropRequest, request: Request):
+    """Drop several signups at once and alert the coordinator in one batch.
+
+    Signups that don't exist or are already dropped are skipped; the
+    response lists the ids that were actually dropped.
+    """
+    db = request.app.state.db
+    signup_ids = list(dict.fromkeys(body.signup_ids))
+    if not signup_ids:
+        return {"dropped": []}
+
+    dropped, deliveries = _drop_signups(db, signup_ids)
+    _deliver_drop_alerts(db, deliveries)
+    return {"dropped": sorted(dropped)}
+
+
 class NotifyDropRequest(BaseModel):
     volunteer_phone: str
     shift_date: str
@@ -149,10 +289,11 @@ class NotifyDropRequest(BaseModel):
 
 
 @router.post("/notify-drop", status_code=200)
-def notify_coordinator_drop(body: NotifyDropRequest, db: sqlite3.Connection = Depends(_get_db)):
+def notify_coordinator_drop(body: NotifyDropRequest, request: Request):
     """Notify a coordinator via WhatsApp that a volunteer dropped a shift within a week."""
+    db = request.app.state.db
     try:
-        date.fromisoformat(body.shift_date)
+        _parse_ymd(body.shift_date)
     except ValueError:
         raise HTTPException(status_code=422, detail="Invalid shift_date format. Use YYYY-MM-DD.")
 
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+import datetime as dt
+import sqlite3
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 
-from app.models.volunteer import get_volunteer_by_phone, create_volunteer, VolunteerCreate, list_volunteers, remove_volunteer
-from app.models.signup import get_signups_by_volunteer
-from app.models.shift import Shift
+from app.bot.auth import invalidate_volunteer_cache
+from app.models.volunteer import get_volunteer_by_phone, create_volunteer, VolunteerCreate, list_volunteer_summaries, remove_volunteer
+from app.models.signup import get_active_signups_with_shifts
+from app.routes.deps import get_reader_db, get_tx
 
 router = APIRouter(prefix="/api/volunteers", tags=["volunteers"])
 
@@ -19,13 +21,21 @@ router = APIRouter(prefix="/api/volunteers", tags=["volunteers"])
 # Response schemas
 # ---------------------------------------------------------------------------
 
+class VolunteerSummary(BaseModel):
+    id: int
+    phone: str
+    name: str
+    is_coordinator: bool
+    status: str
+
+
 class ShiftDetail(BaseModel):
     shift_id: int
-    date: date
+    date: dt.date
     type: str
     capacity: int
     signup_id: int
-    signed_up_at: datetime
+    signed_up_at: dt.datetime
 
 
 # ---------------------------------------------------------------------------
@@ -33,34 +43,34 @@ class ShiftDetail(BaseModel):
 # ---------------------------------------------------------------------------
 
 @router.post("", status_code=201)
-def add_volunteer(body: VolunteerCreate, request: Request):
+def add_volunteer(body: VolunteerCreate, db: sqlite3.Connection = Depends(get_tx)):
     """Register a new volunteer."""
-    db = request.app.state.db
     existing = get_volunteer_by_phone(db, body.phone)
     if existing:
         raise HTTPException(status_code=409, detail="Phone already registered")
     vol = create_volunteer(db, body)
+    invalidate_volunteer_cache()
     return {"id": vol.id, "phone": vol.phone, "name": vol.name, "is_coordinator": vol.is_coordinator}
 
 
-@router.get("")
-def get_volunteers(request: Request, status: Optional[str] = Query(None)):
+@router.get("", response_model=list[VolunteerSummary])
+def get_volunteers(
+    status: Optional[str] = Query(None),
+    db: sqlite3.Connection = Depends(get_reader_db),
+):
     """List all volunteers.
 
     By default returns only approved volunteers.
     Coordinators can use ?status= to filter by a specific status.
     """
-    db = request.app.state.db
     # If no status parameter provided, default to showing only approved volunteers
     filter_status = status if status is not None else "approved"
-    vols = list_volunteers(db, status=filter_status)
-    return [{"id": v.id, "phone": v.phone, "name": v.name, "is_coordinator": v.is_coordinator, "status": v.status} for v in vols]
+    return list_volunteer_summaries(db, filter_status)
 
 
 @router.delete("/{volunteer_id}", status_code=204)
-def delete_volunteer(volunteer_id: int, request: Request):
+def delete_volunteer(volunteer_id: int, db: sqlite3.Connection = Depends(get_tx)):
     """Delete a volunteer and their active signups."""
-    db = request.app.state.db
     row = db.execute("SELECT id FROM volunteers WHERE id = ?", (volunteer_id,)).fetchone()
     if row is None:
         raise HTTPException(status_code=404, detail="Volunteer not found")
@@ -68,48 +78,34 @@ def delete_volunteer(volunteer_id: int, request: Request):
     db.execute("DELETE FROM notifications WHERE volunteer_id = ?", (volunteer_id,))
     db.execute("UPDATE volunteers SET approved_by = NULL WHERE approved_by = ?", (volunteer_id,))
     db.execute("DELETE FROM volunteers WHERE id = ?", (volunteer_id,))
-    db.commit()
+    invalidate_volunteer_cache()
 
 
 @router.get("/{phone}/shifts", response_model=list[ShiftDetail])
 def get_volunteer_shifts(
     phone: str,
-    request: Request,
     month: str = Query(..., pattern=r"^\d{4}-\d{2}$"),
+    db: sqlite3.Connection = Depends(get_reader_db),
 ):
     """Return active shifts for a volunteer in a given month."""
-    db = request.app.state.db
+    mo = int(month[5:7])
+    if mo < 1 or mo > 12:
+        raise HTTPException(status_code=400, detail="month must be 01-12")
 
     volunteer = get_volunteer_by_phone(db, phone)
     if volunteer is None:
         raise HTTPException(status_code=404, detail="Volunteer not found")
 
-    signups = get_signups_by_volunteer(db, volunteer.id, month)
-    active = [s for s in signups if s.dropped_at is None]
-
-    results: list[ShiftDetail] = []
-    for signup in active:
-        row = db.execute(
-            "SELECT * FROM shifts WHERE id = ?", (signup.shift_id,)
-        ).fetchone()
-        if row is None:
-            continue
-        shift = Shift(
-            id=row["id"],
-            date=date.fromisoformat(row["date"]),
-            type=row["shift_type"],
-            capacity=row["capacity"],
-            created_at=row["created_at"],
-        )
-        results.append(
-            ShiftDetail(
-                shift_id=shift.id,
-                date=shift.date,
-                type=shift.type,
-                capacity=shift.capacity,
-                signup_id=signup.id,
-                signed_up_at=signup.signed_up_at,
-            )
-        )
-
-    return results
+    # Plain dicts: FastAPI validates and serializes them against
+    # ShiftDetail in one pydantic-core pass.
+    return [
+        {
+            "shift_id": row["shift_id"],
+            "date": row["date"],
+            "type": row["shift_type"],
+            "capacity": row["capacity"],
+            "signup_id": row["signup_id"],
+            "signed_up_at": row["signed_up_at"],
+        }
+        for row in get_active_signups_with_shifts(db, volunteer.id, month)
+    ]
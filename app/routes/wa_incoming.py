@@ -5,7 +5,10 @@ Receives messages from the WA bridge and dispatches to the correct handler.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+import json
+
+import anyio
+from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel
 
 from app.bot.auth import get_volunteer_context
@@ -15,11 +18,10 @@ from app.bot.handlers.vol_drop import handle_drop
 from app.bot.handlers.vol_query import handle_my_shifts, handle_shifts
 from app.bot.handlers.coordinator import handle_status, handle_gaps, handle_find_sub
 from app.bot.handlers.registration import handle_register, handle_approve, handle_reject, handle_pending
+from app.routes.deps import reader_connection
 
 router = APIRouter(tags=["whatsapp"])
 
-COORDINATOR_COMMANDS = {"status", "gaps", "find_sub", "approve", "reject", "pending"}
-
 HELP_TEXT = (
     "Available commands:\n"
     "- register <your name>\n"
@@ -38,18 +40,37 @@ HELP_TEXT = (
     "- reject <phone>"
 )
 
-HANDLERS = {
-    "signup": handle_signup,
-    "drop": handle_drop,
-    "my_shifts": handle_my_shifts,
-    "shifts": handle_shifts,
-    "status": handle_status,
-    "gaps": handle_gaps,
-    "find_sub": handle_find_sub,
-    "register": handle_register,
-    "approve": handle_approve,
-    "reject": handle_reject,
-    "pending": handle_pending,
+
+# Replies that never change are serialized once. Each request still gets
+# its own Response, since middleware may add headers to it.
+def _reply_bytes(text: str) -> bytes:
+    return json.dumps({"reply": text}).encode()
+
+
+_HELP_REPLY = _reply_bytes(HELP_TEXT)
+_UNREGISTERED_REPLY = _reply_bytes("Send 'register <your name>' to join the volunteer program.")
+_UNKNOWN_REPLY = _reply_bytes("Unknown command. Send 'help' for a list of commands.")
+_COORDINATOR_ONLY_REPLY = _reply_bytes("That command is for coordinators only.")
+
+
+def _fixed_reply(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+
+# command -> (handler, coordinator_only, read_only). Read-only commands
+# never write and run on a pooled read-only connection.
+DISPATCH = {
+    "signup": (handle_signup, False, False),
+    "drop": (handle_drop, False, False),
+    "my_shifts": (handle_my_shifts, False, True),
+    "shifts": (handle_shifts, False, True),
+    "status": (handle_status, True, True),
+    "gaps": (handle_gaps, True, True),
+    "find_sub": (handle_find_sub, True, True),
+    "register": (handle_register, False, False),
+    "approve": (handle_approve, True, False),
+    "reject": (handle_reject, True, False),
+    "pending": (handle_pending, True, True),
 }
 
 
@@ -59,7 +80,15 @@ class IncomingMessage(BaseModel):
 
 
 @router.post("/api/wa/incoming")
-def wa_incoming(body: IncomingMessage, request: Request):
+async def wa_incoming(body: IncomingMessage, request: Request):
+    # Handlers are blocking sqlite code, so they run on a worker thread.
+    # app.state.bot_limiter (set at startup) caps how many do at once so a
+    # burst of webhooks can't take every thread from the other endpoints.
+    limiter = getattr(request.app.state, "bot_limiter", None)
+    return await anyio.to_thread.run_sync(_handle_message, body, request, limiter=limiter)
+
+
+def _handle_message(body: IncomingMessage, request: Request) -> dict | Response:
     db = request.app.state.db
 
     # 1. Auth: look up volunteer by phone
@@ -75,24 +104,29 @@ def wa_incoming(body: IncomingMessage, request: Request):
     if context is None:
         # Allow help and register for unauthenticated users
         if parsed.command_type == "help":
-            return {"reply": HELP_TEXT}
+            return _fixed_reply(_HELP_REPLY)
         if parsed.command_type == "register":
             result = handle_register(db, body.phone, parsed.args)
             return {"reply": result}
         # Other commands require authentication
-        return {"reply": "Send 'register <your name>' to join the volunteer program."}
+        return _fixed_reply(_UNREGISTERED_REPLY)
 
-    # 4. Check coordinator-only commands
-    if parsed.command_type in COORDINATOR_COMMANDS and not context.is_coordinator:
-        return {"reply": "That command is for coordinators only."}
-
-    # 5. Route to handler
+    # 4. Route to handler
     if parsed.command_type == "help":
-        return {"reply": HELP_TEXT}
-
-    handler = HANDLERS.get(parsed.command_type)
-    if handler is None:
-        return {"reply": "Unknown command. Send 'help' for a list of commands."}
-
-    result = handler(db, context, parsed.args)
+        return _fixed_reply(_HELP_REPLY)
+
+    entry = DISPATCH.get(parsed.command_type)
+    if entry is None:
+        return _fixed_reply(_UNKNOWN_REPLY)
+    handler, coordinator_only, read_only = entry
+
+    # 5. Check coordinator-only commands
+    if coordinator_only and not context.is_coordinator:
+        return _fixed_reply(_COORDINATOR_ONLY_REPLY)
+
+    if read_only:
+        with reader_connection(request) as reader:
+            result = handler(reader, context, parsed.args)
+    else:
+        result = handler(db, context, parsed.args)
     return {"reply": result}
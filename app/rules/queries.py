@@ -1,6 +1,11 @@
 """DB query functions for rule validation counts.
 
-All queries exclude dropped signups (dropped_at IS NOT NULL).
+All queries exclude dropped signups (dropped_at IS NOT NULL). Month filters
+are ``sh.date >= ? AND sh.date < ?`` ranges from ``month_bounds`` so they can
+use ``idx_shifts_date_type``.
+
+Each statement is a module-level constant, so every call hands sqlite3 the
+same text and reuses the connection's cached prepared statement.
 """
 
 from __future__ import annotations
@@ -8,93 +13,93 @@ from __future__ import annotations
 import sqlite3
 from datetime import date
 
+from app.models.shift import month_bounds
+
+
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+_SQL_MONTH_COUNT = """
+    SELECT COUNT(*) AS cnt FROM signups s
+    JOIN shifts sh ON s.shift_id = sh.id
+    WHERE s.volunteer_id = ?
+      AND s.dropped_at IS NULL
+      AND sh.date >= ? AND sh.date < ?
+"""
+_SQL_KAKAD_COUNT = _SQL_MONTH_COUNT + "  AND sh.shift_type = 'kakad'"
+_SQL_ROBE_COUNT = _SQL_MONTH_COUNT + "  AND sh.shift_type = 'robe'"
+_SQL_THURSDAY_COUNT = _SQL_MONTH_COUNT + "  AND strftime('%w', sh.date) = '4'"
+_SQL_MONTH_COUNTS = """
+    SELECT
+        COUNT(*) AS total,
+        COALESCE(SUM(sh.shift_type = 'kakad'), 0) AS kakad,
+        COALESCE(SUM(sh.shift_type = 'robe'), 0) AS robe,
+        COALESCE(SUM(strftime('%w', sh.date) = '4'), 0) AS thursday
+    FROM signups s
+    JOIN shifts sh ON s.shift_id = sh.id
+    WHERE s.volunteer_id = ?
+      AND s.dropped_at IS NULL
+      AND sh.date >= ? AND sh.date < ?
+"""
+_SQL_SHIFT_SIGNUP_COUNT = (
+    "SELECT COUNT(*) AS cnt FROM signups WHERE shift_id = ? AND dropped_at IS NULL"
+)
+_SQL_SHIFT_CAPACITY = "SELECT capacity FROM shifts WHERE id = ?"
+
+
+# ---------------------------------------------------------------------------
+# Query functions
+# ---------------------------------------------------------------------------
+
+def _month_count(
+    db: sqlite3.Connection, sql: str, volunteer_id: int, year: int, month: int
+) -> int:
+    start, end = month_bounds(year, month)
+    return db.execute(sql, (volunteer_id, start, end)).fetchone()[0]
+
 
 def get_kakad_count(db: sqlite3.Connection, volunteer_id: int, year: int, month: int) -> int:
     """Count active kakad signups for volunteer in given month."""
-    prefix = f"{year:04d}-{month:02d}-%"
-    row = db.execute(
-        """
-        SELECT COUNT(*) AS cnt FROM signups s
-        JOIN shifts sh ON s.shift_id = sh.id
-        WHERE s.volunteer_id = ?
-          AND s.dropped_at IS NULL
-          AND sh.date LIKE ?
-          AND sh.shift_type = 'kakad'
-        """,
-        (volunteer_id, prefix),
-    ).fetchone()
-    return row["cnt"]
+    return _month_count(db, _SQL_KAKAD_COUNT, volunteer_id, year, month)
 
 
 def get_robe_count(db: sqlite3.Connection, volunteer_id: int, year: int, month: int) -> int:
     """Count active robe signups for volunteer in given month."""
-    prefix = f"{year:04d}-{month:02d}-%"
-    row = db.execute(
-        """
-        SELECT COUNT(*) AS cnt FROM signups s
-        JOIN shifts sh ON s.shift_id = sh.id
-        WHERE s.volunteer_id = ?
-          AND s.dropped_at IS NULL
-          AND sh.date LIKE ?
-          AND sh.shift_type = 'robe'
-        """,
-        (volunteer_id, prefix),
-    ).fetchone()
-    return row["cnt"]
+    return _month_count(db, _SQL_ROBE_COUNT, volunteer_id, year, month)
 
 
 def get_total_count(db: sqlite3.Connection, volunteer_id: int, year: int, month: int) -> int:
     """Count all active signups for volunteer in given month."""
-    prefix = f"{year:04d}-{month:02d}-%"
-    row = db.execute(
-        """
-        SELECT COUNT(*) AS cnt FROM signups s
-        JOIN shifts sh ON s.shift_id = sh.id
-        WHERE s.volunteer_id = ?
-          AND s.dropped_at IS NULL
-          AND sh.date LIKE ?
-        """,
-        (volunteer_id, prefix),
-    ).fetchone()
-    return row["cnt"]
+    return _month_count(db, _SQL_MONTH_COUNT, volunteer_id, year, month)
 
 
 def get_thursday_count(db: sqlite3.Connection, volunteer_id: int, year: int, month: int) -> int:
     """Count active Thursday signups for volunteer in given month."""
-    prefix = f"{year:04d}-{month:02d}-%"
-    row = db.execute(
-        """
-        SELECT COUNT(*) AS cnt FROM signups s
-        JOIN shifts sh ON s.shift_id = sh.id
-        WHERE s.volunteer_id = ?
-          AND s.dropped_at IS NULL
-          AND sh.date LIKE ?
-          AND strftime('%w', sh.date) = '4'
-        """,
-        (volunteer_id, prefix),
-    ).fetchone()
-    return row["cnt"]
+    return _month_count(db, _SQL_THURSDAY_COUNT, volunteer_id, year, month)
+
+
+def get_month_counts(
+    db: sqlite3.Connection, volunteer_id: int, year: int, month: int
+) -> dict[str, int]:
+    """Return the volunteer's active signup counts for a month in one query.
+
+    Keys are ``total``, ``kakad``, ``robe`` and ``thursday``, matching the
+    single-count functions above.
+    """
+    start, end = month_bounds(year, month)
+    row = db.execute(_SQL_MONTH_COUNTS, (volunteer_id, start, end)).fetchone()
+    return dict(row)
 
 
 def get_shift_signup_count(db: sqlite3.Connection, shift_id: int) -> int:
     """Count active signups for a specific shift."""
-    row = db.execute(
-        """
-        SELECT COUNT(*) AS cnt FROM signups
-        WHERE shift_id = ?
-          AND dropped_at IS NULL
-        """,
-        (shift_id,),
-    ).fetchone()
-    return row["cnt"]
+    return db.execute(_SQL_SHIFT_SIGNUP_COUNT, (shift_id,)).fetchone()[0]
 
 
 def get_shift_capacity(db: sqlite3.Connection, shift_id: int) -> int:
     """Get capacity of a specific shift."""
-    row = db.execute(
-        "SELECT capacity FROM shifts WHERE id = ?",
-        (shift_id,),
-    ).fetchone()
+    row = db.execute(_SQL_SHIFT_CAPACITY, (shift_id,)).fetchone()
     if row is None:
         raise ValueError(f"Shift {shift_id} not found")
     return row["capacity"]
@@ -21,27 +21,38 @@ from app.rules.pure import (
     get_signup_phase,
 )
 from app.rules.queries import (
-    get_kakad_count,
-    get_robe_count,
+    get_month_counts,
     get_shift_capacity,
-    get_shift_signup_count,
-    get_thursday_count,
     get_total_count,
 )
 
 
-def _get_shift_details(db: sqlite3.Connection, shift_id: int) -> dict:
-    """Fetch shift date, shift_type, and capacity from the DB."""
+def _get_signup_context(db: sqlite3.Connection, volunteer_id: int, shift_id: int) -> dict:
+    """Fetch the volunteer's status and the shift's details in one query.
+
+    ``status`` is None for an unknown volunteer. Raises ValueError if the
+    shift doesn't exist.
+    """
     row = db.execute(
-        "SELECT date, shift_type, capacity FROM shifts WHERE id = ?",
-        (shift_id,),
+        """
+        SELECT
+            (SELECT status FROM volunteers WHERE id = ?) AS status,
+            sh.date,
+            sh.shift_type,
+            sh.capacity,
+            (SELECT COUNT(*) FROM signups
+             WHERE shift_id = sh.id AND dropped_at IS NULL) AS shift_signups
+        FROM (SELECT 1)
+        LEFT JOIN shifts sh ON sh.id = ?
+        """,
+        (volunteer_id, shift_id),
     ).fetchone()
-    if row is None:
-        raise ValueError(f"Shift {shift_id} not found")
     return {
-        "date": date.fromisoformat(row["date"]),
+        "status": row["status"],
+        "date": None if row["date"] is None else date.fromisoformat(row["date"]),
         "shift_type": row["shift_type"],
         "capacity": row["capacity"],
+        "shift_signups": row["shift_signups"],
     }
 
 
@@ -50,16 +61,18 @@ def validate_signup(
     volunteer_id: int,
     shift_id: int,
     today: date | None = None,
+    fail_fast: bool = False,
 ) -> list[RuleResult]:
     """Validate a signup attempt and return a list of violations.
 
-    An empty list means the signup is allowed.
+    An empty list means the signup is allowed. With ``fail_fast`` only the
+    first violation found is returned, and a full shift skips the
+    per-volunteer month counts; use it when only allowed/denied matters.
     """
+    ctx = _get_signup_context(db, volunteer_id, shift_id)
+
     # Check if volunteer is approved
-    volunteer = db.execute(
-        "SELECT * FROM volunteers WHERE id = ?", (volunteer_id,)
-    ).fetchone()
-    if volunteer is None or volunteer["status"] != "approved":
+    if ctx["status"] != "approved":
         return [
             RuleResult(
                 allowed=False,
@@ -67,10 +80,11 @@ def validate_signup(
             )
         ]
 
-    shift = _get_shift_details(db, shift_id)
-    shift_date: date = shift["date"]
-    shift_type: str = shift["shift_type"]
-    capacity: int = shift["capacity"]
+    if ctx["date"] is None:
+        raise ValueError(f"Shift {shift_id} not found")
+    shift_date: date = ctx["date"]
+    shift_type: str = ctx["shift_type"]
+    capacity: int = ctx["capacity"]
 
     month_start = shift_date.replace(day=1)
     year, month = month_start.year, month_start.month
@@ -85,10 +99,11 @@ def validate_signup(
         return [RuleResult(allowed=False, reason="Signups for this month are not open yet")]
 
     # --- Capacity is always checked ---
-    shift_signups = get_shift_signup_count(db, shift_id)
-    cap_result = check_capacity(shift_signups, capacity)
+    cap_result = check_capacity(ctx["shift_signups"], capacity)
     if not cap_result.allowed:
         violations.append(cap_result)
+        if fail_fast:
+            return violations
 
     # Mid-month: only capacity matters
     if phase == SignupPhase.MID_MONTH:
@@ -96,34 +111,23 @@ def validate_signup(
 
     # --- Phase 1 rules ---
     if phase == SignupPhase.PHASE_1:
-        total = get_total_count(db, volunteer_id, year, month)
-        r = check_phase1_total(total)
-        if not r.allowed:
-            violations.append(r)
-
+        counts = get_month_counts(db, volunteer_id, year, month)
+        checks = [check_phase1_total(counts["total"])]
         if shift_type == "kakad":
-            kakad = get_kakad_count(db, volunteer_id, year, month)
-            r = check_kakad_limit(kakad)
-            if not r.allowed:
-                violations.append(r)
-
+            checks.append(check_kakad_limit(counts["kakad"]))
         if shift_type == "robe":
-            robe = get_robe_count(db, volunteer_id, year, month)
-            r = check_robe_limit(robe)
-            if not r.allowed:
-                violations.append(r)
-
+            checks.append(check_robe_limit(counts["robe"]))
         if shift_date.weekday() == 3:  # 3 = Thursday
-            thurs = get_thursday_count(db, volunteer_id, year, month)
-            r = check_thursday_limit(thurs)
-            if not r.allowed:
-                violations.append(r)
-
-    # --- Phase 2 rules: ceiling raised to 8 total ---
-    if phase == SignupPhase.PHASE_2:
+            checks.append(check_thursday_limit(counts["thursday"]))
+    else:
+        # --- Phase 2 rules: ceiling raised to 8 total ---
         total = get_total_count(db, volunteer_id, year, month)
-        r = check_running_total(total)
+        checks = [check_running_total(total)]
+
+    for r in checks:
         if not r.allowed:
             violations.append(r)
+            if fail_fast:
+                break
 
     return violations
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import sqlite3
+
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from app.notifications.reminders import schedule_shift_reminders
 
 
-def start_scheduler() -> BackgroundScheduler:
+def start_scheduler(db: sqlite3.Connection) -> BackgroundScheduler:
+    """Start the background jobs; they all run on ``db``."""
     scheduler = BackgroundScheduler(timezone="UTC")
-    schedule_shift_reminders(scheduler)
+    schedule_shift_reminders(scheduler, db)
     scheduler.start()
     return scheduler
 
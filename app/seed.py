@@ -6,7 +6,8 @@ import calendar
 import sqlite3
 from datetime import date, timedelta
 
-from app.models.shift import ShiftCreate, Shift, create_shift, get_robe_capacity, get_shifts_by_month
+from app.db import immediate_transaction
+from app.models.shift import Shift, get_robe_capacity, get_shifts_by_month
 from app.models.signup import SignupCreate, Signup, create_signup, drop_signup, get_signups_by_volunteer
 from app.models.volunteer import (
     Volunteer,
@@ -25,27 +26,24 @@ def seed_month(db: sqlite3.Connection, year: int, month: int) -> int:
     Returns the number of shifts created.
     """
     num_days = calendar.monthrange(year, month)[1]
-    created = 0
-
+    rows = []
     for day in range(1, num_days + 1):
         d = date(year, month, day)
         d_iso = d.isoformat()
-
-        for shift_type, capacity in [
-            ("kakad", 1),
-            ("robe", get_robe_capacity(d.weekday())),
-        ]:
-            existing = db.execute(
-                "SELECT 1 FROM shifts WHERE date = ? AND shift_type = ?",
-                (d_iso, shift_type),
-            ).fetchone()
-            if existing:
-                continue
-
-            create_shift(db, ShiftCreate(date=d, type=shift_type, capacity=capacity))
-            created += 1
-
-    return created
+        rows.append((d_iso, "kakad", 1))
+        rows.append((d_iso, "robe", get_robe_capacity(d.weekday())))
+
+    # One prepared statement for the whole month; UNIQUE(date, shift_type)
+    # skips existing pairs, and rowcount only counts the inserted ones.
+    with immediate_transaction(db):
+        cursor = db.executemany(
+            """
+            INSERT INTO shifts (date, shift_type, capacity) VALUES (?, ?, ?)
+            ON CONFLICT (date, shift_type) DO NOTHING
+            """,
+            rows,
+        )
+    return cursor.rowcount
 
 
 # ---------------------------------------------------------------------------
@@ -112,18 +110,18 @@ def _do_signup(
 
     Returns the Signup if created, None if validation failed.
     """
-    violations = validate_signup(db, volunteer_id, shift.id, today=simulated_today)
-    if violations:
-        return None
-    signup = create_signup(db, SignupCreate(volunteer_id=volunteer_id, shift_id=shift.id))
-    # Override signed_up_at to match the simulated date so phase counting works
-    db.execute(
-        "UPDATE signups SET signed_up_at = ? WHERE id = ?",
-        (simulated_today.isoformat(), signup.id),
-    )
-    db.commit()
-    # Re-read to get updated signed_up_at
-    row = db.execute("SELECT * FROM signups WHERE id = ?", (signup.id,)).fetchone()
+    with immediate_transaction(db):
+        violations = validate_signup(
+            db, volunteer_id, shift.id, today=simulated_today, fail_fast=True
+        )
+        if violations:
+            return None
+        signup = create_signup(db, SignupCreate(volunteer_id=volunteer_id, shift_id=shift.id))
+        # Override signed_up_at to match the simulated date so phase counting works
+        row = db.execute(
+            "UPDATE signups SET signed_up_at = ? WHERE id = ? RETURNING *",
+            (simulated_today.isoformat(), signup.id),
+        ).fetchone()
     return Signup(
         id=row["id"],
         volunteer_id=row["volunteer_id"],
@@ -164,8 +162,7 @@ def seed_signups(db: sqlite3.Connection, year: int, month: int) -> dict[str, lis
     existing_signups = False
     result: dict[str, list[int]] = {}
     for v in volunteers:
-        sups = get_signups_by_volunteer(db, v.id, month_str)
-        active = [s for s in sups if s.dropped_at is None]
+        active = get_signups_by_volunteer(db, v.id, month_str, active_only=True)
         if active:
             existing_signups = True
         result[v.name] = [s.id for s in active]
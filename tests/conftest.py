@@ -1,6 +1,7 @@
 import pytest
 import sqlite3
 
+from app.bot.auth import invalidate_volunteer_cache
 from app.db import get_db_connection, create_tables
 
 
@@ -11,3 +12,11 @@ def db():
     create_tables(conn)
     yield conn
     conn.close()
+
+
+@pytest.fixture(autouse=True)
+def _clear_volunteer_cache():
+    """Tests reuse phone numbers across fresh databases; start each uncached."""
+    invalidate_volunteer_cache()
+    yield
+    invalidate_volunteer_cache()
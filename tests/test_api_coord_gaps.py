@@ -130,3 +130,17 @@ class TestGetGaps:
         assert len(data) == 1
         assert data[0]["signup_count"] == 0
         assert data[0]["gap_size"] == 3
+
+    def test_december_range_stops_at_year_end(self, client):
+        """December's range must not spill into the next January."""
+        db = app.state.db
+        _insert_shift(db, "2026-12-31", "kakad", 1)
+        _insert_shift(db, "2027-01-01", "kakad", 1)
+
+        resp = client.get("/api/coordinator/gaps?month=2026-12")
+        assert resp.status_code == 200
+        assert [g["date"] for g in resp.json()] == ["2026-12-31"]
+
+    def test_month_out_of_range_returns_400(self, client):
+        resp = client.get("/api/coordinator/gaps?month=2026-13")
+        assert resp.status_code == 400
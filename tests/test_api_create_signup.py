@@ -172,3 +172,49 @@ class TestRuleViolation:
         # Check that at least one violation has a reason string
         reasons = [v["reason"] for v in detail]
         assert any("capacity" in r.lower() or "full" in r.lower() for r in reasons)
+
+
+class TestConcurrentSignups:
+    def setup_method(self):
+        _reset_db()
+
+    def test_last_slot_goes_to_exactly_one_request(self):
+        import threading
+        import time
+
+        from app.routes import signups
+
+        shift = _seed_shift(capacity=1)
+        phones = [_seed_volunteer(phone=p, name=p)["phone"] for p in ("1111111111", "2222222222")]
+        start = threading.Barrier(len(phones))
+        statuses = []
+
+        real_validate = signups.validate_signup
+
+        def slow_validate(*args, **kwargs):
+            # Widen the window between the capacity check and the insert.
+            result = real_validate(*args, **kwargs)
+            time.sleep(0.1)
+            return result
+
+        def post(phone):
+            start.wait()
+            resp = client.post("/api/signups", json={
+                "volunteer_phone": phone,
+                "shift_id": shift["id"],
+            })
+            statuses.append(resp.status_code)
+
+        with patch("app.routes.signups.validate_signup", side_effect=slow_validate):
+            threads = [threading.Thread(target=post, args=(p,)) for p in phones]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(5)
+
+        assert sorted(statuses) == [201, 422]
+        active = test_conn.execute(
+            "SELECT COUNT(*) FROM signups WHERE shift_id = ? AND dropped_at IS NULL",
+            (shift["id"],),
+        ).fetchone()[0]
+        assert active == 1
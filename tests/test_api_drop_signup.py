@@ -1,5 +1,6 @@
 """Tests for DELETE /api/signups/{id}."""
 
+import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch
 
@@ -75,8 +76,8 @@ def test_drop_signup_nonexistent():
     assert resp.status_code == 404
 
 
-@patch("app.routes.signups.send_message")
-def test_drop_signup_triggers_notification_when_within_7_days(mock_send):
+@patch("app.routes.signups.deliver_notifications")
+def test_drop_signup_triggers_notification_when_within_7_days(mock_deliver):
     _ensure_db()
     test_conn.execute(
         "INSERT OR IGNORE INTO volunteers (id, phone, name, is_coordinator) VALUES (?, ?, ?, ?)",
@@ -96,8 +97,140 @@ def test_drop_signup_triggers_notification_when_within_7_days(mock_send):
     ).lastrowid
     test_conn.commit()
 
-    mock_send.return_value = {"success": True, "notification_id": 1, "error": None}
+    resp = client.delete(f"/api/signups/{signup_id}")
+    assert resp.status_code == 204
+    assert mock_deliver.call_count == 1
+    (deliveries,) = mock_deliver.call_args.args[1:]
+    assert len(deliveries) == 1
+    # The alert row was committed together with the drop.
+    row = test_conn.execute(
+        "SELECT message FROM notifications WHERE id = ?", (deliveries[0][0],)
+    ).fetchone()
+    assert row["message"] == deliveries[0][2]
+
+
+def test_drop_alert_skipped_more_than_a_week_out():
+    from datetime import date
+
+    from app.routes.signups import _notify_coordinator_drop
+
+    result = _notify_coordinator_drop(
+        test_conn,
+        volunteer_name="Vol1",
+        volunteer_phone="+10000000001",
+        shift_date="2026-02-10",
+        shift_type="kakad",
+        today=date(2026, 2, 2),
+    )
+    assert result == {
+        "success": False,
+        "message": "Drop is more than 7 days away; no notification sent.",
+    }
+
+
+def test_parse_ymd_is_strict():
+    from datetime import date
+
+    from app.routes.signups import _parse_ymd
+
+    assert _parse_ymd("2026-02-10") == date(2026, 2, 10)
+    for bad in ("20260210", "2026-2-10", "2026-02-30", "2026-02-1x", " 2026-02-1"):
+        with pytest.raises(ValueError):
+            _parse_ymd(bad)
+
+
+def test_notify_drop_rejects_bad_date():
+    _ensure_db()
+    resp = client.post(
+        "/api/signups/notify-drop",
+        json={"volunteer_phone": "+10000000001", "shift_date": "20260210", "shift_type": "kakad"},
+    )
+    assert resp.status_code == 422
+
+
+@patch("app.routes.signups.deliver_notifications")
+def test_batch_drop_signups(mock_deliver):
+    from app.bot.auth import invalidate_volunteer_cache
+
+    _ensure_db()
+    invalidate_volunteer_cache()
+    test_conn.execute(
+        "INSERT OR IGNORE INTO volunteers (id, phone, name, is_coordinator) VALUES (?, ?, ?, ?)",
+        (1, "+15104566645", "Coordinator", 1),
+    )
+    test_conn.execute(
+        "INSERT INTO volunteers (id, phone, name) VALUES (?, ?, ?)",
+        (30, "+10000000030", "Vol30"),
+    )
+    test_conn.executemany(
+        "INSERT INTO shifts (id, date, shift_type, capacity) VALUES (?, date('now', ?), ?, ?)",
+        [(130, "+2 day", "robe", 3), (131, "+30 day", "robe", 3)],
+    )
+    near, far = (
+        test_conn.execute(
+            "INSERT INTO signups (volunteer_id, shift_id) VALUES (?, ?)", (30, shift_id)
+        ).lastrowid
+        for shift_id in (130, 131)
+    )
+    test_conn.commit()
+
+    resp = client.post(
+        "/api/signups/batch-drop", json={"signup_ids": [near, far, far, 99999]}
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"dropped": sorted([near, far])}
+
+    # Only the drop within a week alerts the coordinator.
+    (deliveries,) = mock_deliver.call_args.args[1:]
+    assert len(deliveries) == 1
+    _, phone, message = deliveries[0]
+    assert phone == "+15104566645"
+    assert message.startswith("Vol30 (+10000000030) dropped Robe shift on ")
+
+    resp = client.post("/api/signups/batch-drop", json={"signup_ids": [near, far]})
+    assert resp.json() == {"dropped": []}
+
+
+def test_batch_drop_rejects_oversized_request():
+    from app.routes.signups import BATCH_DROP_MAX
+
+    _ensure_db()
+    resp = client.post(
+        "/api/signups/batch-drop", json={"signup_ids": list(range(BATCH_DROP_MAX + 1))}
+    )
+    assert resp.status_code == 422
+
+
+@patch("app.routes.signups.deliver_notifications")
+@patch("app.routes.signups.create_notifications_bulk", side_effect=sqlite3.OperationalError("boom"))
+def test_drop_commits_when_alert_queueing_fails(mock_bulk, mock_deliver):
+    from app.bot.auth import invalidate_volunteer_cache
+
+    _ensure_db()
+    invalidate_volunteer_cache()
+    test_conn.execute(
+        "INSERT OR IGNORE INTO volunteers (id, phone, name, is_coordinator) VALUES (?, ?, ?, ?)",
+        (1, "+15104566645", "Coordinator", 1),
+    )
+    test_conn.execute(
+        "INSERT INTO volunteers (id, phone, name) VALUES (?, ?, ?)",
+        (31, "+10000000031", "Vol31"),
+    )
+    test_conn.execute(
+        "INSERT INTO shifts (id, date, shift_type, capacity) VALUES (?, date('now', '+1 day'), ?, ?)",
+        (132, "robe", 3),
+    )
+    signup_id = test_conn.execute(
+        "INSERT INTO signups (volunteer_id, shift_id) VALUES (?, ?)", (31, 132)
+    ).lastrowid
+    test_conn.commit()
 
     resp = client.delete(f"/api/signups/{signup_id}")
     assert resp.status_code == 204
-    assert mock_send.call_count == 1
+    assert mock_bulk.call_count == 1
+    assert mock_deliver.call_args.args[1] == []
+    assert not test_conn.in_transaction
+    row = test_conn.execute(
+        "SELECT dropped_at FROM signups WHERE id = ?", (signup_id,)
+    ).fetchone()
+    assert row["dropped_at"] is not None
@@ -91,3 +91,12 @@ def test_unknown_phone_returns_404():
     resp = client.get("/api/volunteers/0000000000/shifts?month=2026-02")
     assert resp.status_code == 404
     assert resp.json()["detail"] == "Volunteer not found"
+
+
+def test_month_out_of_range_returns_400():
+    _reset_db()
+    create_volunteer(test_conn, VolunteerCreate(phone="1111111111", name="Sonia"))
+    for month in ("2025-00", "2025-13"):
+        resp = client.get(f"/api/volunteers/1111111111/shifts?month={month}")
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "month must be 01-12"
@@ -17,6 +17,21 @@ def test_healthz():
     assert response.json() == {"status": "ok"}
 
 
+def test_pool_health(monkeypatch):
+    from app.db import ConnectionPool
+
+    pool = ConnectionPool(":memory:")
+    monkeypatch.setattr(app.state, "pool", pool, raising=False)
+    try:
+        response = client.get("/api/debug/pool-health")
+    finally:
+        pool.close()
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+    assert response.json()["max_readers"] == 0
+    assert "db_path" not in response.json()
+
+
 def test_unknown_route_returns_404():
     response = client.get("/nonexistent")
     assert response.status_code == 404
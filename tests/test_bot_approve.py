@@ -112,6 +112,22 @@ class TestHandleApprove:
         assert "Welcome message sent" in result
         assert mock_send.call_count == 1
 
+    @patch("app.bot.handlers.registration.send_message_in_background")
+    @patch("app.bot.handlers.registration.send_message")
+    def test_approve_queues_welcome_for_file_db(self, mock_send, mock_queue, tmp_path):
+        db_path = str(tmp_path / "approve.db")
+        db = get_db_connection(db_path)
+        create_tables(db)
+
+        vol_id = _add_volunteer(db, "+5555555555", "Esha", status="pending")
+
+        result = handle_approve(db, COORD_CTX, {"phone": "+5555555555"})
+        assert "Welcome message queued" in result
+        mock_send.assert_not_called()
+        mock_queue.assert_called_once()
+        assert mock_queue.call_args.args[:2] == (db_path, vol_id)
+        db.close()
+
     def test_approve_already_approved(self):
         """Should return message if already approved."""
         db = get_db_connection(":memory:")
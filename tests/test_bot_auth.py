@@ -1,4 +1,9 @@
-from app.bot.auth import get_volunteer_context, VolunteerContext
+from app.bot.auth import (
+    get_coordinator_id,
+    get_volunteer_context,
+    invalidate_volunteer_cache,
+    VolunteerContext,
+)
 from app.models.volunteer import create_volunteer, VolunteerCreate
 
 
@@ -28,3 +33,77 @@ def test_context_fields_match_volunteer(db):
     assert ctx.volunteer_id == vol.id
     assert ctx.phone == vol.phone
     assert ctx.is_coordinator == vol.is_coordinator
+
+
+def test_context_is_cached_until_invalidated(db):
+    create_volunteer(db, VolunteerCreate(phone="4444", name="Dan", is_coordinator=False))
+    assert get_volunteer_context(db, "4444").is_coordinator is False
+
+    db.execute("UPDATE volunteers SET is_coordinator = 1 WHERE phone = '4444'")
+    assert get_volunteer_context(db, "4444").is_coordinator is False
+
+    invalidate_volunteer_cache()
+    assert get_volunteer_context(db, "4444").is_coordinator is True
+
+
+def test_unknown_phone_miss_is_cleared_by_invalidation(db):
+    assert get_volunteer_context(db, "5555") is None
+    create_volunteer(db, VolunteerCreate(phone="5555", name="Eve"))
+    invalidate_volunteer_cache()
+    assert get_volunteer_context(db, "5555") is not None
+
+
+def test_coordinator_id_is_cached_until_invalidated(db):
+    assert get_coordinator_id(db) is None
+    coord = create_volunteer(db, VolunteerCreate(phone="6666", name="Fay", is_coordinator=True))
+    assert get_coordinator_id(db) is None
+
+    invalidate_volunteer_cache()
+    assert get_coordinator_id(db) == coord.id
+
+
+def test_context_cache_is_bounded(db, monkeypatch):
+    from app.bot import auth
+
+    invalidate_volunteer_cache()
+    monkeypatch.setattr(auth, "CONTEXT_CACHE_MAX", 3)
+    for phone in ("7001", "7002", "7003"):
+        get_volunteer_context(db, phone)
+    assert len(auth._context_cache) == 3
+
+    get_volunteer_context(db, "7004")
+    assert list(auth._context_cache) == ["7004"]
+
+
+def test_prune_tolerates_concurrent_inserts_and_clears():
+    import sys
+    import threading
+
+    from app.bot import auth
+
+    invalidate_volunteer_cache()
+    stop = threading.Event()
+    # Switch threads often so inserts and clears land mid-prune.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def churn():
+        i = 0
+        while not stop.is_set():
+            auth._context_cache[f"new-{i}"] = (0.0, None)
+            i += 1
+            if i % 500 == 0:
+                invalidate_volunteer_cache()
+
+    thread = threading.Thread(target=churn)
+    thread.start()
+    try:
+        for _ in range(200):
+            for i in range(1000):
+                auth._context_cache[f"old-{i}"] = (0.0, None)
+            auth._prune_context_cache(1.0)
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(interval)
+        invalidate_volunteer_cache()
@@ -0,0 +1,15 @@
+"""Tests for helpers shared by the bot handlers."""
+
+from app.bot.handlers.common import month_range
+
+
+def test_month_range():
+    assert month_range("2026-03") == ("2026-03-01", "2026-04-01")
+
+
+def test_month_range_rolls_over_december():
+    assert month_range("2026-12") == ("2026-12-01", "2027-01-01")
+
+
+def test_month_range_accepts_full_date():
+    assert month_range("2026-02-15") == ("2026-02-01", "2026-03-01")
@@ -184,3 +184,40 @@ class TestCoordinatorStatusRoute:
         assert resp.status_code == 200
         reply = resp.json()["reply"]
         assert "Status" in reply or "status" in reply or "kakad" in reply
+
+
+class TestWorkerThreads:
+    def test_handlers_run_under_app_limiter(self, app, db, monkeypatch):
+        import anyio
+
+        from app.routes import wa_incoming
+
+        borrowed = []
+
+        def fake_handler(conn, context, args):
+            borrowed.append(app.state.bot_limiter.borrowed_tokens)
+            return "ok"
+
+        monkeypatch.setitem(wa_incoming.DISPATCH, "my_shifts", (fake_handler, False, True))
+        _add_volunteer(db, "+913333333333", "Vol")
+        with TestClient(app) as client:
+            app.state.bot_limiter = anyio.CapacityLimiter(1)
+            for _ in range(2):
+                resp = client.post(
+                    "/api/wa/incoming",
+                    json={"phone": "+913333333333", "message": "my shifts"},
+                )
+                assert resp.json() == {"reply": "ok"}
+            assert borrowed == [1, 1]
+            assert app.state.bot_limiter.borrowed_tokens == 0
+
+
+class TestFixedReplies:
+    def test_fixed_replies_are_json(self, client, db):
+        _add_volunteer(db, "+914444444444", "Vol")
+        resp = client.post(
+            "/api/wa/incoming",
+            json={"phone": "+914444444444", "message": "pending"},
+        )
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"reply": "That command is for coordinators only."}
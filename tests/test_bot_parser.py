@@ -105,6 +105,11 @@ class TestParseMessageValid:
         assert result.args["date"] == date(2026, 3, 15)
         assert result.args["type"] == "kakad"
 
+    def test_find_sub_rejects_unknown_type(self):
+        result = parse_message("find sub 2026-03-15 morning")
+        assert isinstance(result, ParseError)
+        assert result.suggestions == ["find sub <date> kakad|robe"]
+
     def test_help(self):
         result = parse_message("help")
         assert isinstance(result, ParsedCommand)
@@ -177,6 +182,16 @@ class TestParseErrors:
         assert isinstance(result, ParseError)
         assert "drop" in result.suggestions
 
+    def test_typo_two_word_command(self):
+        result = parse_message("fnd sub 2026-03-15 kakad")
+        assert isinstance(result, ParseError)
+        assert "find sub" in result.suggestions
+
+    def test_typo_lookup_does_not_share_state(self):
+        first = parse_message("drp 2026-03-15 robe")
+        second = parse_message("drp 2026-03-15 robe")
+        assert first.suggestions == second.suggestions == ["drop"]
+
     def test_gibberish(self):
         result = parse_message("blah blah")
         assert isinstance(result, ParseError)
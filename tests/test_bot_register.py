@@ -95,13 +95,13 @@ class TestRegistrationParser:
         """Should parse 'register John Smith' correctly."""
         parsed = parse_message("register John Smith")
         assert parsed.command_type == "register"
-        assert parsed.args["name"] == "john smith"
+        assert parsed.args["name"] == "John Smith"
 
     def test_parse_register_single_name(self):
         """Should parse single name registration."""
         parsed = parse_message("register Alice")
         assert parsed.command_type == "register"
-        assert parsed.args["name"] == "alice"
+        assert parsed.args["name"] == "Alice"
 
     def test_parse_register_without_name(self):
         """Should return error for register without name."""
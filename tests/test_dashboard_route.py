@@ -23,3 +23,13 @@ def test_dashboard_contains_key_elements(client):
     assert "gaps" in html
     assert "volunteers" in html
     assert "main.js" in html
+
+
+def test_dashboard_revalidates_with_etag(client):
+    first = client.get("/dashboard")
+    etag = first.headers["etag"]
+    assert "max-age" in first.headers["cache-control"]
+
+    resp = client.get("/dashboard", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
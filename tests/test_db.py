@@ -0,0 +1,253 @@
+"""Tests for connection setup and schema creation."""
+
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+
+from app.db import (
+    SCHEMA_VERSION,
+    ConnectionPool,
+    create_tables,
+    get_db_connection,
+    immediate_transaction,
+    parse_timestamp,
+)
+
+
+def _index_names(db: sqlite3.Connection) -> set[str]:
+    rows = db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+    ).fetchall()
+    return {r["name"] for r in rows}
+
+
+def test_create_tables_adds_lookup_indexes(db: sqlite3.Connection):
+    names = _index_names(db)
+    assert "idx_signups_shift_active" in names
+    assert "idx_signups_volunteer_shift_active" in names
+    assert "idx_shifts_date_type" in names
+    assert "idx_notifications_volunteer" in names
+    assert "idx_notifications_alert_sent" in names
+
+
+def test_create_tables_skips_current_schema(db: sqlite3.Connection):
+    assert db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    db.execute("DROP INDEX idx_shifts_date_type")
+    create_tables(db)
+    assert "idx_shifts_date_type" not in _index_names(db)
+
+
+def test_upgrade_normalizes_stored_phones_once(db: sqlite3.Connection):
+    db.execute("INSERT INTO volunteers (phone, name) VALUES ('5104566645', 'Legacy')")
+    create_tables(db)
+    assert db.execute("SELECT phone FROM volunteers").fetchone()[0] == "5104566645"
+
+    db.execute("PRAGMA user_version = 4")
+    create_tables(db)
+    assert db.execute("SELECT phone FROM volunteers").fetchone()[0] == "+15104566645"
+    assert db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_active_signup_count_uses_partial_index(db: sqlite3.Connection):
+    plan = db.execute(
+        "EXPLAIN QUERY PLAN "
+        "SELECT COUNT(*) FROM signups WHERE shift_id = ? AND dropped_at IS NULL",
+        (1,),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_signups_shift_active" in details
+
+
+def test_volunteer_signup_join_uses_composite_index(db: sqlite3.Connection):
+    plan = db.execute(
+        "EXPLAIN QUERY PLAN "
+        "SELECT COUNT(*) FROM signups s JOIN shifts sh ON s.shift_id = sh.id "
+        "WHERE s.volunteer_id = ? AND s.dropped_at IS NULL",
+        (1,),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_signups_volunteer_shift_active" in details
+
+
+def test_month_shift_list_is_covered_and_presorted(db: sqlite3.Connection):
+    plan = db.execute(
+        "EXPLAIN QUERY PLAN "
+        "SELECT sh.id, sh.date, sh.shift_type, sh.capacity, COUNT(s.id) "
+        "FROM shifts sh LEFT JOIN signups s "
+        "ON s.shift_id = sh.id AND s.dropped_at IS NULL "
+        "WHERE sh.date >= ? AND sh.date < ? "
+        "GROUP BY sh.date, sh.shift_type ORDER BY sh.date, sh.shift_type",
+        ("2026-03-01", "2026-04-01"),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "COVERING INDEX idx_shifts_date_type" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_drop_alert_dedupe_uses_range_scan(db: sqlite3.Connection):
+    plan = db.execute(
+        "EXPLAIN QUERY PLAN "
+        "SELECT 1 FROM notifications WHERE volunteer_id = ? AND type = 'alert' "
+        "AND message = ? AND sent_at >= datetime('now', '-2 minutes') LIMIT 1",
+        (1, "x"),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_notifications_alert_sent (volunteer_id=? AND sent_at>?)" in details
+
+
+def test_phone_lookup_uses_unique_index(db: sqlite3.Connection):
+    from app.models.volunteer import _SQL_BEST_MATCH
+
+    plan = db.execute("EXPLAIN QUERY PLAN " + _SQL_BEST_MATCH, (None,) * 12).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "sqlite_autoindex_volunteers_1 (phone=?)" in details
+
+
+def test_notifications_by_volunteer_avoids_sort(db: sqlite3.Connection):
+    plan = db.execute(
+        "EXPLAIN QUERY PLAN "
+        "SELECT * FROM notifications WHERE volunteer_id = ? ORDER BY id DESC",
+        (1,),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_notifications_volunteer" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_file_connection_uses_wal(tmp_path):
+    conn = get_db_connection(str(tmp_path / "wal.db"))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    finally:
+        conn.close()
+
+
+def test_memory_connection_keeps_default_journal():
+    conn = get_db_connection(":memory:")
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_immediate_transaction_commits_and_rolls_back(tmp_path):
+    conn = get_db_connection(str(tmp_path / "txn.db"))
+    try:
+        create_tables(conn)
+        with immediate_transaction(conn):
+            conn.execute(
+                "INSERT INTO shifts (date, shift_type) VALUES ('2026-03-01', 'kakad')"
+            )
+        try:
+            with immediate_transaction(conn):
+                conn.execute(
+                    "INSERT INTO shifts (date, shift_type) VALUES ('2026-03-02', 'kakad')"
+                )
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert not conn.in_transaction
+        dates = [r["date"] for r in conn.execute("SELECT date FROM shifts")]
+        assert dates == ["2026-03-01"]
+    finally:
+        conn.close()
+
+
+def test_immediate_transaction_does_not_join_other_threads(tmp_path):
+    from app.models.signup import SignupCreate, create_signup
+
+    pool = ConnectionPool(str(tmp_path / "race.db"), readers=1)
+    db = pool.writer
+    try:
+        create_tables(db)
+        db.execute("INSERT INTO volunteers (id, phone, name) VALUES (1, '+1', 'A')")
+        db.execute("INSERT INTO shifts (id, date, shift_type) VALUES (1, '2026-03-01', 'kakad')")
+
+        a_open = threading.Event()
+        b_done = threading.Event()
+
+        def thread_a():
+            try:
+                with immediate_transaction(db):
+                    a_open.set()
+                    # B must not finish while A's transaction is open.
+                    assert not b_done.wait(0.2)
+                    raise RuntimeError("409")
+            except RuntimeError:
+                pass
+
+        def thread_b():
+            a_open.wait()
+            with immediate_transaction(db):
+                create_signup(db, SignupCreate(volunteer_id=1, shift_id=1))
+            b_done.set()
+
+        threads = [threading.Thread(target=thread_a), threading.Thread(target=thread_b)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+
+        assert b_done.is_set()
+        assert db.execute("SELECT COUNT(*) FROM signups").fetchone()[0] == 1
+    finally:
+        pool.close()
+
+
+def test_immediate_transaction_nested_in_same_thread_joins(tmp_path):
+    conn = get_db_connection(str(tmp_path / "nested.db"))
+    try:
+        create_tables(conn)
+        with immediate_transaction(conn):
+            with immediate_transaction(conn):
+                conn.execute(
+                    "INSERT INTO shifts (date, shift_type) VALUES ('2026-03-01', 'kakad')"
+                )
+            assert conn.in_transaction
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM shifts").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_pool_readers_see_committed_writes(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), readers=2)
+    try:
+        create_tables(pool.writer)
+        pool.writer.execute(
+            "INSERT INTO shifts (date, shift_type) VALUES ('2026-03-01', 'kakad')"
+        )
+        with pool.reader() as conn:
+            assert conn is not pool.writer
+            assert conn.execute("SELECT COUNT(*) FROM shifts").fetchone()[0] == 1
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM shifts")
+            assert pool.stats()["busy_readers"] == 1
+        assert pool.stats() == {
+            "max_readers": 2,
+            "open_readers": 1,
+            "idle_readers": 1,
+            "busy_readers": 0,
+        }
+    finally:
+        pool.close()
+
+
+def test_memory_pool_reads_from_writer():
+    pool = ConnectionPool(":memory:")
+    try:
+        with pool.reader() as conn:
+            assert conn is pool.writer
+    finally:
+        pool.close()
+
+
+def test_parse_timestamp():
+    assert parse_timestamp(None) is None
+    assert parse_timestamp("2026-03-01 09:30:00") == datetime(2026, 3, 1, 9, 30)
+    assert parse_timestamp("2026-03-01") == datetime(2026, 3, 1)
@@ -5,12 +5,17 @@ from datetime import datetime
 from app.models.notification import (
     NotificationCreate,
     Notification,
+    create_delivered_notification,
     create_notification,
+    create_notifications_bulk,
     get_notification,
     list_notifications_by_volunteer,
     mark_sent,
+    mark_sent_returning,
     mark_acknowledged,
+    mark_acknowledged_returning,
     mark_error,
+    mark_error_returning,
     _row_to_notification,
 )
 from app.models.volunteer import create_volunteer, VolunteerCreate
@@ -175,7 +180,7 @@ class TestNotificationCRUD:
         notification = create_notification(db, notif_data)
         assert notification.sent_at is None
 
-        updated = mark_sent(db, notification.id)
+        updated = mark_sent_returning(db, notification.id)
         assert updated is not None
         assert updated.sent_at is not None
 
@@ -192,7 +197,7 @@ class TestNotificationCRUD:
         notification = create_notification(db, notif_data)
         assert notification.ack_at is None
 
-        updated = mark_acknowledged(db, notification.id)
+        updated = mark_acknowledged_returning(db, notification.id)
         assert updated is not None
         assert updated.ack_at is not None
 
@@ -210,21 +215,78 @@ class TestNotificationCRUD:
         assert notification.error is None
 
         error_msg = "Connection timeout to WA Bridge"
-        updated = mark_error(db, notification.id, error_msg)
+        updated = mark_error_returning(db, notification.id, error_msg)
         assert updated is not None
         assert updated.error == error_msg
 
+    def test_mark_sent_reports_found(self, db):
+        """Test the plain mark_* helpers return True and persist the change."""
+        volunteer = create_volunteer(
+            db, VolunteerCreate(phone="+1234567890", name="Test Volunteer")
+        )
+        notification = create_notification(
+            db,
+            NotificationCreate(
+                volunteer_id=volunteer.id, type="reminder", message="Test message"
+            ),
+        )
+
+        assert mark_sent(db, notification.id) is True
+        assert mark_error(db, notification.id, "late") is True
+        stored = get_notification(db, notification.id)
+        assert stored.sent_at is not None
+        assert stored.error == "late"
+
     def test_mark_sent_nonexistent(self, db):
         """Test marking a nonexistent notification returns None."""
-        result = mark_sent(db, 999)
-        assert result is None
+        assert mark_sent(db, 999) is False
+        assert mark_sent_returning(db, 999) is None
 
     def test_mark_acknowledged_nonexistent(self, db):
         """Test acknowledging a nonexistent notification returns None."""
-        result = mark_acknowledged(db, 999)
-        assert result is None
+        assert mark_acknowledged(db, 999) is False
+        assert mark_acknowledged_returning(db, 999) is None
 
     def test_mark_error_nonexistent(self, db):
         """Test marking error on nonexistent notification returns None."""
-        result = mark_error(db, 999, "Some error")
-        assert result is None
+        assert mark_error(db, 999, "Some error") is False
+        assert mark_error_returning(db, 999, "Some error") is None
+
+    def test_create_delivered_notification(self, db):
+        """Test the outcome of a send is stored with the insert."""
+        volunteer = create_volunteer(
+            db, VolunteerCreate(phone="+1234567890", name="Test Volunteer")
+        )
+        data = NotificationCreate(
+            volunteer_id=volunteer.id, type="alert", message="Test message"
+        )
+
+        sent = create_delivered_notification(db, data, None)
+        assert sent.sent_at is not None
+        assert sent.error is None
+
+        failed = create_delivered_notification(db, data, "bridge down")
+        assert failed.sent_at is None
+        assert failed.error == "bridge down"
+
+    def test_create_notifications_bulk(self, db):
+        """Test bulk insert returns the new IDs in input order."""
+        volunteer = create_volunteer(
+            db, VolunteerCreate(phone="+1234567890", name="Test Volunteer")
+        )
+        create_notification(
+            db, NotificationCreate(volunteer_id=volunteer.id, type="alert", message="first")
+        )
+
+        items = [
+            NotificationCreate(volunteer_id=volunteer.id, type="reminder", message=f"m{i}")
+            for i in range(3)
+        ]
+        ids = create_notifications_bulk(db, items)
+
+        assert len(ids) == 3
+        assert [get_notification(db, i).message for i in ids] == ["m0", "m1", "m2"]
+
+    def test_create_notifications_bulk_empty(self, db):
+        """Test bulk insert with no items is a no-op."""
+        assert create_notifications_bulk(db, []) == []
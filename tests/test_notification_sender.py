@@ -3,9 +3,14 @@ import os
 from unittest.mock import patch, MagicMock
 import httpx
 
-from app.notifications.sender import send_message
+from app.notifications.sender import (
+    _http_client,
+    close_http_client,
+    deliver_notifications,
+    send_message,
+)
 from app.models.volunteer import create_volunteer, VolunteerCreate
-from app.models.notification import get_notification
+from app.models.notification import NotificationCreate, create_notification, get_notification
 
 
 class TestSendMessage:
@@ -23,7 +28,7 @@ class TestSendMessage:
         assert result["notification_id"] is None
         assert "not found" in result["error"]
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_success(self, mock_post, db):
         """Test successful message sending."""
         # Create volunteer
@@ -56,7 +61,7 @@ class TestSendMessage:
         assert call_args[1]["json"]["phone"] == "+1234567890"
         assert call_args[1]["json"]["message"] == "Test message"
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_normalizes_plain_10_digit_phone(self, mock_post, db):
         vol_data = VolunteerCreate(phone="5104566645", name="Plain Phone Volunteer")
         volunteer = create_volunteer(db, vol_data)
@@ -73,7 +78,7 @@ class TestSendMessage:
         call_args = mock_post.call_args
         assert call_args[1]["json"]["phone"] == "+15104566645"
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_failure(self, mock_post, db):
         """Test message sending failure."""
         # Create volunteer
@@ -101,7 +106,7 @@ class TestSendMessage:
         assert notification.sent_at is None
         assert notification.error is not None
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_timeout(self, mock_post, db):
         """Test message sending timeout."""
         # Create volunteer
@@ -123,7 +128,7 @@ class TestSendMessage:
         assert "timed out" in result["error"]
 
     @patch.dict(os.environ, {"WA_BRIDGE_URL": "http://custom-bridge:3000"})
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_custom_bridge_url(self, mock_post, db):
         """Test that custom WA_BRIDGE_URL is used."""
         # Create volunteer
@@ -145,7 +150,7 @@ class TestSendMessage:
         url = call_args[0][0]
         assert url == "http://custom-bridge:3000/send"
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_default_bridge_url(self, mock_post, db):
         """Test that default WA_BRIDGE_URL is used when env var not set."""
         # Create volunteer
@@ -172,7 +177,7 @@ class TestSendMessage:
         assert url == "http://localhost:3000/send"
 
     @patch.dict(os.environ, {"WA_BRIDGE_URL": "wa-bridge.railway.internal"})
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_adds_scheme_and_internal_port(self, mock_post, db):
         """Host-only internal URLs should normalize to http://host:8080."""
         vol_data = VolunteerCreate(phone="+1234567890", name="Test Volunteer")
@@ -191,7 +196,7 @@ class TestSendMessage:
         assert url == "http://wa-bridge.railway.internal:8080/send"
 
     @patch.dict(os.environ, {"WA_BRIDGE_URL": "wa-bridge.railway.internal (line 8080)"})
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_strips_line_suffix_label(self, mock_post, db):
         """Railway host picker suffix should not break send URL."""
         vol_data = VolunteerCreate(phone="+1234567890", name="Test Volunteer")
@@ -210,7 +215,7 @@ class TestSendMessage:
         assert url == "http://wa-bridge.railway.internal:8080/send"
 
     @patch.dict(os.environ, {"WA_BRIDGE_URL": "http://wa-bridge.railway.internal:"})
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_handles_dangling_colon(self, mock_post, db):
         """Internal URLs with trailing colon should still resolve to port 8080."""
         vol_data = VolunteerCreate(phone="+1234567890", name="Test Volunteer")
@@ -228,7 +233,7 @@ class TestSendMessage:
         url = call_args[0][0]
         assert url == "http://wa-bridge.railway.internal:8080/send"
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_notification_persisted(self, mock_post, db):
         """Test that notification record is persisted even on failure."""
         # Create volunteer
@@ -255,7 +260,7 @@ class TestSendMessage:
         assert notification.type == "escalation"
         assert notification.message == "Test message"
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_different_types(self, mock_post, db):
         """Test sending messages with different notification types."""
         # Create volunteer
@@ -278,7 +283,7 @@ class TestSendMessage:
             notification = get_notification(db, result["notification_id"])
             assert notification.type == notif_type
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_http_error(self, mock_post, db):
         """Test handling of HTTP errors."""
         # Create volunteer
@@ -298,7 +303,7 @@ class TestSendMessage:
         assert result["success"] is False
         assert "500 Server Error" in result["error"]
 
-    @patch("app.notifications.sender.httpx.post")
+    @patch("app.notifications.sender.httpx.Client.post")
     def test_send_message_with_default_type(self, mock_post, db):
         """Test sending message with default notification type."""
         # Create volunteer
@@ -318,3 +323,38 @@ class TestSendMessage:
         assert result["success"] is True
         notification = get_notification(db, result["notification_id"])
         assert notification.type == "alert"
+
+
+def test_http_client_is_shared_until_closed():
+    client = _http_client()
+    assert _http_client() is client
+    close_http_client()
+    assert client.is_closed
+    assert _http_client() is not client
+    close_http_client()
+
+
+@patch("app.notifications.sender.httpx.Client.post")
+def test_deliver_notifications_records_each_outcome(mock_post, db):
+    volunteer = create_volunteer(db, VolunteerCreate(phone="+1234567890", name="Test"))
+    ids = [
+        create_notification(
+            db, NotificationCreate(volunteer_id=volunteer.id, type="reminder", message=m)
+        ).id
+        for m in ("ok", "fail")
+    ]
+
+    def post(endpoint, json):
+        if json["message"] == "fail":
+            raise httpx.RequestError("Connection failed")
+        return MagicMock(status_code=200)
+
+    mock_post.side_effect = post
+    results = deliver_notifications(
+        db, [(ids[0], volunteer.phone, "ok"), (ids[1], volunteer.phone, "fail")]
+    )
+
+    assert [r["success"] for r in results] == [True, False]
+    assert get_notification(db, ids[0]).sent_at is not None
+    assert get_notification(db, ids[1]).error == "Connection failed"
+    assert deliver_notifications(db, []) == []
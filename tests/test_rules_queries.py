@@ -11,6 +11,7 @@ from app.rules.queries import (
     get_robe_count,
     get_total_count,
     get_thursday_count,
+    get_month_counts,
     get_shift_signup_count,
     get_shift_capacity,
 )
@@ -128,12 +129,43 @@ def test_thursday_count(setup):
     assert get_thursday_count(setup["db"], setup["vol_id"], 2026, 2) == 1
 
 
+def test_month_counts_match_single_counts(setup):
+    assert get_month_counts(setup["db"], setup["vol_id"], 2026, 2) == {
+        "total": 5,
+        "kakad": 2,
+        "robe": 3,
+        "thursday": 1,
+    }
+    assert get_month_counts(setup["db"], setup["vol_id"], 2026, 3) == {
+        "total": 0,
+        "kakad": 0,
+        "robe": 0,
+        "thursday": 0,
+    }
+
+
 def test_dropped_not_counted(setup):
     # k3 signup was dropped, so kakad should still be 2
     assert get_kakad_count(setup["db"], setup["vol_id"], 2026, 2) == 2
     assert get_total_count(setup["db"], setup["vol_id"], 2026, 2) == 5
 
 
+def test_month_range_excludes_neighbouring_months(setup):
+    db = setup["db"]
+    jan = _insert_shift(db, "2026-01-31", "kakad")
+    mar = _insert_shift(db, "2026-03-01", "kakad")
+    _insert_signup(db, setup["vol_id"], jan)
+    _insert_signup(db, setup["vol_id"], mar)
+    assert get_kakad_count(db, setup["vol_id"], 2026, 2) == 2
+
+
+def test_december_range_rolls_over(db):
+    vol_id = _insert_volunteer(db, "+3000", "Dec Vol")
+    _insert_signup(db, vol_id, _insert_shift(db, "2026-12-31", "robe"))
+    _insert_signup(db, vol_id, _insert_shift(db, "2027-01-01", "robe"))
+    assert get_total_count(db, vol_id, 2026, 12) == 1
+
+
 def test_shift_signup_count(setup):
     # r1 has 2 signups (vol_id and vol2_id)
     assert get_shift_signup_count(setup["db"], setup["shifts"]["r1"]) == 2
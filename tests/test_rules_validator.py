@@ -224,6 +224,32 @@ class TestCapacityAndEdgeCases:
         reasons = [v.reason.lower() for v in violations]
         assert any("full" in r for r in reasons)
 
+    def test_fail_fast_stops_at_capacity(self, db):
+        """A full shift short-circuits before the Phase 1 limit checks."""
+        vol = _make_volunteer(db)
+        filler = _make_volunteer(db, phone="3333333333", name="Filler")
+        for day in (3, 10):
+            _make_signup(db, vol, _make_shift(db, date(2026, 3, day), "kakad"))
+        s = _make_shift(db, date(2026, 3, 17), "kakad", capacity=1)
+        _make_signup(db, filler, s)
+
+        full = validate_signup(db, vol, s, today=PHASE1_TODAY)
+        assert len(full) == 2
+        fast = validate_signup(db, vol, s, today=PHASE1_TODAY, fail_fast=True)
+        assert fast == full[:1]
+
+    def test_fail_fast_stops_at_first_phase1_violation(self, db):
+        """Several Phase 1 limits broken -> fail_fast returns only the first."""
+        vol = _make_volunteer(db)
+        for day in (5, 12):  # Thursdays
+            _make_signup(db, vol, _make_shift(db, date(2026, 3, day), "kakad"))
+        s = _make_shift(db, date(2026, 3, 19), "kakad")
+
+        full = validate_signup(db, vol, s, today=PHASE1_TODAY)
+        assert len(full) == 2
+        fast = validate_signup(db, vol, s, today=PHASE1_TODAY, fail_fast=True)
+        assert fast == full[:1]
+
     def test_mid_month_only_checks_capacity(self, db):
         """Mid-month -> only capacity checked, phase rules ignored."""
         vol = _make_volunteer(db)
@@ -257,3 +283,19 @@ class TestCapacityAndEdgeCases:
         vol2 = _make_volunteer(db, phone="4444444444", name="New Vol")
         violations = validate_signup(db, vol2, s, today=PHASE1_TODAY)
         assert violations == []
+
+
+# ====================================================================
+# Lookup failures
+# ====================================================================
+
+class TestLookups:
+    def test_unknown_volunteer_not_approved(self, db):
+        s = _make_shift(db, date(2026, 3, 2), "kakad")
+        violations = validate_signup(db, 9999, s, today=PHASE1_TODAY)
+        assert [v.reason for v in violations] == ["Volunteer is not approved to sign up"]
+
+    def test_unknown_shift_raises(self, db):
+        vol = _make_volunteer(db)
+        with pytest.raises(ValueError, match="Shift 9999 not found"):
+            validate_signup(db, vol, 9999, today=PHASE1_TODAY)
@@ -2,7 +2,7 @@ from datetime import date
 from unittest.mock import patch
 
 from app.db import create_tables, get_db_connection
-from app.notifications.reminders import _send_reminders_for_date, _notification_exists
+from app.notifications.reminders import _send_reminders_for_date, _sent_reminders
 
 
 def test_send_reminders_for_date_calls_sender():
@@ -23,14 +23,22 @@ def test_send_reminders_for_date_calls_sender():
     )
     db.commit()
 
-    with patch("app.notifications.reminders.send_message") as mock_send:
+    with patch("app.notifications.reminders.deliver_notifications") as mock_send:
         _send_reminders_for_date(db, date(2026, 2, 19), 1)
         assert mock_send.call_count == 1
-        _, _, message = mock_send.call_args[0]
+        _, deliveries = mock_send.call_args[0]
+        [(notification_id, phone, message)] = deliveries
+        assert phone == "+15550001111"
         assert "tomorrow" in message
 
+    row = db.execute(
+        "SELECT volunteer_id, type, message FROM notifications WHERE id = ?",
+        (notification_id,),
+    ).fetchone()
+    assert (row["volunteer_id"], row["type"], row["message"]) == (vol_id, "reminder", message)
 
-def test_notification_exists_checks_message():
+
+def test_sent_reminders_checks_message():
     db = get_db_connection(":memory:")
     create_tables(db)
     vol_id = db.execute(
@@ -43,5 +51,27 @@ def test_notification_exists_checks_message():
     )
     db.commit()
 
-    assert _notification_exists(db, vol_id, "hello") is True
-    assert _notification_exists(db, vol_id, "different") is False
+    assert _sent_reminders(db, ["hello", "different"]) == {(vol_id, "hello")}
+    assert _sent_reminders(db, ["different"]) == set()
+
+
+def test_send_reminders_for_date_skips_already_sent():
+    db = get_db_connection(":memory:")
+    create_tables(db)
+    vol_id = db.execute(
+        "INSERT INTO volunteers (phone, name, is_coordinator, status) VALUES (?, ?, ?, ?)",
+        ("+15550003333", "Cara", 0, "approved"),
+    ).lastrowid
+    shift_id = db.execute(
+        "INSERT INTO shifts (date, shift_type, capacity) VALUES (?, ?, ?)",
+        ("2026-02-19", "robe", 3),
+    ).lastrowid
+    db.execute(
+        "INSERT INTO signups (volunteer_id, shift_id) VALUES (?, ?)",
+        (vol_id, shift_id),
+    )
+
+    with patch("app.notifications.sender.httpx.Client.post") as mock_post:
+        _send_reminders_for_date(db, date(2026, 2, 19), 7)
+        _send_reminders_for_date(db, date(2026, 2, 19), 7)
+        assert mock_post.call_count == 1
@@ -15,6 +15,7 @@ from app.models.signup import (
     get_signups_by_volunteer,
     get_signups_by_shift,
     get_active_signups_by_shift,
+    get_active_signups_with_shifts,
 )
 
 
@@ -78,6 +79,21 @@ def test_get_signups_by_volunteer_month_filter(db: sqlite3.Connection):
     assert jul_signups[0].shift_id == shift_jul.id
 
 
+def test_get_signups_by_volunteer_active_only(db: sqlite3.Connection):
+    """active_only drops dropped signups in SQL."""
+    vol = _make_volunteer(db)
+    kept = create_signup(db, SignupCreate(volunteer_id=vol.id, shift_id=_make_shift(db).id))
+    dropped = create_signup(
+        db,
+        SignupCreate(volunteer_id=vol.id, shift_id=_make_shift(db, d=date(2025, 6, 16)).id),
+    )
+    drop_signup(db, dropped.id)
+
+    assert len(get_signups_by_volunteer(db, vol.id, "2025-06")) == 2
+    active = get_signups_by_volunteer(db, vol.id, "2025-06", active_only=True)
+    assert [s.id for s in active] == [kept.id]
+
+
 def test_get_signups_by_shift(db: sqlite3.Connection):
     """get_signups_by_shift returns all signups including dropped."""
     vol1 = _make_volunteer(db, phone="+1111")
@@ -107,6 +123,24 @@ def test_active_signups_excludes_dropped(db: sqlite3.Connection):
     assert active[0].volunteer_id == vol2.id
 
 
+def test_active_signups_with_shifts(db: sqlite3.Connection):
+    """get_active_signups_with_shifts joins shift fields and skips dropped rows."""
+    vol = _make_volunteer(db)
+    kept = _make_shift(db, d=date(2025, 6, 20), shift_type="robe", capacity=3)
+    dropped = _make_shift(db, d=date(2025, 6, 10))
+    other_month = _make_shift(db, d=date(2025, 7, 1))
+
+    signup = create_signup(db, SignupCreate(volunteer_id=vol.id, shift_id=kept.id))
+    s2 = create_signup(db, SignupCreate(volunteer_id=vol.id, shift_id=dropped.id))
+    create_signup(db, SignupCreate(volunteer_id=vol.id, shift_id=other_month.id))
+    drop_signup(db, s2.id)
+
+    rows = get_active_signups_with_shifts(db, vol.id, "2025-06")
+    assert [tuple(r) for r in rows] == [
+        (signup.id, rows[0]["signed_up_at"], kept.id, "2025-06-20", "robe", 3)
+    ]
+
+
 def test_duplicate_signup_raises_integrity_error(db: sqlite3.Connection):
     """Inserting duplicate (volunteer_id, shift_id) raises IntegrityError."""
     vol = _make_volunteer(db, phone="+5555")
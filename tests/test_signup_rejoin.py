@@ -24,3 +24,28 @@ def test_create_signup_reactivates_dropped_row():
     rejoined = create_signup(db, SignupCreate(volunteer_id=vol_id, shift_id=shift_id))
     assert rejoined.id == created.id
     assert rejoined.dropped_at is None
+
+
+def test_create_signup_keeps_active_row_unchanged():
+    db = get_db_connection(":memory:")
+    create_tables(db)
+
+    vol_id = db.execute(
+        "INSERT INTO volunteers (phone, name) VALUES (?, ?)",
+        ("+15551230001", "Test Vol"),
+    ).lastrowid
+    shift_id = db.execute(
+        "INSERT INTO shifts (date, shift_type, capacity) VALUES (?, ?, ?)",
+        ("2026-02-22", "robe", 1),
+    ).lastrowid
+
+    created = create_signup(db, SignupCreate(volunteer_id=vol_id, shift_id=shift_id))
+    db.execute(
+        "UPDATE signups SET signed_up_at = '2026-01-01 00:00:00' WHERE id = ?",
+        (created.id,),
+    )
+
+    again = create_signup(db, SignupCreate(volunteer_id=vol_id, shift_id=shift_id))
+    assert again.id == created.id
+    assert again.signed_up_at.isoformat() == "2026-01-01T00:00:00"
+    assert db.execute("SELECT COUNT(*) FROM signups").fetchone()[0] == 1
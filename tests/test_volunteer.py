@@ -7,8 +7,10 @@ from app.models.volunteer import (
     VolunteerCreate,
     create_volunteer,
     get_volunteer_by_phone,
+    list_volunteer_summaries,
     list_volunteers,
     normalize_phone,
+    normalize_stored_phones,
 )
 
 
@@ -52,11 +54,52 @@ def test_get_volunteer_by_phone_matches_legacy_plain(db):
     assert found.phone == "5104566645"
 
 
+def test_get_volunteer_by_phone_prefers_normalized_row(db):
+    db.executemany(
+        "INSERT INTO volunteers (phone, name, is_coordinator, status) VALUES (?, ?, ?, ?)",
+        [
+            ("5104566645", "Legacy Bob", False, "approved"),
+            ("+15104566645", "Bob", False, "approved"),
+        ],
+    )
+
+    found = get_volunteer_by_phone(db, "5104566645")
+    assert found is not None
+    assert found.name == "Bob"
+
+
+def test_normalize_stored_phones_skips_taken_numbers(db):
+    db.executemany(
+        "INSERT INTO volunteers (phone, name, is_coordinator, status) VALUES (?, ?, ?, ?)",
+        [
+            ("5104566645", "Legacy Bob", False, "approved"),
+            ("(510) 456-7777", "Legacy Cy", False, "approved"),
+            ("+15104567777", "Cy", False, "approved"),
+        ],
+    )
+
+    assert normalize_stored_phones(db) == 1
+    phones = [r["phone"] for r in db.execute("SELECT phone FROM volunteers ORDER BY id")]
+    assert phones == ["+15104566645", "(510) 456-7777", "+15104567777"]
+
+
 def test_normalize_phone_with_default_area_code(monkeypatch):
     monkeypatch.setenv("DEFAULT_AREA_CODE", "510")
     assert normalize_phone("4566645") == "+15104566645"
 
 
+def test_get_volunteer_by_phone_seven_digit_local(db, monkeypatch):
+    monkeypatch.setenv("DEFAULT_AREA_CODE", "510")
+    db.execute(
+        "INSERT INTO volunteers (phone, name, is_coordinator, status) VALUES (?, ?, ?, ?)",
+        ("5104566645", "Legacy Bob", False, "approved"),
+    )
+
+    found = get_volunteer_by_phone(db, "456-6645")
+    assert found is not None
+    assert found.name == "Legacy Bob"
+
+
 def test_get_volunteer_by_phone_not_found(db):
     result = get_volunteer_by_phone(db, "+0000000000")
     assert result is None
@@ -73,6 +116,21 @@ def test_list_volunteers(db):
     assert names == {"A", "B", "C"}
 
 
+def test_list_volunteer_summaries(db):
+    create_volunteer(db, VolunteerCreate(phone="+1111111111", name="Alice", is_coordinator=True))
+    create_volunteer(db, VolunteerCreate(phone="+2222222222", name="Bob", status="pending"))
+
+    assert list_volunteer_summaries(db, "approved") == [
+        {
+            "id": 1,
+            "phone": "+1111111111",
+            "name": "Alice",
+            "is_coordinator": True,
+            "status": "approved",
+        }
+    ]
+
+
 def test_duplicate_phone_raises(db):
     create_volunteer(db, VolunteerCreate(phone="+9999", name="First"))
     with pytest.raises(sqlite3.IntegrityError):
@@ -239,3 +239,14 @@ def test_reject_then_approve(db):
     approved = approve_volunteer(db, "+1111", approver.id)
     assert approved.status == "approved"
     assert approved.approved_by == approver.id
+
+
+def test_approve_only_pending_skips_rejected(db):
+    """only_status="pending" leaves non-pending volunteers untouched."""
+    create_volunteer(db, VolunteerCreate(phone="+1111", name="Alice", status="rejected"))
+    approver = create_volunteer(
+        db, VolunteerCreate(phone="+9999", name="Coordinator", is_coordinator=True)
+    )
+
+    assert approve_volunteer(db, "+1111", approver.id, only_status="pending") is None
+    assert get_volunteer_by_phone(db, "+1111").status == "rejected"